@@ -7,7 +7,14 @@ from app.adapters.base import BaseAdapter, ExecutionResult, RuntimeMeta
 from app.adapters.gull import GullAdapter
 from app.adapters.ship import ShipAdapter
 
+# runtime_type -> adapter class, resolved once per call instead of an if-chain.
+ADAPTER_CLASSES: dict[str, type[BaseAdapter]] = {
+    "ship": ShipAdapter,
+    "gull": GullAdapter,
+}
+
 __all__ = [
+    "ADAPTER_CLASSES",
     "BaseAdapter",
     "ExecutionResult",
     "RuntimeMeta",
@@ -10,6 +10,7 @@ See: plans/phase-1/capability-adapter-design.md
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -126,10 +127,18 @@ class BaseAdapter(ABC):
         raise NotImplementedError("filesystem capability not supported")
 
     # -- Upload/Download capability --
-    async def upload_file(self, path: str, content: bytes) -> None:
-        """Upload binary file."""
+    async def upload_file(self, path: str, content: bytes | AsyncIterable[bytes]) -> None:
+        """Upload binary file (bytes, or an async iterable of chunks to stream)."""
         raise NotImplementedError("upload capability not supported")
 
     async def download_file(self, path: str) -> bytes:
         """Download file as bytes."""
         raise NotImplementedError("download capability not supported")
+
+    async def download_file_stream(self, path: str) -> AsyncIterator[bytes]:
+        """Download file in chunks.
+
+        Defaults to a single chunk from download_file for adapters that
+        cannot stream.
+        """
+        yield await self.download_file(path)
@@ -11,6 +11,8 @@ NOTE: Ship endpoint mappings:
 
 from __future__ import annotations
 
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
 import httpx
@@ -22,6 +24,31 @@ from app.services.http import http_client_manager
 
 logger = structlog.get_logger()
 
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _multipart_upload_body(
+    path: str,
+    chunks: AsyncIterable[bytes],
+    boundary: str,
+) -> AsyncIterator[bytes]:
+    """Encode a Ship /fs/upload form (file_path + file) around streamed chunks.
+
+    httpx only streams multipart file parts from sync file objects, so the
+    form is framed by hand around the async chunks.
+    """
+    yield (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file_path"\r\n\r\n'
+        f"{path}\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="file"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    async for chunk in chunks:
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
 
 def _get_shared_client() -> httpx.AsyncClient | None:
     """Get shared HTTP client if available.
@@ -256,28 +283,38 @@ class ShipAdapter(BaseAdapter):
 
     # -- Upload/Download (part of filesystem capability) --
 
-    async def upload_file(self, path: str, content: bytes) -> None:
-        """Upload binary file using shared connection pool."""
-        try:
-            files = {"file": ("file", content, "application/octet-stream")}
-            data = {"file_path": path}
+    async def upload_file(self, path: str, content: bytes | AsyncIterable[bytes]) -> None:
+        """Upload binary file using shared connection pool.
+
+        An async iterable is streamed to Ship chunk by chunk rather than buffered.
+        """
+        if isinstance(content, bytes):
+            request_kwargs: dict[str, Any] = {
+                "files": {"file": ("file", content, "application/octet-stream")},
+                "data": {"file_path": path},
+            }
+        else:
+            boundary = secrets.token_hex(16)
+            request_kwargs = {
+                "content": _multipart_upload_body(path, content, boundary),
+                "headers": {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            }
 
+        try:
             client = _get_shared_client()
             if client is not None:
                 response = await client.post(
                     f"{self._base_url}/fs/upload",
-                    files=files,
-                    data=data,
                     timeout=self._timeout,
+                    **request_kwargs,
                 )
             else:
                 # Fallback for tests
                 async with httpx.AsyncClient() as temp_client:
                     response = await temp_client.post(
                         f"{self._base_url}/fs/upload",
-                        files=files,
-                        data=data,
                         timeout=self._timeout,
+                        **request_kwargs,
                     )
 
             if response.status_code >= 400:
@@ -287,27 +324,33 @@ class ShipAdapter(BaseAdapter):
 
     async def download_file(self, path: str) -> bytes:
         """Download file as bytes using shared connection pool."""
-        try:
-            client = _get_shared_client()
-            if client is not None:
-                response = await client.get(
-                    f"{self._base_url}/fs/download",
-                    params={"file_path": path},
-                    timeout=self._timeout,
-                )
-            else:
-                # Fallback for tests
-                async with httpx.AsyncClient() as temp_client:
-                    response = await temp_client.get(
-                        f"{self._base_url}/fs/download",
-                        params={"file_path": path},
-                        timeout=self._timeout,
-                    )
+        return b"".join([chunk async for chunk in self.download_file_stream(path)])
 
-            if response.status_code == 404:
-                raise CargoFileNotFoundError(f"File not found: {path}")
-            if response.status_code >= 400:
-                raise ShipError(f"Download failed: {response.status_code}")
-            return response.content
+    async def download_file_stream(
+        self,
+        path: str,
+        *,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download file in chunks without buffering the whole body."""
+        client = _get_shared_client()
+        # Fallback for tests
+        temp_client = httpx.AsyncClient() if client is None else None
+        try:
+            async with (client or temp_client).stream(
+                "GET",
+                f"{self._base_url}/fs/download",
+                params={"file_path": path},
+                timeout=self._timeout,
+            ) as response:
+                if response.status_code == 404:
+                    raise CargoFileNotFoundError(f"File not found: {path}")
+                if response.status_code >= 400:
+                    raise ShipError(f"Download failed: {response.status_code}")
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
         except httpx.RequestError as e:
             raise ShipError(f"Download file failed: {e}")
+        finally:
+            if temp_client is not None:
+                await temp_client.aclose()
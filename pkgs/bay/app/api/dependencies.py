@@ -11,7 +11,6 @@ Provides dependency injection for:
 
 from __future__ import annotations
 
-import hmac
 from functools import lru_cache
 from typing import Annotated
 
@@ -28,6 +27,7 @@ from app.errors import CapabilityNotSupportedError, UnauthorizedError
 from app.managers.cargo import CargoManager
 from app.managers.sandbox import SandboxManager
 from app.models.sandbox import Sandbox
+from app.services.api_key import ApiKeyService
 from app.services.idempotency import IdempotencyService
 from app.services.skills import SkillLifecycleService
 
@@ -109,16 +109,24 @@ def authenticate(request: Request) -> str:
         token = auth_header[7:]
 
         # 1a. DB key hash lookup (loaded at startup into app.state)
-        api_key_hashes: dict[str, str] = getattr(request.app.state, "api_key_hashes", {})
+        api_key_hashes: dict[bytes, str] = getattr(request.app.state, "api_key_hashes", {})
         if api_key_hashes:
-            from app.services.api_key import ApiKeyService
-
-            token_hash = ApiKeyService.hash_key(token)
-            owner = None
-            for stored_hash, stored_owner in api_key_hashes.items():
-                if hmac.compare_digest(token_hash, stored_hash):
-                    owner = stored_owner
-                    break
+            # Tokens whose prefix matches no active key cannot be valid;
+            # reject them without hashing. The prefix is not secret (it is
+            # stored in clear for identification).
+            api_key_prefixes: frozenset[str] | None = getattr(
+                request.app.state, "api_key_prefixes", None
+            )
+            if (
+                api_key_prefixes is not None
+                and ApiKeyService.key_prefix(token) not in api_key_prefixes
+            ):
+                raise UnauthorizedError("Invalid API key")
+
+            # One dict probe instead of a compare_digest per stored key: the
+            # lookup key is the token's SHA-256, so probe timing says nothing
+            # usable about the plaintext.
+            owner = api_key_hashes.get(ApiKeyService.digest_key(token))
             if owner:
                 logger.debug("auth.success", source="db", owner=owner)
                 return owner
@@ -191,17 +199,15 @@ def require_capability(capability: str):
 
         # Phase 2: multi-container profiles may not set legacy `profile.capabilities`.
         # In that case we derive capability set from container specs.
-        available_caps = (
-            list(profile.capabilities)
-            if getattr(profile, "capabilities", None)
-            else sorted(profile.get_all_capabilities())
-        )
+        available_caps = profile.capabilities or profile.get_all_capabilities()
 
         if capability not in available_caps:
             raise CapabilityNotSupportedError(
                 message=f"Profile '{sandbox.profile_id}' does not support capability: {capability}",
                 capability=capability,
-                available=available_caps,
+                available=(
+                    list(available_caps) if profile.capabilities else sorted(available_caps)
+                ),
             )
 
         return sandbox
@@ -40,6 +40,7 @@ class GCTaskResult(BaseModel):
     cleaned_count: int
     skipped_count: int
     errors: list[str]
+    duration_ms: int = 0
 
 
 class GCRunResponse(BaseModel):
@@ -124,6 +125,7 @@ async def run_gc(
                 cleaned_count=r.cleaned_count,
                 skipped_count=r.skipped_count,
                 errors=r.errors,
+                duration_ms=r.duration_ms,
             )
             for r in results
         ],
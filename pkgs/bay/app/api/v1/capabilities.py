@@ -7,11 +7,12 @@ See: plans/phase-1/capability-adapter-design.md
 from __future__ import annotations
 
 import time
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 from app.api.dependencies import (
@@ -33,6 +34,9 @@ from app.validators.path import (
 
 router = APIRouter()
 
+# Read size for streaming multipart uploads on to the runtime.
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 # -- Path validation dependencies --
 
@@ -803,12 +807,22 @@ async def upload_file(
 
     capability_router = CapabilityRouter(sandbox_mgr)
 
-    content = await file.read()
+    # Stream the spooled upload to the runtime instead of reading it into memory.
+    # UploadFile.read runs the blocking file read in a worker thread.
+    sent = 0
+
+    async def chunks() -> AsyncIterator[bytes]:
+        nonlocal sent
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            sent += len(chunk)
+            yield chunk
+
+    await file.seek(0)
     await capability_router.upload_file(
-        sandbox=sandbox, path=validated_upload_path, content=content
+        sandbox=sandbox, path=validated_upload_path, content=chunks(), size=file.size
     )
 
-    return FileUploadResponse(status="ok", path=validated_upload_path, size=len(content))
+    return FileUploadResponse(status="ok", path=validated_upload_path, size=sent)
 
 
 @router.get("/{sandbox_id}/filesystem/download")
@@ -823,11 +837,20 @@ async def download_file(
     """
     capability_router = CapabilityRouter(sandbox_mgr)
 
-    content = await capability_router.download_file(sandbox=sandbox, path=path)
+    chunks = capability_router.download_file_stream(sandbox=sandbox, path=path)
+    # Pull the first chunk before responding so routing/runtime errors (e.g.
+    # file not found) still map to error responses instead of a broken 200.
+    first_chunk = await anext(chunks, b"")
     filename = Path(path).name
 
-    return Response(
-        content=content,
+    return StreamingResponse(
+        _prepend_chunk(first_chunk, chunks),
         media_type="application/octet-stream",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
+
+async def _prepend_chunk(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first
+    async for chunk in rest:
+        yield chunk
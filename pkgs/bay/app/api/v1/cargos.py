@@ -59,8 +59,12 @@ class CargoListResponse(BaseModel):
 
 
 def _cargo_to_response(cargo) -> CargoResponse:
-    """Convert Cargo model to API response."""
-    return CargoResponse(
+    """Convert a Cargo model or CargoRow to API response.
+
+    Values come straight from typed DB columns, so field validation is
+    skipped; FastAPI still validates the endpoint's response_model on output.
+    """
+    return CargoResponse.model_construct(
         id=cargo.id,
         managed=cargo.managed,
         managed_by_sandbox_id=cargo.managed_by_sandbox_id,
@@ -54,7 +54,12 @@ class AnnotateExecutionRequest(BaseModel):
 
 
 def _to_entry_response(entry) -> ExecutionHistoryEntryResponse:
-    return ExecutionHistoryEntryResponse(
+    """Convert an ExecutionHistory row to API response.
+
+    Values come straight from typed DB columns, so field validation is
+    skipped; FastAPI still validates the endpoint's response_model on output.
+    """
+    return ExecutionHistoryEntryResponse.model_construct(
         id=entry.id,
         session_id=entry.session_id,
         exec_type=entry.exec_type.value,
@@ -13,9 +13,8 @@ from fastapi import APIRouter, BackgroundTasks, Header, Query, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from app.adapters import ADAPTER_CLASSES
 from app.adapters.base import BaseAdapter
-from app.adapters.gull import GullAdapter
-from app.adapters.ship import ShipAdapter
 from app.api.dependencies import AuthDep, IdempotencyServiceDep, SandboxManagerDep, get_driver
 from app.config import get_settings
 from app.db.session import get_async_session
@@ -136,16 +135,11 @@ def _sandbox_to_response_at_time(
 
 def _make_adapter(endpoint: str, runtime_type: str) -> BaseAdapter:
     """Create or retrieve a cached adapter for a container endpoint."""
-    pool_key = f"{endpoint}::{runtime_type}"
-
-    def factory() -> BaseAdapter:
-        if runtime_type == "ship":
-            return ShipAdapter(endpoint)
-        if runtime_type == "gull":
-            return GullAdapter(endpoint)
+    adapter_cls = ADAPTER_CLASSES.get(runtime_type)
+    if adapter_cls is None:
         raise ValueError(f"Unknown runtime type: {runtime_type}")
-
-    return default_adapter_pool.get_or_create(pool_key, factory)
+    pool_key = f"{endpoint}::{runtime_type}"
+    return default_adapter_pool.get_or_create_cls(pool_key, adapter_cls, endpoint)
 
 
 async def _query_single_container(
@@ -199,8 +199,13 @@ def _json_field_to_obj(raw: str | None) -> dict[str, Any] | None:
 
 
 def _candidate_to_response(candidate) -> SkillCandidateResponse:
+    """Convert a SkillCandidate row to API response.
+
+    Values come straight from typed DB columns, so field validation is
+    skipped; FastAPI still validates the endpoint's response_model on output.
+    """
     source_execution_ids = [item for item in candidate.source_execution_ids.split(",") if item]
-    return SkillCandidateResponse(
+    return SkillCandidateResponse.model_construct(
         id=candidate.id,
         skill_key=candidate.skill_key,
         scenario_key=candidate.scenario_key,
@@ -229,7 +234,12 @@ def _candidate_to_response(candidate) -> SkillCandidateResponse:
 
 
 def _evaluation_to_response(evaluation) -> SkillEvaluationResponse:
-    return SkillEvaluationResponse(
+    """Convert a SkillEvaluation row to API response.
+
+    Values come straight from typed DB columns, so field validation is
+    skipped; FastAPI still validates the endpoint's response_model on output.
+    """
+    return SkillEvaluationResponse.model_construct(
         id=evaluation.id,
         candidate_id=evaluation.candidate_id,
         benchmark_id=evaluation.benchmark_id,
@@ -242,7 +252,12 @@ def _evaluation_to_response(evaluation) -> SkillEvaluationResponse:
 
 
 def _release_to_response(release) -> SkillReleaseResponse:
-    return SkillReleaseResponse(
+    """Convert a SkillRelease row to API response.
+
+    Values come straight from typed DB columns, so field validation is
+    skipped; FastAPI still validates the endpoint's response_model on output.
+    """
+    return SkillReleaseResponse.model_construct(
         id=release.id,
         skill_key=release.skill_key,
         candidate_id=release.candidate_id,
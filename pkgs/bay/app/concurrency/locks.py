@@ -15,8 +15,9 @@ import asyncio
 
 # Lock map for sandbox-level concurrency control (single-instance only)
 # Key: sandbox_id, Value: asyncio.Lock
+# The map needs no lock of its own: every access below completes without an
+# await, so the event loop cannot interleave two get-or-create calls.
 _sandbox_locks: dict[str, asyncio.Lock] = {}
-_sandbox_locks_lock = asyncio.Lock()
 
 
 async def get_sandbox_lock(sandbox_id: str) -> asyncio.Lock:
@@ -34,10 +35,10 @@ async def get_sandbox_lock(sandbox_id: str) -> asyncio.Lock:
     Returns:
         asyncio.Lock for the specified sandbox
     """
-    async with _sandbox_locks_lock:
-        if sandbox_id not in _sandbox_locks:
-            _sandbox_locks[sandbox_id] = asyncio.Lock()
-        return _sandbox_locks[sandbox_id]
+    lock = _sandbox_locks.get(sandbox_id)
+    if lock is None:
+        lock = _sandbox_locks[sandbox_id] = asyncio.Lock()
+    return lock
 
 
 async def cleanup_sandbox_lock(sandbox_id: str) -> None:
@@ -48,8 +49,7 @@ async def cleanup_sandbox_lock(sandbox_id: str) -> None:
     Args:
         sandbox_id: The sandbox ID to cleanup lock for
     """
-    async with _sandbox_locks_lock:
-        _sandbox_locks.pop(sandbox_id, None)
+    _sandbox_locks.pop(sandbox_id, None)
 
 
 async def cleanup_deleted_sandbox_locks(deleted_sandbox_ids: set[str]) -> None:
@@ -60,9 +60,8 @@ async def cleanup_deleted_sandbox_locks(deleted_sandbox_ids: set[str]) -> None:
     Args:
         deleted_sandbox_ids: Set of sandbox IDs that have been deleted
     """
-    async with _sandbox_locks_lock:
-        for sandbox_id in deleted_sandbox_ids:
-            _sandbox_locks.pop(sandbox_id, None)
+    for sandbox_id in deleted_sandbox_ids:
+        _sandbox_locks.pop(sandbox_id, None)
 
 
 def get_lock_count() -> int:
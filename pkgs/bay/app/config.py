@@ -22,6 +22,8 @@ class ServerConfig(BaseModel):
 
     host: str = "0.0.0.0"
     port: int = 8114
+    # Minimum structlog level; calls below it are dropped before kwargs are rendered
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
 
 
 class DatabaseConfig(BaseModel):
@@ -31,6 +33,28 @@ class DatabaseConfig(BaseModel):
     url: str = "sqlite+aiosqlite:///./bay.db"
     echo: bool = False
 
+    # Connection pool (server databases only; ignored for SQLite).
+    # Managers issue one execute/commit round-trip per call, so the pool
+    # must be large enough not to serialize concurrent requests.
+    pool_size: int = Field(default=20, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_recycle: int = 300  # seconds; -1 disables recycling
+    # asyncpg surfaces dead connections itself; pre-ping costs a round-trip per checkout
+    pool_pre_ping: bool = False
+    # PostgreSQL only: disable JIT (helps short OLTP queries, e.g. on Neon)
+    postgres_disable_jit: bool = False
+    # SQLAlchemy compiled-statement cache (dialect default 500). The ORM's
+    # per-model statement variants add up; a larger cache keeps them warm.
+    query_cache_size: int = Field(default=1200, ge=0)
+    # asyncpg only: prepared statements kept per connection (dialect default
+    # 100). Set 0 behind PgBouncer in transaction mode.
+    postgres_prepared_statement_cache_size: int = Field(default=1024, ge=0)
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the backend is SQLite, which allows one writer at a time."""
+        return self.url.startswith("sqlite")
+
 
 class DockerConfig(BaseModel):
     """Docker driver configuration."""
@@ -390,6 +414,12 @@ class GCConfig(BaseModel):
     #   3. Fallback to "bay"
     instance_id: str | None = None
 
+    # Sandboxes processed concurrently by the idle-session and expired-sandbox
+    # tasks, each on its own db session (bounded by the DB pool size).
+    # None picks a per-backend default: 1 on SQLite, whose single write lock
+    # would serialize (and time out) parallel sandbox teardowns, 8 otherwise.
+    max_concurrent_sandboxes: int | None = Field(default=None, ge=1)
+
     # Per-task configuration
     idle_session: GCTaskConfig = Field(default_factory=GCTaskConfig)
     expired_sandbox: GCTaskConfig = Field(default_factory=GCTaskConfig)
@@ -405,6 +435,12 @@ class GCConfig(BaseModel):
             return self.instance_id
         return os.environ.get("HOSTNAME", "bay")
 
+    def get_max_concurrent_sandboxes(self, database: DatabaseConfig) -> int:
+        """Resolve max_concurrent_sandboxes for the configured database."""
+        if self.max_concurrent_sandboxes is not None:
+            return self.max_concurrent_sandboxes
+        return 1 if database.is_sqlite else 8
+
 
 class BrowserLearningConfig(BaseModel):
     """Browser skill learning and auto-release configuration."""
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 import structlog
-from sqlalchemy import inspect, text
+from sqlalchemy import func, inspect, make_url, select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
@@ -14,7 +17,12 @@ from sqlmodel import SQLModel
 # Import all models to ensure they are registered with SQLModel metadata
 # This is required for relationship resolution at runtime
 import app.models  # noqa: F401
-from app.config import get_settings
+from app.config import DatabaseConfig, get_settings
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 logger = structlog.get_logger()
 
@@ -23,6 +31,59 @@ _engine = None
 _async_session_factory = None
 
 
+if orjson is not None:
+
+    def _json_serializer(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_deserializer = orjson.loads
+else:
+
+    def _json_serializer(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    _json_deserializer = json.loads
+
+
+def _engine_kwargs(config: DatabaseConfig) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments from database config.
+
+    JSON columns (Session.containers, read on every capability call) use
+    orjson when it is installed and compact stdlib json otherwise.
+
+    Pool tuning only applies to server databases; SQLite keeps SQLAlchemy's
+    dialect defaults (in-memory databases require a single static connection).
+    On asyncpg, prepared statements are cached per connection as well.
+    """
+    kwargs: dict[str, Any] = {
+        "echo": config.echo,
+        "future": True,
+        "json_serializer": _json_serializer,
+        "json_deserializer": _json_deserializer,
+        "query_cache_size": config.query_cache_size,
+    }
+    url = make_url(config.url)
+    if url.get_backend_name() == "sqlite":
+        return kwargs
+
+    kwargs.update(
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+    )
+    connect_args: dict[str, Any] = {}
+    if url.get_backend_name() == "postgresql" and config.postgres_disable_jit:
+        connect_args["server_settings"] = {"jit": "off"}
+    if url.get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = (
+            config.postgres_prepared_statement_cache_size
+        )
+    if connect_args:
+        kwargs["connect_args"] = connect_args
+    return kwargs
+
+
 def _get_engine():
     """Get or create the async engine."""
     global _engine
@@ -30,8 +91,7 @@ def _get_engine():
         settings = get_settings()
         _engine = create_async_engine(
             settings.database.url,
-            echo=settings.database.echo,
-            future=True,
+            **_engine_kwargs(settings.database),
         )
     return _engine
 
@@ -95,15 +155,19 @@ def _sqlite_default_for_type(col) -> str:
 
 
 def _auto_migrate_sync(conn) -> None:
-    """Auto-migrate existing tables to add missing columns.
+    """Auto-migrate existing tables to add missing columns and indexes.
 
     SQLModel's create_all only creates new tables — it does NOT alter
-    existing tables to add new columns.  This helper inspects the live
-    schema and issues ALTER TABLE … ADD COLUMN for any column present
-    in the model but absent from the database.
+    existing tables to add new columns or indexes.  This helper inspects
+    the live schema and issues ALTER TABLE … ADD COLUMN / CREATE INDEX for
+    any column or named index present in the model but absent from the
+    database.
 
-    Only supports column *additions* (safe, non-destructive).
+    Only supports *additions* (safe, non-destructive).
     Does NOT handle column renames, type changes, or removals.
+    An index that cannot be created (e.g. a unique index over rows that
+    already hold duplicates) is skipped with a warning instead of failing
+    startup.
     """
     inspector = inspect(conn)
     existing_tables = inspector.get_table_names()
@@ -140,6 +204,44 @@ def _auto_migrate_sync(conn) -> None:
             )
             conn.execute(text(ddl))
 
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            if index.unique and _has_duplicate_keys(conn, index):
+                logger.warning(
+                    "db.auto_migrate.skip_unique_index",
+                    table=table.name,
+                    index=index.name,
+                    reason="existing rows hold duplicate values",
+                )
+                continue
+            logger.info(
+                "db.auto_migrate.add_index",
+                table=table.name,
+                index=index.name,
+            )
+            try:
+                with conn.begin_nested():
+                    index.create(conn)
+            except SQLAlchemyError as e:
+                logger.warning(
+                    "db.auto_migrate.add_index_failed",
+                    table=table.name,
+                    index=index.name,
+                    error=str(e),
+                )
+
+
+def _has_duplicate_keys(conn, index) -> bool:
+    """Return True if rows already violate the uniqueness of `index`."""
+    columns = list(index.expressions)
+    query = select(*columns).group_by(*columns).having(func.count() > 1).limit(1)
+    where = index.dialect_kwargs.get(f"{conn.dialect.name}_where")
+    if where is not None:
+        query = query.where(where)
+    return conn.execute(query).first() is not None
+
 
 async def init_db() -> None:
     """Initialize database tables.
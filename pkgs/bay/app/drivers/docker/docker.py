@@ -20,6 +20,7 @@ Note: runtime_port is provided by ProfileConfig (do not hardcode Ship port here)
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import aiodocker
@@ -529,24 +530,21 @@ class DockerDriver(Driver):
 
         containers = await client.containers.list(all=True, filters=filters)
 
+        # The list summary already carries id, names, labels, state and
+        # creation time: no per-container inspect round trip.
         instances = []
         for container in containers:
-            # container is DockerContainer, need to get info
-            info = await container.show()
-
-            container_id = info.get("Id", "")
-            name = info.get("Name", "").lstrip("/")
-            container_labels = info.get("Config", {}).get("Labels", {})
-            state = info.get("State", {}).get("Status", "unknown")
-            created_at = info.get("Created")
-
+            names = container["Names"] or [""]
+            created = container["Created"]
             instances.append(
                 RuntimeInstance(
-                    id=container_id,
-                    name=name,
-                    labels=container_labels,
-                    state=state,
-                    created_at=created_at,
+                    id=container.id,
+                    name=names[0].lstrip("/"),
+                    labels=container["Labels"] or {},
+                    state=container["State"] or "unknown",
+                    created_at=(
+                        datetime.fromtimestamp(created, UTC).isoformat() if created else None
+                    ),
                 )
             )
 
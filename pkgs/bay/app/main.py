@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import uuid
 from contextlib import asynccontextmanager
 
@@ -38,6 +39,8 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     async with get_async_session() as db:
         api_key_hashes = await ApiKeyService.auto_provision(db, settings)
+        if api_key_hashes:
+            app.state.api_key_prefixes = await ApiKeyService.load_active_key_prefixes(db)
     app.state.api_key_hashes = api_key_hashes
 
     # Initialize HTTP client with connection pooling
@@ -68,9 +71,23 @@ async def lifespan(app: FastAPI):
     await close_db()
 
 
+def configure_logging(level: str) -> None:
+    """Configure structlog to drop events below ``level``.
+
+    The filtering bound logger turns disabled levels into no-ops, and lets
+    hot paths check ``is_enabled_for`` before computing expensive kwargs.
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping()[level]
+        ),
+    )
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    get_settings()
+    settings = get_settings()
+    configure_logging(settings.server.log_level)
     app = FastAPI(
         title="Bay",
         description="Orchestration layer for Ship containers",
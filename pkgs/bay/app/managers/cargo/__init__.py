@@ -1,5 +1,5 @@
 """Cargo manager module."""
 
-from app.managers.cargo.cargo import CargoManager
+from app.managers.cargo.cargo import CargoManager, CargoRow
 
-__all__ = ["CargoManager"]
+__all__ = ["CargoManager", "CargoRow"]
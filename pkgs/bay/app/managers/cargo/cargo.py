@@ -5,30 +5,144 @@ See: plans/bay-design.md section 3.2
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import base64
+import binascii
+import secrets
+from datetime import datetime
+from typing import NamedTuple
 
 import structlog
+from sqlalchemy import and_, bindparam, delete, or_, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 from sqlmodel import select
 
 from app.config import get_settings
 from app.drivers.base import Driver
-from app.errors import ConflictError, NotFoundError
+from app.errors import ConflictError, NotFoundError, ValidationError
 from app.models.cargo import Cargo
 from app.models.sandbox import Sandbox
 from app.utils.datetime import utcnow
 
 logger = structlog.get_logger()
 
+# Cap on sandbox ids reported in a delete ConflictError payload.
+_MAX_REPORTED_ACTIVE_SANDBOX_IDS = 20
+
+
+class CargoRow(NamedTuple):
+    """Read-only cargo row returned by list().
+
+    Listing selects plain columns instead of hydrating Cargo instances, so
+    list pages skip identity-map bookkeeping and SQLModel construction.
+    """
+
+    id: str
+    owner: str
+    backend: str
+    driver_ref: str
+    managed: bool
+    managed_by_sandbox_id: str | None
+    size_limit_mb: int
+    created_at: datetime
+    last_accessed_at: datetime
+
+
+_CARGO_ROW_COLUMNS = (
+    Cargo.id,
+    Cargo.owner,
+    Cargo.backend,
+    Cargo.driver_ref,
+    Cargo.managed,
+    Cargo.managed_by_sandbox_id,
+    Cargo.size_limit_mb,
+    Cargo.created_at,
+    Cargo.last_accessed_at,
+)
+
+# Hot statements built once at import; per-call values go in as bind params.
+_SELECT_CARGO_ROWS = select(*_CARGO_ROW_COLUMNS)
+
+# Cargo/sandbox rows blocking a non-forced delete (see _get_with_active_sandbox_ids).
+_SELECT_CARGO_WITH_ACTIVE_SANDBOX_IDS = (
+    select(Cargo, Sandbox.id)
+    .outerjoin(
+        Sandbox,
+        and_(
+            Sandbox.deleted_at.is_(None),
+            or_(
+                and_(Cargo.managed.is_(False), Sandbox.cargo_id == Cargo.id),
+                and_(Cargo.managed.is_(True), Sandbox.id == Cargo.managed_by_sandbox_id),
+            ),
+        ),
+    )
+    .where(
+        Cargo.id == bindparam("cargo_id"),
+        Cargo.owner == bindparam("owner"),
+    )
+    .limit(_MAX_REPORTED_ACTIVE_SANDBOX_IDS)
+)
+
+# Upper bound on ids per bulk DELETE statement (SQLite bound-parameter limits).
+_DELETE_CHUNK_SIZE = 500
+
+# Force / GC deletes look up what the volume cleanup and log line need, delete
+# the volume, then remove the row with a short DELETE.
+_SELECT_CARGO_VOLUME_BY_ID = select(Cargo.driver_ref, Cargo.managed).where(
+    Cargo.id == bindparam("cargo_id")
+)
+_SELECT_OWNED_CARGO_VOLUME = select(Cargo.driver_ref, Cargo.managed).where(
+    Cargo.id == bindparam("cargo_id"),
+    Cargo.owner == bindparam("owner"),
+)
+_DELETE_CARGO_BY_ID = delete(Cargo).where(Cargo.id == bindparam("cargo_id"))
+
+_TOUCH_CARGO = (
+    update(Cargo)
+    .where(Cargo.id == bindparam("cargo_id"))
+    .values(last_accessed_at=bindparam("accessed_at"))
+    .execution_options(synchronize_session=False)
+)
+
+
+def _encode_cursor(created_at: datetime, cargo_id: str) -> str:
+    """Encode a list cursor from the last row's (created_at, id) key."""
+    raw = f"{created_at.isoformat()}|{cargo_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a list cursor into its (created_at, id) key.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        created_at, cargo_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), cargo_id
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValidationError(
+            "Invalid pagination cursor",
+            details={"cursor": cursor},
+        ) from e
+
 
 class CargoManager:
-    """Manages cargo lifecycle and storage."""
+    """Manages cargo lifecycle and storage.
+
+    Each call is a handful of short execute/commit round-trips on the
+    request's session, so concurrent throughput is bounded by the engine
+    pool (see DatabaseConfig.pool_size / max_overflow).
+    """
 
     def __init__(self, driver: Driver, db_session: AsyncSession) -> None:
         self._driver = driver
         self._db = db_session
         self._log = logger.bind(manager="cargo")
-        self._settings = get_settings()
+        # Resolved once here; create() only needs this one setting.
+        self._default_size_limit_mb = get_settings().cargo.default_size_limit_mb
 
     async def create(
         self,
@@ -49,8 +163,8 @@ class CargoManager:
         Returns:
             Created cargo
         """
-        cargo_id = f"ws-{uuid.uuid4().hex[:12]}"
-        volume_name = f"bay-cargo-{cargo_id}"
+        cargo_id = "ws-" + secrets.token_hex(6)
+        volume_name = "bay-cargo-" + cargo_id
 
         self._log.info(
             "cargo.create",
@@ -65,11 +179,12 @@ class CargoManager:
             labels={
                 "bay.owner": owner,
                 "bay.cargo_id": cargo_id,
-                "bay.managed": str(managed).lower(),
+                "bay.managed": "true" if managed else "false",
             },
         )
 
         # Create DB record
+        now = utcnow()
         cargo = Cargo(
             id=cargo_id,
             owner=owner,
@@ -77,14 +192,15 @@ class CargoManager:
             driver_ref=volume_name,
             managed=managed,
             managed_by_sandbox_id=managed_by_sandbox_id,
-            size_limit_mb=size_limit_mb or self._settings.cargo.default_size_limit_mb,
-            created_at=utcnow(),
-            last_accessed_at=utcnow(),
+            size_limit_mb=size_limit_mb or self._default_size_limit_mb,
+            created_at=now,
+            last_accessed_at=now,
         )
 
+        # Every column is set client-side and sessions use expire_on_commit=False,
+        # so the committed instance is already complete; no refresh SELECT needed.
         self._db.add(cargo)
         await self._db.commit()
-        await self._db.refresh(cargo)
 
         return cargo
 
@@ -101,23 +217,17 @@ class CargoManager:
         Raises:
             NotFoundError: If cargo not found or not visible
         """
-        result = await self._db.execute(
-            select(Cargo).where(
-                Cargo.id == cargo_id,
-                Cargo.owner == owner,
-            )
-        )
-        cargo = result.scalars().first()
+        # Primary-key lookup (identity map first); owner checked in Python.
+        cargo = await self._db.get(Cargo, cargo_id)
 
-        if cargo is None:
+        if cargo is None or cargo.owner != owner:
             raise NotFoundError(f"Cargo not found: {cargo_id}")
 
         return cargo
 
     async def get_by_id(self, cargo_id: str) -> Cargo | None:
         """Get cargo by ID (internal use, no owner check)."""
-        result = await self._db.execute(select(Cargo).where(Cargo.id == cargo_id))
-        return result.scalars().first()
+        return await self._db.get(Cargo, cargo_id)
 
     async def list(
         self,
@@ -126,41 +236,70 @@ class CargoManager:
         managed: bool | None = None,
         limit: int = 50,
         cursor: str | None = None,
-    ) -> tuple[list[Cargo], str | None]:
-        """List cargos for owner.
+    ) -> tuple[list[CargoRow], str | None]:
+        """List cargos for owner, newest first.
+
+        Uses keyset pagination over (created_at, id) so deep pages are an
+        index range scan on ix_cargos_owner_created_at_id rather than a sort.
 
         Args:
             owner: Owner identifier
             managed: Filter by managed status
                 (None = all, True = managed only, False = external only)
             limit: Maximum number of results
-            cursor: Pagination cursor
+            cursor: Opaque pagination cursor from a previous call. A bare
+                cargo id (the cursor format before keyset pagination) is
+                still accepted and resumes after that cargo.
 
         Returns:
-            Tuple of (cargos, next_cursor)
+            Tuple of (cargo rows, next_cursor)
+
+        Raises:
+            ValidationError: If cursor is malformed
         """
-        query = select(Cargo).where(Cargo.owner == owner)
+        query = _SELECT_CARGO_ROWS.where(Cargo.owner == owner)
 
         # Filter by managed status if specified
         if managed is not None:
             query = query.where(Cargo.managed == managed)
 
         if cursor:
-            # Cursor is the last cargo_id
-            query = query.where(Cargo.id > cursor)
+            cursor_created_at, cursor_id = await self._resolve_cursor(cursor, owner)
+            query = query.where(
+                tuple_(Cargo.created_at, Cargo.id) < tuple_(cursor_created_at, cursor_id)
+            )
 
-        query = query.order_by(Cargo.id).limit(limit + 1)
+        query = query.order_by(Cargo.created_at.desc(), Cargo.id.desc()).limit(limit + 1)
 
         result = await self._db.execute(query)
-        cargos = list(result.scalars().all())
+        cargos = [CargoRow._make(row) for row in result.all()]
 
         next_cursor = None
         if len(cargos) > limit:
             cargos = cargos[:limit]
-            next_cursor = cargos[-1].id
+            next_cursor = _encode_cursor(cargos[-1].created_at, cargos[-1].id)
 
         return cargos, next_cursor
 
+    async def _resolve_cursor(self, cursor: str, owner: str) -> tuple[datetime, str]:
+        """Turn a list cursor into its (created_at, id) key.
+
+        Cursors issued before keyset pagination were the last cargo's id;
+        those are resolved by looking up that cargo's created_at.
+
+        Raises:
+            ValidationError: If cursor is malformed or names no visible cargo
+        """
+        try:
+            return _decode_cursor(cursor)
+        except ValidationError:
+            created_at = await self._db.scalar(
+                select(Cargo.created_at).where(Cargo.id == cursor, Cargo.owner == owner)
+            )
+            if created_at is None:
+                raise
+            return created_at, cursor
+
     async def delete(
         self,
         cargo_id: str,
@@ -190,42 +329,35 @@ class CargoManager:
             NotFoundError: If cargo not found
             ConflictError: If cargo still in use or managed by active sandbox
         """
-        cargo = await self.get(cargo_id, owner)
-
-        if not force:
-            if not cargo.managed:
-                # External cargo: check for active sandbox references
-                result = await self._db.execute(
-                    select(Sandbox.id).where(
-                        Sandbox.cargo_id == cargo_id,
-                        Sandbox.deleted_at.is_(None),
-                    )
+        if force:
+            deleted = await self._delete_row_and_volume(
+                _SELECT_OWNED_CARGO_VOLUME,
+                {"cargo_id": cargo_id, "owner": owner},
+                event="cargo.delete",
+                force=True,
+            )
+            if not deleted:
+                raise NotFoundError(f"Cargo not found: {cargo_id}")
+            return
+
+        cargo, active_sandbox_ids = await self._get_with_active_sandbox_ids(cargo_id, owner)
+
+        if not cargo.managed:
+            # External cargo: refuse while referenced by active sandboxes
+            if active_sandbox_ids:
+                raise ConflictError(
+                    f"Cannot delete cargo {cargo_id}: still referenced by active sandboxes",
+                    details={"active_sandbox_ids": active_sandbox_ids},
                 )
-                active_sandbox_ids = [row[0] for row in result.fetchall()]
-
-                if active_sandbox_ids:
-                    raise ConflictError(
-                        f"Cannot delete cargo {cargo_id}: still referenced by active sandboxes",
-                        details={"active_sandbox_ids": active_sandbox_ids},
-                    )
-            else:
-                # Managed cargo: check if managing sandbox is still active
-                if cargo.managed_by_sandbox_id is not None:
-                    # Check if the managing sandbox exists and is not soft-deleted
-                    result = await self._db.execute(
-                        select(Sandbox).where(Sandbox.id == cargo.managed_by_sandbox_id)
-                    )
-                    managing_sandbox = result.scalars().first()
-
-                    if managing_sandbox is not None and managing_sandbox.deleted_at is None:
-                        # Managing sandbox is still active
-                        raise ConflictError(
-                            f"Cannot delete managed cargo {cargo_id}: "
-                            f"managing sandbox {cargo.managed_by_sandbox_id} is still active. "
-                            f"Delete the sandbox instead.",
-                            details={"managed_by_sandbox_id": cargo.managed_by_sandbox_id},
-                        )
-                # If managed_by_sandbox_id is None or sandbox is deleted, allow deletion
+        elif active_sandbox_ids:
+            # Managed cargo: managing sandbox still exists and is not soft-deleted
+            raise ConflictError(
+                f"Cannot delete managed cargo {cargo_id}: "
+                f"managing sandbox {cargo.managed_by_sandbox_id} is still active. "
+                f"Delete the sandbox instead.",
+                details={"managed_by_sandbox_id": cargo.managed_by_sandbox_id},
+            )
+        # If managed_by_sandbox_id is None or sandbox is deleted, allow deletion
 
         self._log.info(
             "cargo.delete",
@@ -242,43 +374,146 @@ class CargoManager:
         await self._db.delete(cargo)
         await self._db.commit()
 
+    async def _delete_row_and_volume(
+        self,
+        lookup: Select,
+        params: dict[str, str],
+        *,
+        event: str,
+        **log_fields: object,
+    ) -> bool:
+        """Delete a cargo's volume, then its row.
+
+        `lookup` selects (driver_ref, managed) for the cargo. The volume is
+        deleted before any write is issued, so no row lock is held across
+        the driver call; the row then goes in one short DELETE + commit. If
+        the volume delete fails the DB record is preserved for a retry.
+
+        Returns:
+            True if a row matched and was deleted, False otherwise
+        """
+        result = await self._db.execute(lookup, params)
+        row = result.first()
+        if row is None:
+            return False
+
+        self._log.info(
+            event,
+            cargo_id=params["cargo_id"],
+            volume=row.driver_ref,
+            managed=row.managed,
+            **log_fields,
+        )
+        await self._driver.delete_volume(row.driver_ref)
+
+        await self._db.execute(_DELETE_CARGO_BY_ID, {"cargo_id": params["cargo_id"]})
+        await self._db.commit()
+        return True
+
+    async def _get_with_active_sandbox_ids(
+        self,
+        cargo_id: str,
+        owner: str,
+    ) -> tuple[Cargo, list[str]]:
+        """Load a cargo and the active sandboxes blocking its deletion in one query.
+
+        - External cargo: non-deleted sandboxes referencing it via cargo_id,
+          capped at _MAX_REPORTED_ACTIVE_SANDBOX_IDS (enough for the error payload).
+        - Managed cargo: its managing sandbox, if it exists and is not soft-deleted.
+
+        Raises:
+            NotFoundError: If cargo not found or not visible
+        """
+        result = await self._db.execute(
+            _SELECT_CARGO_WITH_ACTIVE_SANDBOX_IDS,
+            {"cargo_id": cargo_id, "owner": owner},
+        )
+        rows = result.all()
+
+        if not rows:
+            raise NotFoundError(f"Cargo not found: {cargo_id}")
+
+        cargo = rows[0][0]
+        active_sandbox_ids = [sandbox_id for _, sandbox_id in rows if sandbox_id is not None]
+        return cargo, active_sandbox_ids
+
     async def touch(self, cargo_id: str) -> None:
-        """Update last_accessed_at timestamp."""
-        result = await self._db.execute(select(Cargo).where(Cargo.id == cargo_id))
-        cargo = result.scalars().first()
+        """Update last_accessed_at timestamp.
 
-        if cargo:
-            cargo.last_accessed_at = utcnow()
-            await self._db.commit()
+        Issued as a single UPDATE; no-op if the cargo does not exist.
+        """
+        await self._db.execute(
+            _TOUCH_CARGO,
+            {"cargo_id": cargo_id, "accessed_at": utcnow()},
+        )
+        await self._db.commit()
 
     async def delete_internal_by_id(self, cargo_id: str) -> None:
         """Internal delete without owner check. For GC / cascade use only.
 
-        This method is used by OrphanCargoGC to clean up orphan cargos.
         It bypasses the owner check since GC runs in a system context.
+        OrphanCargoGC uses the batch form, delete_internal_bulk.
 
         Args:
             cargo_id: Cargo ID to delete
 
         Note:
             - Idempotent: returns silently if cargo doesn't exist
-            - Deletes volume first, then DB record
+            - Volume delete first, then a short DELETE + commit
             - If volume delete fails, DB record is preserved
         """
-        cargo = await self.get_by_id(cargo_id)
-        if cargo is None:
-            # Already deleted, idempotent
-            return
-
-        self._log.info(
-            "cargo.delete_internal",
-            cargo_id=cargo_id,
-            volume=cargo.driver_ref,
+        await self._delete_row_and_volume(
+            _SELECT_CARGO_VOLUME_BY_ID,
+            {"cargo_id": cargo_id},
+            event="cargo.delete_internal",
         )
 
-        # Delete volume first (may fail)
-        await self._driver.delete_volume(cargo.driver_ref)
+    async def delete_internal_bulk(self, cargo_ids: list[str]) -> dict[str, BaseException | None]:
+        """Internal bulk delete without owner check. For GC use only.
 
-        # Delete DB record
-        await self._db.delete(cargo)
+        Batch form of delete_internal_by_id: the volumes are deleted first,
+        concurrently, then the rows whose volume delete succeeded go in one
+        ``DELETE ... WHERE id IN (...)`` per chunk and a single commit.
+
+        Args:
+            cargo_ids: Cargo IDs to delete
+
+        Returns:
+            Mapping of each found cargo ID to its volume delete error, or
+            None on success. IDs that no longer exist are left out.
+
+        Note:
+            - Rows whose volume delete fails are kept so GC retries them
+            - Volume deletes are idempotent, so a failed commit is safe to retry
+        """
+        rows = []
+        for i in range(0, len(cargo_ids), _DELETE_CHUNK_SIZE):
+            result = await self._db.execute(
+                select(Cargo.id, Cargo.driver_ref).where(
+                    Cargo.id.in_(cargo_ids[i : i + _DELETE_CHUNK_SIZE])
+                )
+            )
+            rows.extend(result.all())
+
+        if not rows:
+            return {}
+
+        self._log.info("cargo.delete_internal_bulk", count=len(rows))
+
+        volume_results = await asyncio.gather(
+            *(self._driver.delete_volume(row.driver_ref) for row in rows),
+            return_exceptions=True,
+        )
+        outcomes = {
+            row.id: volume_result if isinstance(volume_result, BaseException) else None
+            for row, volume_result in zip(rows, volume_results, strict=True)
+        }
+
+        deleted_ids = [cargo_id for cargo_id, error in outcomes.items() if error is None]
+        for i in range(0, len(deleted_ids), _DELETE_CHUNK_SIZE):
+            await self._db.execute(
+                delete(Cargo).where(Cargo.id.in_(deleted_ids[i : i + _DELETE_CHUNK_SIZE]))
+            )
         await self._db.commit()
+
+        return outcomes
@@ -318,7 +318,9 @@ class SandboxManager:
                 select(Sandbox).where(Sandbox.id == sandbox_id).with_for_update()
             )
             locked_sandbox = result.scalars().first()
-            if locked_sandbox is None:
+            # A soft-deleted sandbox (e.g. expired and being torn down by GC)
+            # must not get a new session.
+            if locked_sandbox is None or locked_sandbox.deleted_at is not None:
                 raise NotFoundError(f"Sandbox not found: {sandbox_id}")
 
             # Re-fetch cargo after rollback (objects are expired after rollback)
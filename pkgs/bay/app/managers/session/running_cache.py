@@ -0,0 +1,76 @@
+"""Short-lived cache of RUNNING sessions, keyed by sandbox id.
+
+Agent loops issue capability calls back-to-back, and each one used to go
+through SandboxManager.ensure_running (sandbox lock, SELECT ... FOR UPDATE,
+session lookup, idle-timeout commit). A session observed RUNNING is reused
+for a short TTL instead; the next miss refreshes the idle timeout as before.
+
+SessionManager.stop/destroy drop the entry, so local teardown is seen
+immediately. Other Bay processes may route to a stopped session for at most
+one TTL, which then fails like any other unreachable runtime.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.models.session import Session
+
+
+class RunningSessionCache:
+    """A small LRU of detached session snapshots with a fixed TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 4096,
+        ttl_seconds: float = 2.0,
+        now: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._now = now
+        self._entries: OrderedDict[str, tuple[float, Session]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, sandbox_id: str) -> Session | None:
+        entry = self._entries.get(sandbox_id)
+        if entry is None:
+            return None
+        expires_at, session = entry
+        if expires_at <= self._now():
+            del self._entries[sandbox_id]
+            return None
+        return session
+
+    def put(self, sandbox_id: str, session: Session) -> None:
+        """Cache a snapshot of `session`.
+
+        The snapshot is a transient copy: the original stays bound to the
+        request's DB session, where a later rollback would expire it under
+        concurrent readers.
+        """
+        snapshot = Session(**session.model_dump())
+        self._entries[sandbox_id] = (self._now() + self._ttl_seconds, snapshot)
+        self._entries.move_to_end(sandbox_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, sandbox_id: str) -> None:
+        self._entries.pop(sandbox_id, None)
+
+
+# Process-wide cache used by CapabilityRouter.
+running_session_cache = RunningSessionCache()
@@ -13,7 +13,9 @@ See: plans/bay-design.md section 3.2
 from __future__ import annotations
 
 import asyncio
+import logging
 import uuid
+from collections.abc import Sequence
 
 import httpx
 import structlog
@@ -23,6 +25,7 @@ from sqlmodel import select
 from app.config import ProfileConfig, get_settings
 from app.drivers.base import ContainerStatus, Driver, MultiContainerInfo
 from app.errors import SessionNotReadyError
+from app.managers.session.running_cache import running_session_cache
 from app.models.cargo import Cargo
 from app.models.session import Session, SessionStatus
 from app.services.http import http_client_manager
@@ -30,6 +33,30 @@ from app.utils.datetime import utcnow
 
 logger = structlog.get_logger()
 
+# Per-call caps for driver operations on the health-probe path. A hung
+# container runtime must not stall every ensure_running() behind it.
+PROBE_STATUS_TIMEOUT_SECONDS = 1.0
+PROBE_DESTROY_TIMEOUT_SECONDS = 2.0
+
+# Failed multi-container starts are torn down in the background so the client
+# gets its error without waiting on N container removals.
+ROLLBACK_MAX_ATTEMPTS = 3
+ROLLBACK_RETRY_BASE_SECONDS = 0.5
+
+# In-flight background rollbacks keyed by session_id. Holding the task keeps it
+# alive until done, and lets a retry for the same session wait until the old
+# session network is gone before creating a new one.
+_pending_rollbacks: dict[str, asyncio.Task[None]] = {}
+
+# Driver-observed container status -> session observed_state.
+# Statuses not listed (e.g. REMOVING) leave observed_state unchanged.
+_CONTAINER_TO_SESSION_STATUS: dict[ContainerStatus, SessionStatus] = {
+    ContainerStatus.RUNNING: SessionStatus.RUNNING,
+    ContainerStatus.CREATED: SessionStatus.PENDING,
+    ContainerStatus.EXITED: SessionStatus.STOPPED,
+    ContainerStatus.NOT_FOUND: SessionStatus.STOPPED,
+}
+
 
 class SessionManager:
     """Manages session (container) lifecycle."""
@@ -71,6 +98,7 @@ class SessionManager:
 
         primary = profile.get_primary_container()
         runtime_type = primary.runtime_type if primary else "ship"
+        now = utcnow()
 
         session = Session(
             id=session_id,
@@ -79,8 +107,8 @@ class SessionManager:
             profile_id=profile.id,
             desired_state=SessionStatus.PENDING,
             observed_state=SessionStatus.PENDING,
-            created_at=utcnow(),
-            last_active_at=utcnow(),
+            created_at=now,
+            last_active_at=now,
         )
 
         self._db.add(session)
@@ -119,20 +147,22 @@ class SessionManager:
         Raises:
             SessionNotReadyError: If session is starting but not ready yet
         """
-        self._log.info(
-            "session.ensure_running",
-            session_id=session.id,
-            sandbox_id=session.sandbox_id,
-            profile_id=profile.id,
-            observed_state=session.observed_state,
-            desired_state=session.desired_state,
-            container_count=len(profile.get_containers()),
-            has_endpoint=session.endpoint is not None,
-            has_containers=bool(session.containers),
-        )
+        container_count = len(profile.get_containers())
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "session.ensure_running",
+                session_id=session.id,
+                sandbox_id=session.sandbox_id,
+                profile_id=profile.id,
+                observed_state=session.observed_state,
+                desired_state=session.desired_state,
+                container_count=container_count,
+                has_endpoint=session.endpoint is not None,
+                has_containers=bool(session.containers),
+            )
 
         # Phase 2: Multi-container path
-        if len(profile.get_containers()) > 1:
+        if container_count > 1:
             return await self._ensure_running_multi(session, cargo, profile)
 
         # Phase 1 path: single container (backward compatible)
@@ -262,14 +292,15 @@ class SessionManager:
         """
         # If DB says running, verify the multi-container runtime still exists.
         if session.observed_state == SessionStatus.RUNNING and session.containers:
-            self._log.debug(
-                "session.multi_probe.begin",
-                session_id=session.id,
-                sandbox_id=session.sandbox_id,
-                profile_id=profile.id,
-                primary_container_id=session.container_id,
-                container_names=[c.get("name") for c in session.containers],
-            )
+            if self._log.is_enabled_for(logging.DEBUG):
+                self._log.debug(
+                    "session.multi_probe.begin",
+                    session_id=session.id,
+                    sandbox_id=session.sandbox_id,
+                    profile_id=profile.id,
+                    primary_container_id=session.container_id,
+                    container_names=[c.get("name") for c in session.containers],
+                )
             session = await self._probe_and_recover_multi_if_dead(session)
 
         # Already running and ready
@@ -286,6 +317,11 @@ class SessionManager:
 
         # Need to create and start containers
         if session.container_id is None:
+            # A previous failed start may still be tearing down this session's runtime.
+            pending_rollback = _pending_rollbacks.get(session.id)
+            if pending_rollback is not None:
+                await asyncio.shield(pending_rollback)
+
             session.desired_state = SessionStatus.RUNNING
             session.observed_state = SessionStatus.STARTING
             await self._db.commit()
@@ -360,35 +396,92 @@ class SessionManager:
                     error=str(e),
                 )
 
-                # Rollback: destroy all containers + network
-                if container_infos:
-                    try:
-                        await self._driver.destroy_multi(container_infos)
-                    except Exception as cleanup_err:
-                        self._log.warning(
-                            "session.multi_container_rollback.destroy_failed",
-                            error=str(cleanup_err),
-                        )
-
-                if network_name:
-                    try:
-                        await self._driver.remove_session_network(session.id)
-                    except Exception as cleanup_err:
-                        self._log.warning(
-                            "session.multi_container_rollback.network_failed",
-                            error=str(cleanup_err),
-                        )
-
+                # Persist FAILED first so the DB reflects the outcome immediately,
+                # then destroy all containers + network in the background.
                 session.container_id = None
                 session.endpoint = None
                 session.containers = None
                 session.observed_state = SessionStatus.FAILED
                 session.last_observed_at = utcnow()
                 await self._db.commit()
+
+                if container_infos or network_name:
+                    self._schedule_multi_rollback(session.id, container_infos, network_name)
                 raise
 
         return session
 
+    def _schedule_multi_rollback(
+        self,
+        session_id: str,
+        container_infos: list[MultiContainerInfo],
+        network_name: str | None,
+    ) -> None:
+        """Run multi-container rollback in a detached task."""
+        task = asyncio.create_task(
+            self._rollback_multi(session_id, container_infos, network_name),
+            name=f"multi-rollback-{session_id}",
+        )
+        _pending_rollbacks[session_id] = task
+
+        def _on_rollback_done(t: asyncio.Task[None]) -> None:
+            if _pending_rollbacks.get(session_id) is t:
+                del _pending_rollbacks[session_id]
+
+        task.add_done_callback(_on_rollback_done)
+
+    async def _rollback_multi(
+        self,
+        session_id: str,
+        container_infos: list[MultiContainerInfo],
+        network_name: str | None,
+    ) -> None:
+        """Destroy containers and network of a failed multi-container start.
+
+        Retries with exponential backoff; failures are logged, never raised.
+        """
+        destroy_pending = bool(container_infos)
+        network_pending = network_name is not None
+
+        for attempt in range(1, ROLLBACK_MAX_ATTEMPTS + 1):
+            if destroy_pending:
+                try:
+                    await self._driver.destroy_multi(container_infos)
+                    destroy_pending = False
+                except Exception as cleanup_err:
+                    self._log.warning(
+                        "session.multi_container_rollback.destroy_failed",
+                        session_id=session_id,
+                        attempt=attempt,
+                        error=str(cleanup_err),
+                    )
+
+            if network_pending:
+                try:
+                    await self._driver.remove_session_network(session_id)
+                    network_pending = False
+                except Exception as cleanup_err:
+                    self._log.warning(
+                        "session.multi_container_rollback.network_failed",
+                        session_id=session_id,
+                        attempt=attempt,
+                        error=str(cleanup_err),
+                    )
+
+            if not destroy_pending and not network_pending:
+                return
+
+            if attempt < ROLLBACK_MAX_ATTEMPTS:
+                await asyncio.sleep(ROLLBACK_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+
+        self._log.error(
+            "session.multi_container_rollback.gave_up",
+            session_id=session_id,
+            containers=[ci.name for ci in container_infos] if destroy_pending else [],
+            network_name=network_name if network_pending else None,
+            attempts=ROLLBACK_MAX_ATTEMPTS,
+        )
+
     async def _wait_for_multi_ready(
         self,
         container_infos: list[MultiContainerInfo],
@@ -406,7 +499,14 @@ class SessionManager:
         For browser containers (Gull), also checks that browser_ready=true in
         the health response to ensure Chromium has been pre-warmed.
         """
-        pending = {ci.name: ci for ci in container_infos}
+        pending: set[str] = {ci.name for ci in container_infos}
+        # Health URL and browser flag are fixed for the whole wait; containers
+        # without an endpoint have no probe and simply stay pending.
+        probes = {
+            ci.name: (f"{ci.endpoint.rstrip('/')}/health", ci.runtime_type == "browser")
+            for ci in container_infos
+            if ci.endpoint is not None
+        }
 
         start_time = asyncio.get_event_loop().time()
         interval = initial_interval
@@ -421,11 +521,12 @@ class SessionManager:
             attempt += 1
             newly_ready: list[str] = []
 
-            for name, ci in pending.items():
-                if ci.endpoint is None:
+            for name in pending:
+                probe = probes.get(name)
+                if probe is None:
                     continue
 
-                url = f"{ci.endpoint.rstrip('/')}/health"
+                url, is_browser = probe
                 try:
                     if client is not None:
                         response = await client.get(url, timeout=2.0)
@@ -438,7 +539,7 @@ class SessionManager:
                         # This ensures Chromium is pre-warmed before marking ready.
                         # Old Gull images without browser_ready field are treated
                         # as ready (backward compat: field absence = ready).
-                        if ci.runtime_type == "browser":
+                        if is_browser:
                             try:
                                 payload = response.json()
                                 browser_ready = payload.get("browser_ready", True)
@@ -452,8 +553,7 @@ class SessionManager:
                 except (httpx.RequestError, httpx.TimeoutException):
                     pass
 
-            for name in newly_ready:
-                del pending[name]
+            pending.difference_update(newly_ready)
 
             if not pending:
                 elapsed = asyncio.get_event_loop().time() - start_time
@@ -475,11 +575,11 @@ class SessionManager:
         self._log.error(
             "session.multi_container_not_ready",
             session_id=session_id,
-            pending=list(pending.keys()),
+            pending=sorted(pending),
             attempts=attempt,
         )
         raise SessionNotReadyError(
-            message=f"Containers not ready: {list(pending.keys())}",
+            message=f"Containers not ready: {sorted(pending)}",
             sandbox_id=sandbox_id,
             retry_after_ms=1000,
         )
@@ -522,6 +622,7 @@ class SessionManager:
             SessionNotReadyError: If runtime doesn't become ready in time
         """
         url = f"{endpoint.rstrip('/')}/health"
+        is_browser = runtime_type == "browser"
 
         start_time = asyncio.get_event_loop().time()
         interval = initial_interval
@@ -550,7 +651,7 @@ class SessionManager:
                     # This ensures Chromium is pre-warmed before marking ready.
                     # Old Gull images without browser_ready field are treated
                     # as ready (backward compat: field absence = ready).
-                    if runtime_type == "browser":
+                    if is_browser:
                         try:
                             payload = response.json()
                             browser_ready = payload.get("browser_ready", True)
@@ -617,17 +718,20 @@ class SessionManager:
         Args:
             session: Session to stop
         """
+        running_session_cache.discard(session.sandbox_id)
+        # is_multi_container implies a non-empty containers list
+        is_multi = session.is_multi_container
         self._log.info(
             "session.stop",
             session_id=session.id,
-            is_multi=session.is_multi_container,
+            is_multi=is_multi,
         )
 
         session.desired_state = SessionStatus.STOPPED
         session.observed_state = SessionStatus.STOPPING
         await self._db.commit()
 
-        if session.is_multi_container and session.containers:
+        if is_multi:
             # Phase 2: Stop all containers
             container_infos = [
                 MultiContainerInfo(
@@ -666,13 +770,56 @@ class SessionManager:
         Args:
             session: Session to destroy
         """
+        running_session_cache.discard(session.sandbox_id)
+        await self._destroy_runtime(session)
+
+        await self._db.delete(session)
+        await self._db.commit()
+
+    async def destroy_many(self, sessions: Sequence[Session]) -> dict[str, BaseException | None]:
+        """Destroy several sessions, running their driver teardown concurrently.
+
+        Batch form of destroy for GC: the runtime teardowns overlap and the
+        row deletes share one commit.
+
+        Args:
+            sessions: Sessions to destroy
+
+        Returns:
+            Mapping of each session ID to its teardown error, or None on
+            success. Sessions whose teardown fails keep their row, as with
+            destroy.
+        """
+        for session in sessions:
+            running_session_cache.discard(session.sandbox_id)
+
+        results = await asyncio.gather(
+            *(self._destroy_runtime(session) for session in sessions),
+            return_exceptions=True,
+        )
+        outcomes: dict[str, BaseException | None] = {}
+        for session, result in zip(sessions, results, strict=True):
+            if isinstance(result, BaseException):
+                outcomes[session.id] = result
+            else:
+                outcomes[session.id] = None
+                await self._db.delete(session)
+
+        if any(error is None for error in outcomes.values()):
+            await self._db.commit()
+        return outcomes
+
+    async def _destroy_runtime(self, session: Session) -> None:
+        """Tear down a session's containers (and network) in the driver."""
+        # is_multi_container implies a non-empty containers list
+        is_multi = session.is_multi_container
         self._log.info(
             "session.destroy",
             session_id=session.id,
-            is_multi=session.is_multi_container,
+            is_multi=is_multi,
         )
 
-        if session.is_multi_container and session.containers:
+        if is_multi:
             # Phase 2: Destroy all containers
             container_infos = [
                 MultiContainerInfo(
@@ -697,9 +844,6 @@ class SessionManager:
             # Phase 1: Destroy single container
             await self._driver.destroy(session.container_id)
 
-        await self._db.delete(session)
-        await self._db.commit()
-
     async def refresh_status(self, session: Session) -> Session:
         """Refresh session status from driver.
 
@@ -724,15 +868,12 @@ class SessionManager:
         )
 
         # Map container status to session status
+        session.observed_state = _CONTAINER_TO_SESSION_STATUS.get(
+            info.status, session.observed_state
+        )
         if info.status == ContainerStatus.RUNNING:
-            session.observed_state = SessionStatus.RUNNING
             session.endpoint = info.endpoint
-        elif info.status == ContainerStatus.CREATED:
-            session.observed_state = SessionStatus.PENDING
-        elif info.status == ContainerStatus.EXITED:
-            session.observed_state = SessionStatus.STOPPED
         elif info.status == ContainerStatus.NOT_FOUND:
-            session.observed_state = SessionStatus.STOPPED
             session.container_id = None
 
         session.last_observed_at = utcnow()
@@ -780,26 +921,28 @@ class SessionManager:
         live_instances = [
             instance for instance in instances if instance.state == ContainerStatus.RUNNING.value
         ]
-        self._log.info(
-            "session.multi_probe.result",
-            session_id=session.id,
-            sandbox_id=session.sandbox_id,
-            expected_container_names=expected_container_names,
-            expected_container_ids=expected_container_ids,
-            discovered_runtime_ids=[instance.id for instance in instances],
-            discovered_runtime_states={instance.id: instance.state for instance in instances},
-            live_runtime_ids=[instance.id for instance in live_instances],
-            live_runtime_count=len(live_instances),
-        )
-
-        has_live_runtime = len(live_instances) > 0
-        if has_live_runtime:
-            self._log.debug(
-                "session.multi_probe.healthy",
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "session.multi_probe.result",
                 session_id=session.id,
                 sandbox_id=session.sandbox_id,
+                expected_container_names=expected_container_names,
+                expected_container_ids=expected_container_ids,
+                discovered_runtime_ids=[instance.id for instance in instances],
+                discovered_runtime_states={instance.id: instance.state for instance in instances},
                 live_runtime_ids=[instance.id for instance in live_instances],
+                live_runtime_count=len(live_instances),
             )
+
+        has_live_runtime = len(live_instances) > 0
+        if has_live_runtime:
+            if self._log.is_enabled_for(logging.DEBUG):
+                self._log.debug(
+                    "session.multi_probe.healthy",
+                    session_id=session.id,
+                    sandbox_id=session.sandbox_id,
+                    live_runtime_ids=[instance.id for instance in live_instances],
+                )
             return session
 
         self._log.warning(
@@ -859,10 +1002,22 @@ class SessionManager:
         runtime_port = primary.runtime_port if primary else 8123
 
         try:
-            info = await self._driver.status(
-                container_id,
-                runtime_port=runtime_port,
+            info = await asyncio.wait_for(
+                self._driver.status(
+                    container_id,
+                    runtime_port=runtime_port,
+                ),
+                timeout=PROBE_STATUS_TIMEOUT_SECONDS,
             )
+        except TimeoutError:
+            # Docker daemon unresponsive - degrade to old path (trust DB state)
+            self._log.warning(
+                "session.probe_timeout",
+                session_id=session.id,
+                container_id=container_id,
+                timeout_seconds=PROBE_STATUS_TIMEOUT_SECONDS,
+            )
+            return session
         except Exception as e:
             # Docker daemon unreachable - degrade to old path (trust DB state)
             self._log.warning(
@@ -887,7 +1042,10 @@ class SessionManager:
 
         # Best-effort destroy (container may already be gone)
         try:
-            await self._driver.destroy(container_id)
+            await asyncio.wait_for(
+                self._driver.destroy(container_id),
+                timeout=PROBE_DESTROY_TIMEOUT_SECONDS,
+            )
         except Exception as destroy_error:
             self._log.debug(
                 "session.destroy_dead_container_failed",
@@ -7,6 +7,7 @@ Plaintext keys are never stored — only SHA-256 hashes.
 from datetime import UTC, datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -18,9 +19,13 @@ class ApiKey(SQLModel, table=True):
     """
 
     __tablename__ = "api_keys"
+    # Named separately from the original ix_api_keys_key_hash so init_db's
+    # auto-migrate creates it on existing databases; it is the conflict
+    # target for seeding configured keys.
+    __table_args__ = (Index("uq_api_keys_key_hash", "key_hash", unique=True),)
 
     id: str = Field(primary_key=True)
-    key_hash: str = Field(index=True)  # SHA-256 hex digest
+    key_hash: str = Field()  # SHA-256 hex digest; indexed by uq_api_keys_key_hash
     key_prefix: str = Field()  # First 12 chars of plaintext (e.g., "sk-bay-abc1")
     owner: str = Field(default="default")
     is_active: bool = Field(default=True)
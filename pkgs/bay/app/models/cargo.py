@@ -10,6 +10,7 @@ Types:
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.utils.datetime import utcnow
@@ -22,9 +23,15 @@ class Cargo(SQLModel, table=True):
     """Cargo - persistent data storage."""
 
     __tablename__ = "cargos"
+    __table_args__ = (
+        # Keyset pagination for list(): owner filter + (created_at, id) ordering.
+        # Also serves every other owner-prefixed lookup, so owner has no
+        # index of its own; (id, owner) lookups resolve through the primary key.
+        Index("ix_cargos_owner_created_at_id", "owner", "created_at", "id"),
+    )
 
     id: str = Field(primary_key=True)
-    owner: str = Field(index=True)
+    owner: str
 
     # Storage backend
     backend: str = Field(default="docker_volume")  # docker_volume | k8s_pvc
@@ -6,7 +6,8 @@ See: plans/bay-api.md section 1.2
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 
 from sqlmodel import Field, SQLModel
 
@@ -32,7 +33,17 @@ class IdempotencyKey(SQLModel, table=True):
     # TTL
     created_at: datetime = Field(default_factory=utcnow)
     expires_at: datetime = Field(index=True)
+    # expires_at as Unix seconds, so is_expired() is an int compare.
+    # 0 for rows written before the column existed.
+    expires_at_epoch: int = Field(default=0)
+
+    @staticmethod
+    def epoch_of(expires_at: datetime) -> int:
+        """Convert a naive-UTC expires_at to Unix seconds."""
+        return int(expires_at.replace(tzinfo=UTC).timestamp())
 
     def is_expired(self) -> bool:
         """Check if this idempotency key has expired."""
+        if self.expires_at_epoch:
+            return time.time() > self.expires_at_epoch
         return utcnow() > self.expires_at
@@ -10,6 +10,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.utils.datetime import utcnow
@@ -42,6 +43,29 @@ class Sandbox(SQLModel, table=True):
     """Sandbox - external-facing resource."""
 
     __tablename__ = "sandboxes"
+    __table_args__ = (
+        # Active sandboxes by cargo: cargo delete precondition check
+        Index(
+            "ix_sandboxes_active_cargo_id",
+            "cargo_id",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # GC scans: live sandboxes past their TTL / idle deadline. Partial, so
+        # index size follows live rows with a deadline, not total history.
+        Index(
+            "ix_sandboxes_live_expires_at",
+            "expires_at",
+            sqlite_where=text("deleted_at IS NULL AND expires_at IS NOT NULL"),
+            postgresql_where=text("deleted_at IS NULL AND expires_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_sandboxes_live_idle_expires_at",
+            "idle_expires_at",
+            sqlite_where=text("deleted_at IS NULL AND idle_expires_at IS NOT NULL"),
+            postgresql_where=text("deleted_at IS NULL AND idle_expires_at IS NOT NULL"),
+        ),
+    )
 
     id: str = Field(primary_key=True)
     owner: str = Field(index=True)
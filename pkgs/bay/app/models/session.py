@@ -9,11 +9,13 @@ Phase 2: 1 Session = N Containers (multi-container support)
 - Not exposed to external API (only sandbox_id is exposed)
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, TypedDict
 
 from sqlalchemy import Column
+from sqlalchemy import inspect as sa_inspect
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.utils.datetime import utcnow
@@ -27,6 +29,10 @@ if TYPE_CHECKING:
     from app.models.sandbox import Sandbox
 
 
+# InstanceState.info key for the lazily built container lookup index.
+_CONTAINERS_INDEX_KEY = "bay.containers_index"
+
+
 class SessionStatus(str, Enum):
     """Session lifecycle status."""
 
@@ -39,20 +45,19 @@ class SessionStatus(str, Enum):
     FAILED = "failed"  # Start failed
 
 
-class ContainerRuntime(dict):
+class ContainerRuntime(TypedDict, total=False):
     """Runtime container state stored in Session.containers JSON.
 
-    Schema: {
-        "name": str,           # Container name (e.g., "ship", "browser")
-        "container_id": str,   # Docker container ID
-        "endpoint": str,       # HTTP endpoint (e.g., "http://host:port")
-        "status": str,         # running | stopped | failed
-        "runtime_type": str,   # ship | browser
-        "capabilities": list,  # ["python", "shell"] etc.
-    }
+    Entries stay plain dicts (that is what the JSON column loads and what
+    the API echoes back); this only describes their keys for type checkers.
     """
 
-    pass
+    name: str  # Container name (e.g., "ship", "browser")
+    container_id: str  # Docker container ID
+    endpoint: str  # HTTP endpoint (e.g., "http://host:port")
+    status: str  # running | stopped | failed
+    runtime_type: str  # ship | gull
+    capabilities: list[str]  # ["python", "shell"] etc.
 
 
 class Session(SQLModel, table=True):
@@ -110,7 +115,38 @@ class Session(SQLModel, table=True):
         """Check if this session uses multi-container mode."""
         return self.containers is not None and len(self.containers) > 1
 
-    def get_container_for_capability(self, capability: str) -> dict[str, Any] | None:
+    def _container_index(
+        self,
+    ) -> tuple[dict[str, ContainerRuntime], dict[str, ContainerRuntime], tuple[str, ...]]:
+        """Return (by_capability, by_name, sorted capabilities) lookups.
+
+        Container lookups are first match wins.
+
+        Cached on the ORM instance state keyed by the `containers` list
+        identity; the list is always reassigned (JSON columns do not track
+        in-place changes), so reassignment invalidates the index.
+        """
+        containers = self.containers
+        info = sa_inspect(self).info
+        cached = info.get(_CONTAINERS_INDEX_KEY)
+        if cached is not None and cached[0] is containers:
+            return cached[1]
+
+        # Keys decoded from JSON are fresh strings; interning them lets lookups
+        # with the router's literal capability names hit on identity.
+        by_capability: dict[str, ContainerRuntime] = {}
+        by_name: dict[str, ContainerRuntime] = {}
+        for c in containers or ():
+            name = c.get("name")
+            by_name.setdefault(sys.intern(name) if name is not None else name, c)
+            for capability in c.get("capabilities", []):
+                by_capability.setdefault(sys.intern(capability), c)
+
+        index = (by_capability, by_name, tuple(sorted(by_capability)))
+        info[_CONTAINERS_INDEX_KEY] = (containers, index)
+        return index
+
+    def get_container_for_capability(self, capability: str) -> ContainerRuntime | None:
         """Find a container that provides the given capability.
 
         Args:
@@ -119,14 +155,18 @@ class Session(SQLModel, table=True):
         Returns:
             Container dict if found, None otherwise
         """
-        if not self.containers:
-            return None
+        return self._container_index()[0].get(capability)
+
+    def get_container_by_name(self, container_name: str) -> ContainerRuntime | None:
+        """Get a container dict by name.
 
-        for c in self.containers:
-            if capability in c.get("capabilities", []):
-                return c
+        Args:
+            container_name: Container name (e.g., "ship", "browser")
 
-        return None
+        Returns:
+            Container dict if found, None otherwise
+        """
+        return self._container_index()[1].get(container_name)
 
     def get_container_endpoint(self, container_name: str) -> str | None:
         """Get endpoint for a specific container by name.
@@ -137,11 +177,9 @@ class Session(SQLModel, table=True):
         Returns:
             Endpoint URL if found, None otherwise
         """
-        if not self.containers:
-            return None
-
-        for c in self.containers:
-            if c.get("name") == container_name:
-                return c.get("endpoint")
+        container = self.get_container_by_name(container_name)
+        return container.get("endpoint") if container is not None else None
 
-        return None
+    def get_all_capabilities(self) -> list[str]:
+        """Get all capabilities provided by any container, sorted."""
+        return list(self._container_index()[2])
@@ -12,6 +12,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from app.utils.datetime import utcnow
@@ -73,9 +74,23 @@ class ExecutionHistory(SQLModel, table=True):
     """Execution evidence for learning workflows."""
 
     __tablename__ = "execution_history"
+    __table_args__ = (
+        # Per-sandbox history listing / last-execution lookup, newest first
+        Index(
+            "ix_execution_history_owner_sandbox_created_at",
+            "owner",
+            "sandbox_id",
+            "created_at",
+        ),
+        # Release health windows: owner + created_at range, tags filtered in range
+        Index("ix_execution_history_owner_created_at", "owner", "created_at"),
+        # Browser learning queue: learn-enabled rows, oldest first
+        Index("ix_execution_history_learn_queue", "learn_enabled", "created_at"),
+    )
 
     id: str = Field(primary_key=True)
-    owner: str = Field(index=True)
+    # Owner lookups are served by the owner-leading composite indexes above
+    owner: str
     sandbox_id: str = Field(index=True)
     session_id: str | None = Field(default=None, index=True)
 
@@ -92,7 +107,8 @@ class ExecutionHistory(SQLModel, table=True):
     description: str | None = Field(default=None)
     tags: str | None = Field(default=None)
     notes: str | None = Field(default=None)
-    learn_enabled: bool = Field(default=False, index=True)
+    # Leading column of ix_execution_history_learn_queue
+    learn_enabled: bool = Field(default=False)
     learn_status: LearnStatus | None = Field(default=None, index=True)
     learn_error: str | None = Field(default=None)
     learn_processed_at: datetime | None = Field(default=None, index=True)
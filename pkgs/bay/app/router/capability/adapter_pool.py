@@ -58,19 +58,38 @@ class AdapterPool(Generic[T]):
 
     def get_or_create(self, key: str, factory: Callable[[], T]) -> T:
         now = self._now()
+        existing = self._lookup(key, now)
+        if existing is not None:
+            return existing.value
 
+        # Create outside the lock; construction may be non-trivial.
+        return self._insert(key, factory(), now)
+
+    def get_or_create_cls(self, key: str, cls: Callable[[str], T], arg: str) -> T:
+        """Like get_or_create, constructing `cls(arg)` only on a miss.
+
+        Spares hot-path callers a factory closure per lookup.
+        """
+        now = self._now()
+        existing = self._lookup(key, now)
+        if existing is not None:
+            return existing.value
+
+        return self._insert(key, cls(arg), now)
+
+    def _lookup(self, key: str, now: float) -> _PoolEntry[T] | None:
         with self._lock:
             existing = self._entries.get(key)
             if existing is not None:
                 if existing.expires_at > now:
                     # LRU: refresh recency order (but keep absolute TTL).
                     self._entries.move_to_end(key)
-                    return existing.value
+                    return existing
                 # Expired.
                 self._entries.pop(key, None)
+        return None
 
-        # Create outside the lock; construction may be non-trivial.
-        value = factory()
+    def _insert(self, key: str, value: T, now: float) -> T:
         entry = _PoolEntry(value=value, expires_at=now + self._ttl_seconds)
 
         with self._lock:
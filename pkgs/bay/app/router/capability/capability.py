@@ -11,22 +11,79 @@ See: plans/phase-1/capability-adapter-design.md
 
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
 import structlog
+from sqlalchemy import inspect as sa_inspect
 
+from app.adapters import ADAPTER_CLASSES
 from app.adapters.base import BaseAdapter, ExecutionResult
-from app.adapters.gull import GullAdapter
-from app.adapters.ship import ShipAdapter
+from app.config import Settings, get_settings
 from app.errors import CapabilityNotSupportedError, SessionNotReadyError
 from app.managers.sandbox import SandboxManager
+from app.managers.session.running_cache import RunningSessionCache, running_session_cache
 from app.models.sandbox import Sandbox
-from app.models.session import Session
+from app.models.session import Session, SessionStatus
 from app.router.capability.adapter_pool import AdapterPool, default_adapter_pool
 
 logger = structlog.get_logger()
 
 
+# (profile_id, capability) -> serving container name, valid for the Settings
+# object in _target_names_settings; a new Settings object starts a new memo.
+_target_names: dict[tuple[str, str], str | None] = {}
+_target_names_settings: Settings | None = None
+
+
+def _resolve_target_name(profile_id: str, capability: str) -> str | None:
+    """Name of the profile container that serves a capability, if any.
+
+    The answer only depends on the profile config, so it is memoized per
+    Settings object (get_settings is itself cached).
+    """
+    global _target_names_settings
+    settings = get_settings()
+    if settings is not _target_names_settings:
+        _target_names.clear()
+        _target_names_settings = settings
+
+    key = (profile_id, capability)
+    if key in _target_names:
+        return _target_names[key]
+
+    target_name = None
+    profile = settings.get_profile(profile_id)
+    if profile is not None:
+        spec = profile.find_container_for_capability(capability)
+        if spec is not None:
+            target_name = spec.name
+    _target_names[key] = target_name
+    return target_name
+
+
+# (endpoint, runtime_type, preverified) for one capability of a session
+_Route = tuple[str | None, str, bool]
+
+_ROUTES_KEY = "bay.capability_routes"
+
+
+def _session_routes(session: Session) -> dict[str, _Route]:
+    """Per-session capability route memo, reset when `containers` is reassigned.
+
+    Kept on the ORM instance state like the session's container index.
+    """
+    containers = session.containers
+    info = sa_inspect(session).info
+    cached = info.get(_ROUTES_KEY)
+    if cached is not None and cached[0] is containers:
+        return cached[1]
+    routes: dict[str, _Route] = {}
+    info[_ROUTES_KEY] = (containers, routes)
+    return routes
+
+
 class CapabilityRouter:
     """Routes capability requests to the appropriate runtime adapter."""
 
@@ -35,14 +92,19 @@ class CapabilityRouter:
         sandbox_mgr: SandboxManager,
         *,
         adapter_pool: AdapterPool[BaseAdapter] | None = None,
+        session_cache: RunningSessionCache | None = None,
     ) -> None:
         self._sandbox_mgr = sandbox_mgr
         self._log = logger.bind(component="capability_router")
         self._adapter_pool = default_adapter_pool if adapter_pool is None else adapter_pool
+        self._session_cache = running_session_cache if session_cache is None else session_cache
 
     async def ensure_session(self, sandbox: Sandbox) -> Session:
         """Ensure sandbox has a running session.
 
+        A session recently observed RUNNING is served from the process-wide
+        running-session cache without going through SandboxManager.
+
         Args:
             sandbox: Sandbox to ensure is running
 
@@ -52,9 +114,22 @@ class CapabilityRouter:
         Raises:
             SessionNotReadyError: If session is starting
         """
-        return await self._sandbox_mgr.ensure_running(sandbox)
+        session = self._session_cache.get(sandbox.id)
+        if session is not None:
+            return session
+
+        session = await self._sandbox_mgr.ensure_running(sandbox)
+        if session.observed_state == SessionStatus.RUNNING:
+            self._session_cache.put(sandbox.id, session)
+        return session
 
     def _get_adapter(self, session: Session, *, capability: str | None = None) -> BaseAdapter:
+        """Get or create adapter for session (see `_route`)."""
+        return self._route(session, capability=capability)[0]
+
+    def _route(
+        self, session: Session, *, capability: str | None = None
+    ) -> tuple[BaseAdapter, bool]:
         """Get or create adapter for session.
 
         Phase 2:
@@ -73,49 +148,23 @@ class CapabilityRouter:
         Args:
             session: Session to get adapter for
             capability: Optional capability to route to the correct container
+
+        Returns:
+            (adapter, preverified): preverified is True when the routed
+            container itself declares `capability`, so the runtime `/meta`
+            check can be skipped.
         """
         endpoint: str | None = None
         runtime_type: str = session.runtime_type
+        preverified = False
 
-        # Phase 2: Multi-container routing
-        if capability and session.is_multi_container and session.containers:
-            # Prefer routing via profile (supports primary_for semantics)
-            profile = None
-            try:
-                # Local import to avoid creating a hard dependency at module import time
-                from app.config import get_settings
-
-                profile = get_settings().get_profile(session.profile_id)
-            except Exception:
-                profile = None
-
-            target_name: str | None = None
-            if profile is not None:
-                spec = profile.find_container_for_capability(capability)
-                if spec is not None:
-                    target_name = spec.name
-
-            container_dict = None
-            if target_name is not None:
-                for c in session.containers:
-                    if c.get("name") == target_name:
-                        container_dict = c
-                        break
-
-            # Fallback: first container that declares capability (order preserved)
-            if container_dict is None:
-                container_dict = session.get_container_for_capability(capability)
-
-            if container_dict:
-                endpoint = container_dict.get("endpoint")
-                runtime_type = container_dict.get("runtime_type", "ship")
-            else:
-                # Capability not found in any container
-                raise CapabilityNotSupportedError(
-                    message=f"No container provides capability: {capability}",
-                    capability=capability,
-                    available=self._get_all_session_capabilities(session),
-                )
+        # Phase 2: Multi-container routing, decided once per session containers
+        if capability and session.is_multi_container:
+            routes = _session_routes(session)
+            route = routes.get(capability)
+            if route is None:
+                route = routes[capability] = self._route_multi(session, capability)
+            endpoint, runtime_type, preverified = route
 
         # Fallback to primary container endpoint
         if endpoint is None:
@@ -127,31 +176,49 @@ class CapabilityRouter:
                 sandbox_id=session.sandbox_id,
             )
 
-        final_endpoint = endpoint
-        final_runtime_type = runtime_type
-
-        def factory() -> BaseAdapter:
-            if final_runtime_type == "ship":
-                return ShipAdapter(final_endpoint)
-            if final_runtime_type == "gull":
-                return GullAdapter(final_endpoint)
-            raise ValueError(f"Unknown runtime type: {final_runtime_type}")
+        adapter_cls = ADAPTER_CLASSES.get(runtime_type)
+        if adapter_cls is None:
+            raise ValueError(f"Unknown runtime type: {runtime_type}")
 
         # Use endpoint + runtime_type as cache key to prevent stale adapter
         # when Docker reassigns a host port previously used by a different
         # runtime type (e.g., Ship port recycled to Gull).
-        pool_key = f"{final_endpoint}::{final_runtime_type}"
-        return self._adapter_pool.get_or_create(pool_key, factory)
+        pool_key = f"{endpoint}::{runtime_type}"
+        adapter = self._adapter_pool.get_or_create_cls(pool_key, adapter_cls, endpoint)
+        return adapter, preverified
+
+    def _route_multi(self, session: Session, capability: str) -> _Route:
+        """Pick the container serving `capability` in a multi-container session."""
+        # Prefer routing via profile (supports primary_for semantics)
+        target_name = _resolve_target_name(session.profile_id, capability)
+
+        container_dict = None
+        if target_name is not None:
+            container_dict = session.get_container_by_name(target_name)
+
+        # Fallback: first container that declares capability (order preserved)
+        if container_dict is None:
+            container_dict = session.get_container_for_capability(capability)
+
+        if not container_dict:
+            # Capability not found in any container
+            raise CapabilityNotSupportedError(
+                message=f"No container provides capability: {capability}",
+                capability=capability,
+                available=self._get_all_session_capabilities(session),
+            )
+
+        return (
+            container_dict.get("endpoint"),
+            container_dict.get("runtime_type", "ship"),
+            # primary_for may name a container that does not list the capability
+            capability in container_dict.get("capabilities", ()),
+        )
 
     @staticmethod
     def _get_all_session_capabilities(session: Session) -> list[str]:
         """Get all capabilities from all containers in a session."""
-        if not session.containers:
-            return []
-        caps: set[str] = set()
-        for c in session.containers:
-            caps.update(c.get("capabilities", []))
-        return sorted(caps)
+        return session.get_all_capabilities()
 
     async def _require_capability(self, adapter: BaseAdapter, capability: str) -> None:
         """Fail-fast if runtime does not declare the requested capability.
@@ -166,6 +233,24 @@ class CapabilityRouter:
                 available=list(meta.capabilities.keys()),
             )
 
+    async def _resolve(self, sandbox: Sandbox, capability: str) -> tuple[Session, BaseAdapter]:
+        """Ensure the sandbox is running and return a validated adapter.
+
+        Shared preamble of every capability call: ensure_session, route to
+        the container serving `capability`, and fail fast if its runtime
+        does not declare it. The `/meta` check is skipped when multi-container
+        routing picked a container that already declares the capability.
+
+        Raises:
+            SessionNotReadyError: If session is starting or has no endpoint
+            CapabilityNotSupportedError: If no container/runtime provides it
+        """
+        session = await self.ensure_session(sandbox)
+        adapter, preverified = self._route(session, capability=capability)
+        if not preverified:
+            await self._require_capability(adapter, capability)
+        return session, adapter
+
     # -- Python capability --
 
     async def exec_python(
@@ -185,16 +270,15 @@ class CapabilityRouter:
         Returns:
             Execution result
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="python")
-        await self._require_capability(adapter, "python")
-
-        self._log.info(
-            "capability.python.exec",
-            sandbox_id=sandbox.id,
-            session_id=session.id,
-            code_len=len(code),
-        )
+        session, adapter = await self._resolve(sandbox, "python")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.python.exec",
+                sandbox_id=sandbox.id,
+                session_id=session.id,
+                code_len=len(code),
+            )
 
         return await adapter.exec_python(code, timeout=timeout)
 
@@ -219,16 +303,15 @@ class CapabilityRouter:
         Returns:
             Execution result
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="shell")
-        await self._require_capability(adapter, "shell")
-
-        self._log.info(
-            "capability.shell.exec",
-            sandbox_id=sandbox.id,
-            session_id=session.id,
-            command=command[:100],
-        )
+        session, adapter = await self._resolve(sandbox, "shell")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.shell.exec",
+                sandbox_id=sandbox.id,
+                session_id=session.id,
+                command=command[:100],
+            )
 
         return await adapter.exec_shell(command, timeout=timeout, cwd=cwd)
 
@@ -253,16 +336,15 @@ class CapabilityRouter:
         Returns:
             Execution result
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="browser")
-        await self._require_capability(adapter, "browser")
-
-        self._log.info(
-            "capability.browser.exec",
-            sandbox_id=sandbox.id,
-            session_id=session.id,
-            cmd=cmd[:100],
-        )
+        session, adapter = await self._resolve(sandbox, "browser")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.browser.exec",
+                sandbox_id=sandbox.id,
+                session_id=session.id,
+                cmd=cmd[:100],
+            )
 
         return await adapter.exec_browser(cmd, timeout=timeout)
 
@@ -287,16 +369,15 @@ class CapabilityRouter:
         Returns:
             Raw batch result dict
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="browser")
-        await self._require_capability(adapter, "browser")
-
-        self._log.info(
-            "capability.browser.exec_batch",
-            sandbox_id=sandbox.id,
-            session_id=session.id,
-            num_commands=len(commands),
-        )
+        session, adapter = await self._resolve(sandbox, "browser")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.browser.exec_batch",
+                sandbox_id=sandbox.id,
+                session_id=session.id,
+                num_commands=len(commands),
+            )
 
         return await adapter.exec_browser_batch(
             commands,
@@ -320,15 +401,14 @@ class CapabilityRouter:
         Returns:
             File content
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
+        _, adapter = await self._resolve(sandbox, "filesystem")
 
-        self._log.info(
-            "capability.files.read",
-            sandbox_id=sandbox.id,
-            path=path,
-        )
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.read",
+                sandbox_id=sandbox.id,
+                path=path,
+            )
 
         return await adapter.read_file(path)
 
@@ -345,16 +425,15 @@ class CapabilityRouter:
             path: File path (relative to /workspace)
             content: File content
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
-
-        self._log.info(
-            "capability.files.write",
-            sandbox_id=sandbox.id,
-            path=path,
-            content_len=len(content),
-        )
+        _, adapter = await self._resolve(sandbox, "filesystem")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.write",
+                sandbox_id=sandbox.id,
+                path=path,
+                content_len=len(content),
+            )
 
         await adapter.write_file(path, content)
 
@@ -372,15 +451,14 @@ class CapabilityRouter:
         Returns:
             List of file entries
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
+        _, adapter = await self._resolve(sandbox, "filesystem")
 
-        self._log.info(
-            "capability.files.list",
-            sandbox_id=sandbox.id,
-            path=path,
-        )
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.list",
+                sandbox_id=sandbox.id,
+                path=path,
+            )
 
         return await adapter.list_files(path)
 
@@ -395,15 +473,14 @@ class CapabilityRouter:
             sandbox: Target sandbox
             path: File/directory path (relative to /workspace)
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
+        _, adapter = await self._resolve(sandbox, "filesystem")
 
-        self._log.info(
-            "capability.files.delete",
-            sandbox_id=sandbox.id,
-            path=path,
-        )
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.delete",
+                sandbox_id=sandbox.id,
+                path=path,
+            )
 
         await adapter.delete_file(path)
 
@@ -413,25 +490,28 @@ class CapabilityRouter:
         self,
         sandbox: Sandbox,
         path: str,
-        content: bytes,
+        content: bytes | AsyncIterable[bytes],
+        *,
+        size: int | None = None,
     ) -> None:
         """Upload binary file to sandbox.
 
         Args:
             sandbox: Target sandbox
             path: Target path (relative to /workspace)
-            content: File content as bytes
+            content: File content as bytes, or an async iterable of chunks
+                that is streamed to the runtime
+            size: Content length for logging when `content` is streamed
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
-
-        self._log.info(
-            "capability.files.upload",
-            sandbox_id=sandbox.id,
-            path=path,
-            content_len=len(content),
-        )
+        _, adapter = await self._resolve(sandbox, "filesystem")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.upload",
+                sandbox_id=sandbox.id,
+                path=path,
+                content_len=len(content) if isinstance(content, bytes) else size,
+            )
 
         await adapter.upload_file(path, content)
 
@@ -449,14 +529,42 @@ class CapabilityRouter:
         Returns:
             File content as bytes
         """
-        session = await self.ensure_session(sandbox)
-        adapter = self._get_adapter(session, capability="filesystem")
-        await self._require_capability(adapter, "filesystem")
+        _, adapter = await self._resolve(sandbox, "filesystem")
 
-        self._log.info(
-            "capability.files.download",
-            sandbox_id=sandbox.id,
-            path=path,
-        )
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.download",
+                sandbox_id=sandbox.id,
+                path=path,
+            )
 
         return await adapter.download_file(path)
+
+    async def download_file_stream(
+        self,
+        sandbox: Sandbox,
+        path: str,
+    ) -> AsyncIterator[bytes]:
+        """Download file from sandbox in chunks.
+
+        Routing and runtime errors surface on the first iteration.
+
+        Args:
+            sandbox: Target sandbox
+            path: File path (relative to /workspace)
+
+        Yields:
+            File content chunks
+        """
+        _, adapter = await self._resolve(sandbox, "filesystem")
+
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "capability.files.download",
+                sandbox_id=sandbox.id,
+                path=path,
+                streaming=True,
+            )
+
+        async for chunk in adapter.download_file_stream(path):
+            yield chunk
@@ -6,6 +6,7 @@ and credentials file output.
 
 from __future__ import annotations
 
+import binascii
 import hashlib
 import hmac
 import json
@@ -16,18 +17,33 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
+from sqlalchemy import exists
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.config import Settings
 from app.models.api_key import ApiKey
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 logger = structlog.get_logger()
 
 # Key format: sk-bay-{64 hex chars}
 _KEY_PREFIX = "sk-bay-"
 _KEY_DISPLAY_LEN = 12  # chars to store as key_prefix for identification
 
+# Dialects whose insert() supports ON CONFLICT (key_hash) DO NOTHING.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# hashlib.sha256 is already OpenSSL's EVP implementation (SHA-NI where the
+# CPU has it); bind it once so the auth hot path skips the module lookup.
+_sha256 = hashlib.sha256
+
 
 class ApiKeyService:
     """Service for API key lifecycle management."""
@@ -39,58 +55,87 @@ class ApiKeyService:
         Returns:
             Tuple of (plaintext, key_hash, key_prefix)
         """
-        random_part = secrets.token_hex(32)  # 64 hex chars
+        random_part = binascii.b2a_hex(secrets.token_bytes(32)).decode("ascii")  # 64 hex chars
         plaintext = f"{_KEY_PREFIX}{random_part}"
         key_hash = ApiKeyService.hash_key(plaintext)
-        key_prefix = plaintext[:_KEY_DISPLAY_LEN]
+        key_prefix = ApiKeyService.key_prefix(plaintext)
         return plaintext, key_hash, key_prefix
 
     @staticmethod
-    def hash_key(plaintext: str) -> str:
+    def key_prefix(plaintext: str) -> str:
+        """Return the stored identification prefix of a plaintext key."""
+        return plaintext[:_KEY_DISPLAY_LEN]
+
+    @staticmethod
+    def hash_key(plaintext: str | bytes) -> str:
         """Hash a plaintext key using SHA-256.
 
         Args:
-            plaintext: The plaintext API key
+            plaintext: The plaintext API key; callers already holding bytes
+                pass them as-is to skip the encode
 
         Returns:
             SHA-256 hex digest
         """
-        return hashlib.sha256(plaintext.encode()).hexdigest()
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode()
+        return _sha256(plaintext).hexdigest()
+
+    @staticmethod
+    def digest_key(plaintext: str | bytes) -> bytes:
+        """Return the raw SHA-256 digest of a plaintext key.
+
+        This is the lookup key of the in-memory auth map; it skips the hex
+        encoding that hash_key does for storage.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode()
+        return _sha256(plaintext).digest()
 
     @staticmethod
-    def verify_key(plaintext: str, key_hash: str) -> bool:
+    def verify_key(plaintext: str | bytes, key_hash: str) -> bool:
         """Verify a plaintext key against a stored hash.
 
         Args:
-            plaintext: The plaintext API key to verify
+            plaintext: The plaintext API key to verify (str or bytes)
             key_hash: The stored SHA-256 hash
 
         Returns:
             True if the key matches
         """
-        return hmac.compare_digest(
-            hashlib.sha256(plaintext.encode()).hexdigest(),
-            key_hash,
-        )
+        return hmac.compare_digest(ApiKeyService.hash_key(plaintext), key_hash)
 
     @staticmethod
-    async def load_active_key_hashes(db: AsyncSession) -> dict[str, str]:
+    async def load_active_key_hashes(db: AsyncSession) -> dict[bytes, str]:
         """Load all active key hashes from DB into memory.
 
+        key_hash stays hex in the DB; the map is keyed by the raw digest so
+        auth can probe it with digest_key() directly.
+
         Returns:
-            Dict mapping key_hash → owner
+            Dict mapping raw SHA-256 digest → owner
         """
+        # Two columns only: no ORM instances are built for the key rows.
         result = await db.execute(
-            select(ApiKey).where(ApiKey.is_active == True)  # noqa: E712
+            select(ApiKey.key_hash, ApiKey.owner).where(ApiKey.is_active.is_(True))
         )
-        keys = result.scalars().all()
-        return {k.key_hash: k.owner for k in keys}
+        return {bytes.fromhex(key_hash): owner for key_hash, owner in result.all()}
+
+    @staticmethod
+    async def load_active_key_prefixes(db: AsyncSession) -> frozenset[str]:
+        """Load the key_prefix of every active key.
+
+        Auth rejects a token whose prefix is not in this set before hashing
+        it, so scans with garbage tokens cost a set probe, not a SHA-256.
+        """
+        result = await db.execute(select(ApiKey.key_prefix).where(ApiKey.is_active.is_(True)))
+        return frozenset(result.scalars().all())
 
     @staticmethod
     async def auto_provision(
         db: AsyncSession,
         settings: Settings,
-    ) -> dict[str, str]:
+    ) -> dict[bytes, str]:
         """Auto-provision API key on first boot.
 
         Logic:
@@ -104,7 +149,7 @@ class ApiKeyService:
             settings: Application settings
 
         Returns:
-            Dict mapping key_hash → owner (for in-memory cache)
+            Dict mapping raw SHA-256 digest → owner (for in-memory cache)
         """
 
         # 1. Resolve configured key source with precedence:
@@ -118,20 +163,16 @@ class ApiKeyService:
         # 2. If a configured key exists, seed it to DB and return hashes
         if configured_key:
             key_hash = ApiKeyService.hash_key(configured_key)
-            key_prefix = configured_key[:_KEY_DISPLAY_LEN]
-
-            # Check if already seeded
-            existing = await db.execute(select(ApiKey).where(ApiKey.key_hash == key_hash))
-            if not existing.scalars().first():
-                api_key = ApiKey(
-                    id=str(uuid.uuid4()),
-                    key_hash=key_hash,
-                    key_prefix=key_prefix,
-                    owner="default",
-                    is_active=True,
-                )
-                db.add(api_key)
-                await db.flush()
+            key_prefix = ApiKeyService.key_prefix(configured_key)
+
+            api_key = ApiKey(
+                id=str(uuid.uuid4()),
+                key_hash=key_hash,
+                key_prefix=key_prefix,
+                owner="default",
+                is_active=True,
+            )
+            if await ApiKeyService._insert_if_new(db, api_key):
                 logger.info(
                     "api_key.provision.configured",
                     source=source,
@@ -142,10 +183,7 @@ class ApiKeyService:
             return await ApiKeyService.load_active_key_hashes(db)
 
         # 3. Check DB for existing keys
-        existing_keys = await db.execute(
-            select(ApiKey).where(ApiKey.is_active == True)  # noqa: E712
-        )
-        if existing_keys.scalars().first():
+        if await db.scalar(select(exists().where(ApiKey.is_active.is_(True)))):
             logger.debug("api_key.provision.skip", reason="active keys exist in DB")
             return await ApiKeyService.load_active_key_hashes(db)
 
@@ -173,7 +211,39 @@ class ApiKeyService:
         endpoint = f"http://{settings.server.host}:{settings.server.port}"
         ApiKeyService.write_credentials_file(data_dir, plaintext, endpoint)
 
-        return {key_hash: "default"}
+        return {bytes.fromhex(key_hash): "default"}
+
+    @staticmethod
+    async def _insert_if_new(db: AsyncSession, api_key: ApiKey) -> bool:
+        """Insert `api_key` unless a key with the same hash already exists.
+
+        On PostgreSQL and SQLite this is a single INSERT ... ON CONFLICT DO
+        NOTHING, which also holds when several instances boot at once.
+        Other dialects fall back to a lookup followed by an insert, as does
+        a database where auto-migrate could not create uq_api_keys_key_hash.
+
+        Returns:
+            True if the key was inserted
+        """
+        insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if insert is not None:
+            try:
+                async with db.begin_nested():
+                    result = await db.execute(
+                        insert(ApiKey)
+                        .values(**api_key.model_dump())
+                        .on_conflict_do_nothing(index_elements=["key_hash"])
+                    )
+                return result.rowcount == 1
+            except DBAPIError as e:
+                # No unique index to use as the conflict target.
+                logger.warning("api_key.upsert_unavailable", error=str(e))
+
+        if await db.scalar(select(exists().where(ApiKey.key_hash == api_key.key_hash))):
+            return False
+        db.add(api_key)
+        await db.flush()
+        return True
 
     @staticmethod
     def write_credentials_file(
@@ -197,18 +267,37 @@ class ApiKeyService:
         cred_path = data_dir / "credentials.json"
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        cred_path.write_text(json.dumps(credentials, indent=2) + "\n")
+        if orjson is not None:
+            data = orjson.dumps(credentials, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(credentials, indent=2) + "\n").encode()
 
-        # Set file permissions to 0600 (owner read/write only)
+        # Write a 0600 temp file, fsync it and rename it over the target: the
+        # key is never readable by others, and a crash leaves either the old
+        # file or the complete new one, never a truncated one.
+        tmp_path = cred_path.with_name(cred_path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         try:
-            os.chmod(cred_path, 0o600)
-        except OSError:
-            # Windows or restricted environments may not support chmod
-            logger.warning(
-                "api_key.credentials.chmod_failed",
-                path=str(cred_path),
-                msg="Could not set file permissions to 0600",
-            )
+            with os.fdopen(fd, "wb") as f:
+                # The open() mode only applies to new files; tighten a stale
+                # temp file left by a crash before the key is written into it.
+                if hasattr(os, "fchmod"):
+                    try:
+                        os.fchmod(fd, 0o600)
+                    except OSError:
+                        # Restricted filesystems may not support chmod
+                        logger.warning(
+                            "api_key.credentials.chmod_failed",
+                            path=str(cred_path),
+                            msg="Could not set file permissions to 0600",
+                        )
+                f.write(data)
+                f.flush()
+                os.fsync(fd)
+            os.replace(tmp_path, cred_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         logger.info(
             "api_key.credentials.written",
@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass, field
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Opens an independent db session; tasks given one may process items concurrently.
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 
 @dataclass
@@ -15,12 +27,14 @@ class GCResult:
         cleaned_count: Number of resources successfully cleaned
         skipped_count: Number of resources skipped (e.g., conditions not met)
         errors: List of error messages for failed cleanups
+        duration_ms: Wall time of the task run, set by the scheduler
     """
 
     task_name: str = ""
     cleaned_count: int = 0
     skipped_count: int = 0
     errors: list[str] = field(default_factory=list)
+    duration_ms: int = 0
 
     @property
     def success(self) -> bool:
@@ -64,3 +78,22 @@ class GCTask(ABC):
             GCResult with cleanup statistics
         """
         ...
+
+
+async def run_bounded(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int,
+) -> list[R | BaseException]:
+    """Run `worker` over `items` with at most `limit` in flight.
+
+    Results keep the order of `items`; a worker exception is returned in
+    place of its result instead of cancelling the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def guarded(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(guarded(item) for item in items), return_exceptions=True)
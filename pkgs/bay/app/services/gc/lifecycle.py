@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
+
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_driver
 from app.config import get_settings
 from app.db.session import get_async_session
-from app.services.gc.base import GCTask
+from app.services.gc.base import GCResult, GCTask
 from app.services.gc.scheduler import GCScheduler
 from app.services.gc.tasks import (
     ExpiredSandboxGC,
@@ -22,41 +26,6 @@ logger = structlog.get_logger()
 _gc_scheduler: GCScheduler | None = None
 
 
-def _create_gc_tasks_factory():
-    """Create a factory function that produces GC tasks with fresh db sessions.
-
-    Each GC cycle will create new db sessions for its tasks, ensuring
-    proper transaction isolation and avoiding stale session issues.
-
-    Returns:
-        List of GCTask instances
-    """
-    settings = get_settings()
-    driver = get_driver()
-    gc_config = settings.gc
-
-    async def create_tasks():
-        """Create tasks with fresh db sessions."""
-        async with get_async_session() as db_session:
-            tasks: list[GCTask] = []
-
-            if gc_config.idle_session.enabled:
-                tasks.append(IdleSessionGC(driver, db_session))
-
-            if gc_config.expired_sandbox.enabled:
-                tasks.append(ExpiredSandboxGC(driver, db_session))
-
-            if gc_config.orphan_cargo.enabled:
-                tasks.append(OrphanCargoGC(driver, db_session))
-
-            if gc_config.orphan_container.enabled:
-                tasks.append(OrphanContainerGC(driver, db_session, gc_config))
-
-            return tasks
-
-    return create_tasks
-
-
 class SessionPerCycleGCScheduler(GCScheduler):
     """GC Scheduler that creates fresh db sessions for each cycle.
 
@@ -65,46 +34,76 @@ class SessionPerCycleGCScheduler(GCScheduler):
     """
 
     def __init__(self, config):
-        # Initialize with empty tasks - they'll be created per-cycle
-        super().__init__(tasks=[], config=config)
+        # Initialize with empty tasks - they'll be created per-cycle.
+        # Tasks only overlap off SQLite, which has a single write lock.
+        super().__init__(
+            tasks=[], config=config, concurrent=not get_settings().database.is_sqlite
+        )
         self._config = config
         self._driver = get_driver()
+        # Enabled tasks are fixed by config; resolve them once, not per cycle
+        self._task_factories = self._build_task_factories()
+
+    def _build_task_factories(self) -> list[tuple[str, Callable[[AsyncSession], GCTask]]]:
+        """Build one (task name, task factory) pair per enabled GC task."""
+        gc_config = self._config
+        driver = self._driver
+
+        factories: list[tuple[str, Callable[[AsyncSession], GCTask]]] = []
+
+        # Per-sandbox work in these tasks runs concurrently, one session each
+        per_sandbox = {
+            "session_factory": get_async_session,
+            "max_concurrency": gc_config.get_max_concurrent_sandboxes(
+                get_settings().database
+            ),
+        }
+
+        if gc_config.idle_session.enabled:
+            factories.append(
+                ("idle_session", lambda db: IdleSessionGC(driver, db, **per_sandbox))
+            )
+
+        if gc_config.expired_sandbox.enabled:
+            factories.append(
+                ("expired_sandbox", lambda db: ExpiredSandboxGC(driver, db, **per_sandbox))
+            )
+
+        if gc_config.orphan_cargo.enabled:
+            factories.append(("orphan_cargo", lambda db: OrphanCargoGC(driver, db)))
+
+        if gc_config.orphan_container.enabled:
+            factories.append(
+                ("orphan_container", lambda db: OrphanContainerGC(driver, db, gc_config))
+            )
+
+        return factories
+
+    async def _run_task_in_session(
+        self, factory: Callable[[AsyncSession], GCTask]
+    ) -> GCResult:
+        """Run one task on its own db session.
+
+        Tasks may run concurrently and an AsyncSession allows only one query
+        in flight, so each task gets a fresh session.
+        """
+        async with get_async_session() as db_session:
+            return await self._run_task(factory(db_session))
 
     async def _run_cycle(self):
         """Execute one GC cycle with fresh db sessions."""
-        settings = get_settings()
-        gc_config = settings.gc
-
         self._log.info("gc.cycle.start")
 
-        results = []
+        results: list[GCResult] = []
 
         async with self._coordinator.acquire() as acquired:
             if not acquired:
                 self._log.info("gc.cycle.skipped", reason="coordination_lock_not_acquired")
                 return results
 
-            # Create fresh db session for this cycle
-            async with get_async_session() as db_session:
-                # Build tasks with fresh session
-                tasks: list[GCTask] = []
-
-                if gc_config.idle_session.enabled:
-                    tasks.append(IdleSessionGC(self._driver, db_session))
-
-                if gc_config.expired_sandbox.enabled:
-                    tasks.append(ExpiredSandboxGC(self._driver, db_session))
-
-                if gc_config.orphan_cargo.enabled:
-                    tasks.append(OrphanCargoGC(self._driver, db_session))
-
-                if gc_config.orphan_container.enabled:
-                    tasks.append(OrphanContainerGC(self._driver, db_session, gc_config))
-
-                # Execute tasks
-                for task in tasks:
-                    result = await self._run_task(task)
-                    results.append(result)
+            results = await self._run_tasks(
+                [(name, partial(self._run_task_in_session, f)) for name, f in self._task_factories]
+            )
 
         self._log.info(
             "gc.cycle.complete",
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
@@ -15,13 +18,22 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Tasks that collect what the rest of the cycle leaves behind start only once
+# the others have finished: OrphanCargoGC must not race the managed-cargo
+# cascade of ExpiredSandboxGC for the same cargo row and volume.
+_RUNS_LAST = frozenset({"orphan_cargo"})
+
+# (task name, coroutine function running that task)
+TaskRunner = tuple[str, Callable[[], Awaitable[GCResult]]]
+
 
 class GCScheduler:
     """Scheduler for GC tasks.
 
     Responsibilities:
     - Manage background loop for periodic GC execution
-    - Execute tasks serially in defined order
+    - Execute tasks in order (or overlapped when `concurrent`), reporting
+      results in defined order
     - Handle task errors without stopping the scheduler
     - Coordinate with other instances (via coordinator)
 
@@ -46,15 +58,20 @@ class GCScheduler:
         tasks: list[GCTask],
         config: "GCConfig",
         coordinator: GCCoordinator | None = None,
+        *,
+        concurrent: bool = False,
     ) -> None:
         """Initialize GC scheduler.
 
         Args:
-            tasks: List of GC tasks to execute (in order)
+            tasks: List of GC tasks to execute (results keep this order)
             config: GC configuration
             coordinator: Coordination strategy (default: NoopCoordinator)
+            concurrent: Overlap the tasks of a cycle. Leave off on SQLite,
+                where overlapping writers contend for the single write lock.
         """
         self._tasks = tasks
+        self._concurrent = concurrent
         self._config = config
         self._coordinator = coordinator or NoopCoordinator()
         self._log = logger.bind(service="gc_scheduler")
@@ -62,6 +79,8 @@ class GCScheduler:
         # Background loop state
         self._running = False
         self._task: asyncio.Task | None = None
+        # Set by stop(); wakes the loop out of its interval wait
+        self._stop_event = asyncio.Event()
 
         # Mutex to prevent concurrent run_once / background loop overlap
         self._run_lock = asyncio.Lock()
@@ -94,9 +113,9 @@ class GCScheduler:
                 self._log.info("gc.cycle.skipped", reason="coordination_lock_not_acquired")
                 return results
 
-            for task in self._tasks:
-                result = await self._run_task(task)
-                results.append(result)
+            results = await self._run_tasks(
+                [(t.name, partial(self._run_task, t)) for t in self._tasks]
+            )
 
         self._log.info(
             "gc.cycle.complete",
@@ -106,13 +125,33 @@ class GCScheduler:
 
         return results
 
+    async def _run_tasks(self, runners: list[TaskRunner]) -> list[GCResult]:
+        """Run one cycle's tasks; results keep the order of `runners`.
+
+        Serial unless the scheduler is concurrent. When concurrent, tasks in
+        _RUNS_LAST still wait for the others. Runners never raise.
+        """
+        if not self._concurrent:
+            return [await run() for _, run in runners]
+
+        results: dict[int, GCResult] = {}
+        first = [(i, run) for i, (name, run) in enumerate(runners) if name not in _RUNS_LAST]
+        last = [(i, run) for i, (name, run) in enumerate(runners) if name in _RUNS_LAST]
+        for stage in (first, last):
+            stage_results = await asyncio.gather(*(run() for _, run in stage))
+            for (i, _), result in zip(stage, stage_results, strict=True):
+                results[i] = result
+        return [results[i] for i in range(len(runners))]
+
     async def _run_task(self, task: GCTask) -> GCResult:
         """Execute a single GC task with error handling."""
         self._log.info("gc.task.start", task=task.name)
+        started_ns = time.monotonic_ns()
 
         try:
             result = await task.run()
             result.task_name = task.name
+            result.duration_ms = (time.monotonic_ns() - started_ns) // 1_000_000
 
             self._log.info(
                 "gc.task.complete",
@@ -120,6 +159,7 @@ class GCScheduler:
                 cleaned=result.cleaned_count,
                 skipped=result.skipped_count,
                 errors=len(result.errors),
+                duration_ms=result.duration_ms,
             )
 
             if result.errors:
@@ -133,12 +173,16 @@ class GCScheduler:
             return result
 
         except Exception as e:
+            result = GCResult(
+                task_name=task.name,
+                duration_ms=(time.monotonic_ns() - started_ns) // 1_000_000,
+            )
             self._log.exception(
                 "gc.task.failed",
                 task=task.name,
                 error=str(e),
+                duration_ms=result.duration_ms,
             )
-            result = GCResult(task_name=task.name)
             result.add_error(f"Task failed: {e}")
             return result
 
@@ -153,6 +197,7 @@ class GCScheduler:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._background_loop())
         self._log.info(
             "gc.scheduler.started",
@@ -169,14 +214,11 @@ class GCScheduler:
 
         self._log.info("gc.scheduler.stopping")
         self._running = False
+        # Wake the interval wait; an in-flight cycle runs to completion.
+        self._stop_event.set()
 
         if self._task is not None:
-            # Cancel the sleep, not the task execution
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            await self._task
             self._task = None
 
         self._log.info("gc.scheduler.stopped")
@@ -194,11 +236,8 @@ class GCScheduler:
             should_sleep = (first_iteration and self._config.run_on_startup) or (
                 not first_iteration
             )
-            if should_sleep:
-                try:
-                    await asyncio.sleep(self._config.interval_seconds)
-                except asyncio.CancelledError:
-                    break
+            if should_sleep and await self._wait_for_stop(self._config.interval_seconds):
+                break
 
             first_iteration = False
 
@@ -206,3 +245,11 @@ class GCScheduler:
                 await self.run_once()
             except Exception as e:
                 self._log.exception("gc.scheduler.cycle_error", error=str(e))
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds; return True if stop() was requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
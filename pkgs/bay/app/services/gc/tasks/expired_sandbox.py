@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 import structlog
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -13,7 +17,7 @@ from app.managers.cargo import CargoManager
 from app.managers.session import SessionManager
 from app.models.sandbox import Sandbox
 from app.models.session import Session
-from app.services.gc.base import GCResult, GCTask
+from app.services.gc.base import GCResult, GCTask, SessionFactory, run_bounded
 from app.utils.datetime import utcnow
 
 if TYPE_CHECKING:
@@ -40,12 +44,26 @@ class ExpiredSandboxGC(GCTask):
         self,
         driver: "Driver",
         db_session: AsyncSession,
+        *,
+        session_factory: SessionFactory | None = None,
+        max_concurrency: int = 1,
     ) -> None:
+        """Initialize the task.
+
+        Args:
+            driver: Runtime driver
+            db_session: Session for the scan (and for items without a factory)
+            session_factory: Opens one session per sandbox; required for
+                max_concurrency > 1 since an AsyncSession is not concurrent
+            max_concurrency: Sandboxes processed at once
+        """
         self._driver = driver
         self._db = db_session
         self._log = logger.bind(gc_task="expired_sandbox")
         self._session_mgr = SessionManager(driver, db_session)
         self._cargo_mgr = CargoManager(driver, db_session)
+        self._session_factory = session_factory
+        self._max_concurrency = max_concurrency if session_factory is not None else 1
 
     @property
     def name(self) -> str:
@@ -58,115 +76,136 @@ class ExpiredSandboxGC(GCTask):
 
         # Start a fresh transaction to see latest committed data.
         # This is safe because:
-        # 1. GC tasks run sequentially (not concurrently)
-        # 2. Previous task always commits before next task runs
-        # 3. This task hasn't made any changes yet at this point
+        # 1. Each GC task runs on its own db session
+        # 2. This task hasn't made any changes yet at this point
         # Without this, SQLite may serve stale data from a long-lived transaction.
         await self._db.rollback()
 
         # Find sandboxes with expired TTL
         # Exclude warm pool sandboxes (§6.4 scheme A):
         # warm pool instances are managed by WarmPoolScheduler, not GC
-        query = select(Sandbox).where(
+        # Project only the columns processing needs: plain rows, no ORM
+        # objects to expire (and lazy-load) after the rollbacks below.
+        query = select(Sandbox.id, Sandbox.owner, Sandbox.cargo_id).where(
             Sandbox.deleted_at.is_(None),
             Sandbox.expires_at.is_not(None),
             Sandbox.expires_at < now,
             Sandbox.is_warm_pool.is_(False),
         )
 
-        db_result = await self._db.execute(query)
-        sandboxes = db_result.scalars().all()
-
-        # Extract needed attributes upfront to avoid lazy loading issues after rollback.
-        # After _process_sandbox calls rollback, the sandbox objects become detached
-        # and accessing their attributes would trigger lazy loading in wrong context.
-        sandbox_data = [(sandbox.id, sandbox.owner, sandbox.cargo_id) for sandbox in sandboxes]
+        sandbox_data = (await self._db.execute(query)).all()
+        if self._session_factory is not None:
+            # Items run on their own sessions; don't keep the scan open meanwhile.
+            await self._db.rollback()
 
         self._log.info(
             "gc.expired_sandbox.found",
             count=len(sandbox_data),
         )
 
-        for sandbox_id, owner, cargo_id in sandbox_data:
-            try:
-                cleaned = await self._process_sandbox(sandbox_id, owner, cargo_id)
-                if cleaned:
-                    result.cleaned_count += 1
-                else:
-                    result.skipped_count += 1
-            except Exception as e:
-                self._log.exception(
+        outcomes = await run_bounded(
+            sandbox_data,
+            lambda item: self._process_sandbox(*item, now=now),
+            self._max_concurrency,
+        )
+        for (sandbox_id, _, _), outcome in zip(sandbox_data, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                self._log.error(
                     "gc.expired_sandbox.item_error",
                     sandbox_id=sandbox_id,
-                    error=str(e),
+                    error=str(outcome),
+                    exc_info=outcome,
                 )
-                result.add_error(f"sandbox {sandbox_id}: {e}")
+                result.add_error(f"sandbox {sandbox_id}: {outcome}")
+            elif outcome:
+                result.cleaned_count += 1
+            else:
+                result.skipped_count += 1
 
         return result
 
-    async def _process_sandbox(self, sandbox_id: str, owner: str, cargo_id: str) -> bool:
-        """Process a single sandbox. Returns True if cleaned, False if skipped."""
+    @asynccontextmanager
+    async def _item_scope(
+        self,
+    ) -> AsyncIterator[tuple[AsyncSession, SessionManager, CargoManager]]:
+        """Yield the db session and managers for one sandbox."""
+        if self._session_factory is None:
+            yield self._db, self._session_mgr, self._cargo_mgr
+            return
+        async with self._session_factory() as db:
+            yield db, SessionManager(self._driver, db), CargoManager(self._driver, db)
+
+    async def _process_sandbox(
+        self, sandbox_id: str, owner: str, cargo_id: str, *, now: datetime
+    ) -> bool:
+        """Process a single sandbox. Returns True if cleaned, False if skipped.
+
+        `now` is the scan's reference time; re-checking against it rather than
+        a fresh clock only skips more, never deletes a sandbox the scan missed.
+        """
         lock = await get_sandbox_lock(sandbox_id)
-        async with lock:
-            # Rollback and refetch to get fresh state
-            await self._db.rollback()
-
-            query = select(Sandbox).where(Sandbox.id == sandbox_id).with_for_update()
-            db_result = await self._db.execute(query)
-            sandbox = db_result.scalars().first()
-
-            if sandbox is None or sandbox.deleted_at is not None:
-                self._log.debug(
-                    "gc.expired_sandbox.skip.deleted",
-                    sandbox_id=sandbox_id,
+        async with lock, self._item_scope() as (db, session_mgr, cargo_mgr):
+            # Start from fresh state
+            await db.rollback()
+
+            # Check and soft delete in one statement. A TTL the user extended
+            # past the scan time, or a concurrent delete, matches no row; no
+            # SELECT ... FOR UPDATE and no ORM flush are needed.
+            soft_delete = (
+                update(Sandbox)
+                .where(
+                    Sandbox.id == sandbox_id,
+                    Sandbox.deleted_at.is_(None),
+                    Sandbox.expires_at.is_not(None),
+                    Sandbox.expires_at < now,
                 )
-                return False
-
-            # Double-check: user may have extended TTL while we waited for lock
-            now = utcnow()
-            if sandbox.expires_at is None or sandbox.expires_at >= now:
+                .values(deleted_at=utcnow(), current_session_id=None)
+                .returning(Sandbox.expires_at)
+                .execution_options(synchronize_session=False)
+            )
+            expires_at = (await db.execute(soft_delete)).scalar_one_or_none()
+            if expires_at is None:
                 self._log.debug(
-                    "gc.expired_sandbox.skip.ttl_extended",
+                    "gc.expired_sandbox.skip.not_expired",
                     sandbox_id=sandbox_id,
-                    expires_at=sandbox.expires_at,
                 )
                 return False
 
+            # Commit before the slow driver calls below. The in-memory sandbox
+            # lock stays held, and ensure_running sees deleted_at.
+            await db.commit()
+
             self._log.info(
                 "gc.expired_sandbox.deleting",
                 sandbox_id=sandbox_id,
-                expires_at=sandbox.expires_at.isoformat(),
+                expires_at=expires_at.isoformat(),
                 delete_source="gc.expired_sandbox",
             )
 
-            # Destroy all sessions for this sandbox
-            sessions_result = await self._db.execute(
-                select(Session).where(Session.sandbox_id == sandbox_id)
+            # The sandbox lock keeps new sessions out, so this list is complete.
+            sessions = (
+                (await db.execute(select(Session).where(Session.sandbox_id == sandbox_id)))
+                .scalars()
+                .all()
             )
-            sessions = sessions_result.scalars().all()
 
-            for session in sessions:
-                try:
-                    await self._session_mgr.destroy(session)
-                except Exception as e:
+            # Get workspace for cascade delete
+            cargo = await cargo_mgr.get_by_id(cargo_id)
+
+            # Destroy all sessions for this sandbox
+            errors = await session_mgr.destroy_many(sessions)
+            for session_id, error in errors.items():
+                if error is not None:
                     self._log.warning(
                         "gc.expired_sandbox.session_destroy_error",
-                        session_id=session.id,
-                        error=str(e),
+                        session_id=session_id,
+                        error=str(error),
                     )
 
-            # Get workspace for cascade delete
-            cargo = await self._cargo_mgr.get_by_id(cargo_id)
-
-            # Soft delete sandbox
-            sandbox.deleted_at = utcnow()
-            sandbox.current_session_id = None
-            await self._db.commit()
-
             # Cascade delete managed cargo
             if cargo and cargo.managed:
                 try:
-                    await self._cargo_mgr.delete(
+                    await cargo_mgr.delete(
                         cargo.id,
                         owner,
                         force=True,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 import structlog
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -12,7 +15,7 @@ from app.concurrency.locks import get_sandbox_lock
 from app.managers.session import SessionManager
 from app.models.sandbox import Sandbox
 from app.models.session import Session
-from app.services.gc.base import GCResult, GCTask
+from app.services.gc.base import GCResult, GCTask, SessionFactory, run_bounded
 from app.utils.datetime import utcnow
 
 if TYPE_CHECKING:
@@ -38,11 +41,25 @@ class IdleSessionGC(GCTask):
         self,
         driver: "Driver",
         db_session: AsyncSession,
+        *,
+        session_factory: SessionFactory | None = None,
+        max_concurrency: int = 1,
     ) -> None:
+        """Initialize the task.
+
+        Args:
+            driver: Runtime driver
+            db_session: Session for the scan (and for items without a factory)
+            session_factory: Opens one session per sandbox; required for
+                max_concurrency > 1 since an AsyncSession is not concurrent
+            max_concurrency: Sandboxes processed at once
+        """
         self._driver = driver
         self._db = db_session
         self._log = logger.bind(gc_task="idle_session")
         self._session_mgr = SessionManager(driver, db_session)
+        self._session_factory = session_factory
+        self._max_concurrency = max_concurrency if session_factory is not None else 1
 
     @property
     def name(self) -> str:
@@ -55,60 +72,67 @@ class IdleSessionGC(GCTask):
 
         # Start a fresh transaction to see latest committed data.
         # This is safe because:
-        # 1. GC tasks run sequentially (not concurrently)
-        # 2. Previous task always commits before next task runs
-        # 3. This task hasn't made any changes yet at this point
+        # 1. Each GC task runs on its own db session
+        # 2. This task hasn't made any changes yet at this point
         # Without this, SQLite may serve stale data from a long-lived transaction.
         await self._db.rollback()
 
         # Find sandboxes with expired idle timeout
         # Exclude warm pool sandboxes (managed by WarmPoolScheduler)
-        query = select(Sandbox).where(
+        # Project only the ids: plain values, no ORM objects to expire (and
+        # lazy-load) after the rollbacks below.
+        query = select(Sandbox.id).where(
             Sandbox.deleted_at.is_(None),
             Sandbox.idle_expires_at.is_not(None),
             Sandbox.idle_expires_at < now,
             Sandbox.is_warm_pool.is_(False),
         )
 
-        db_result = await self._db.execute(query)
-        sandboxes = db_result.scalars().all()
-
-        # Extract sandbox IDs upfront to avoid lazy loading issues after rollback.
-        # After _process_sandbox calls rollback, the sandbox objects become detached
-        # and accessing their attributes would trigger lazy loading in wrong context.
-        sandbox_ids = [sandbox.id for sandbox in sandboxes]
+        sandbox_ids = (await self._db.execute(query)).scalars().all()
+        if self._session_factory is not None:
+            # Items run on their own sessions; don't keep the scan open meanwhile.
+            await self._db.rollback()
 
         self._log.info(
             "gc.idle_session.found",
             count=len(sandbox_ids),
         )
 
-        for sandbox_id in sandbox_ids:
-            try:
-                cleaned = await self._process_sandbox(sandbox_id)
-                if cleaned:
-                    result.cleaned_count += 1
-                else:
-                    result.skipped_count += 1
-            except Exception as e:
-                self._log.exception(
+        outcomes = await run_bounded(sandbox_ids, self._process_sandbox, self._max_concurrency)
+        for sandbox_id, outcome in zip(sandbox_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                self._log.error(
                     "gc.idle_session.item_error",
                     sandbox_id=sandbox_id,
-                    error=str(e),
+                    error=str(outcome),
+                    exc_info=outcome,
                 )
-                result.add_error(f"sandbox {sandbox_id}: {e}")
+                result.add_error(f"sandbox {sandbox_id}: {outcome}")
+            elif outcome:
+                result.cleaned_count += 1
+            else:
+                result.skipped_count += 1
 
         return result
 
+    @asynccontextmanager
+    async def _item_scope(self) -> AsyncIterator[tuple[AsyncSession, SessionManager]]:
+        """Yield the db session and session manager for one sandbox."""
+        if self._session_factory is None:
+            yield self._db, self._session_mgr
+            return
+        async with self._session_factory() as db:
+            yield db, SessionManager(self._driver, db)
+
     async def _process_sandbox(self, sandbox_id: str) -> bool:
         """Process a single sandbox. Returns True if cleaned, False if skipped."""
         lock = await get_sandbox_lock(sandbox_id)
-        async with lock:
+        async with lock, self._item_scope() as (db, session_mgr):
             # Rollback and refetch to get fresh state
-            await self._db.rollback()
+            await db.rollback()
 
             query = select(Sandbox).where(Sandbox.id == sandbox_id).with_for_update()
-            db_result = await self._db.execute(query)
+            db_result = await db.execute(query)
             sandbox = db_result.scalars().first()
 
             if sandbox is None or sandbox.deleted_at is not None:
@@ -135,26 +159,28 @@ class IdleSessionGC(GCTask):
             )
 
             # Destroy all sessions for this sandbox
-            sessions_result = await self._db.execute(
+            sessions_result = await db.execute(
                 select(Session).where(Session.sandbox_id == sandbox_id)
             )
             sessions = sessions_result.scalars().all()
 
-            for session in sessions:
-                try:
-                    await self._session_mgr.destroy(session)
-                except Exception as e:
-                    # Log but continue with other sessions
+            errors = await session_mgr.destroy_many(sessions)
+            for session_id, error in errors.items():
+                if error is not None:
                     self._log.warning(
                         "gc.idle_session.session_destroy_error",
-                        session_id=session.id,
-                        error=str(e),
+                        session_id=session_id,
+                        error=str(error),
                     )
 
-            # Clear sandbox session state
-            sandbox.current_session_id = None
-            sandbox.idle_expires_at = None
-            await self._db.commit()
+            # Clear sandbox session state: a plain UPDATE, no unit-of-work flush
+            await db.execute(
+                update(Sandbox)
+                .where(Sandbox.id == sandbox_id)
+                .values(current_session_id=None, idle_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
 
             self._log.info(
                 "gc.idle_session.cleaned",
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import structlog
+from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 from sqlmodel import select
@@ -30,7 +32,8 @@ class OrphanCargoGC(GCTask):
         )
 
     Action:
-        Delete cargo via CargoManager.delete_internal_by_id()
+        Delete cargos not referenced by any runtime via
+        CargoManager.delete_internal_bulk()
     """
 
     def __init__(
@@ -61,6 +64,7 @@ class OrphanCargoGC(GCTask):
             count=len(orphans),
         )
 
+        deletable: list[str] = []
         for cargo_id in orphans:
             try:
                 if await self._has_runtime_references(cargo_id):
@@ -70,20 +74,44 @@ class OrphanCargoGC(GCTask):
                         cargo_id=cargo_id,
                     )
                     continue
+            except Exception as e:
+                self._log.exception(
+                    "gc.orphan_cargo.item_error",
+                    cargo_id=cargo_id,
+                    error=str(e),
+                )
+                result.add_error(f"cargo {cargo_id}: {e}")
+                continue
+            deletable.append(cargo_id)
+
+        if not deletable:
+            return result
+
+        try:
+            outcomes = await self._cargo_mgr.delete_internal_bulk(deletable)
+        except Exception as e:
+            self._log.exception(
+                "gc.orphan_cargo.bulk_error",
+                count=len(deletable),
+                error=str(e),
+            )
+            result.add_error(f"cargo bulk delete ({len(deletable)}): {e}")
+            return result
 
-                await self._cargo_mgr.delete_internal_by_id(cargo_id)
+        for cargo_id, error in outcomes.items():
+            if error is None:
                 result.cleaned_count += 1
                 self._log.info(
                     "gc.orphan_cargo.deleted",
                     cargo_id=cargo_id,
                 )
-            except Exception as e:
-                self._log.exception(
+            else:
+                self._log.error(
                     "gc.orphan_cargo.item_error",
                     cargo_id=cargo_id,
-                    error=str(e),
+                    error=str(error),
                 )
-                result.add_error(f"cargo {cargo_id}: {e}")
+                result.add_error(f"cargo {cargo_id}: {error}")
 
         return result
 
@@ -101,37 +129,27 @@ class OrphanCargoGC(GCTask):
         )
         return len(instances) > 0
 
-    async def _find_orphans(self) -> list[str]:
-        """Find orphan managed cargo IDs."""
-        orphan_ids: list[str] = []
+    async def _find_orphans(self) -> Sequence[str]:
+        """Find orphan managed cargo IDs.
 
-        # Case 1: managed=True but managed_by_sandbox_id is NULL
-        query1 = select(Cargo.id).where(
-            Cargo.managed == True,  # noqa: E712
-            Cargo.managed_by_sandbox_id.is_(None),
-        )
-        result1 = await self._db.execute(query1)
-        for (cargo_id,) in result1:
-            orphan_ids.append(cargo_id)
-
-        # Case 2: managed=True and referenced sandbox is soft-deleted
-        # Use LEFT OUTER JOIN to find cargos where sandbox.deleted_at IS NOT NULL
+        One LEFT OUTER JOIN covers both cases: managed_by_sandbox_id is NULL,
+        or the referenced sandbox is soft-deleted. Each cargo row joins at
+        most one sandbox, so the IDs come back unique.
+        """
         SandboxAlias = aliased(Sandbox)
-        query2 = (
+        query = (
             select(Cargo.id)
             .outerjoin(
                 SandboxAlias,
                 Cargo.managed_by_sandbox_id == SandboxAlias.id,
             )
             .where(
-                Cargo.managed == True,  # noqa: E712
-                Cargo.managed_by_sandbox_id.is_not(None),
-                SandboxAlias.deleted_at.is_not(None),
+                Cargo.managed.is_(True),
+                or_(
+                    Cargo.managed_by_sandbox_id.is_(None),
+                    SandboxAlias.deleted_at.is_not(None),
+                ),
             )
         )
-        result2 = await self._db.execute(query2)
-        for (cargo_id,) in result2:
-            if cargo_id not in orphan_ids:
-                orphan_ids.append(cargo_id)
-
-        return orphan_ids
+        result = await self._db.execute(query)
+        return result.scalars().all()
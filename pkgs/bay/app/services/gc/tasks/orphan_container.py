@@ -13,6 +13,7 @@ DEFAULT: Disabled (must be explicitly enabled in config).
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import structlog
@@ -21,10 +22,10 @@ from sqlmodel import select
 
 from app.config import GCConfig
 from app.models.session import Session
-from app.services.gc.base import GCResult, GCTask
+from app.services.gc.base import GCResult, GCTask, run_bounded
 
 if TYPE_CHECKING:
-    from app.drivers.base import Driver
+    from app.drivers.base import Driver, RuntimeInstance
 
 logger = structlog.get_logger()
 
@@ -36,10 +37,53 @@ REQUIRED_LABELS = [
     "bay.instance_id",
     "bay.managed",
 ]
+_REQUIRED_LABEL_SET = frozenset(REQUIRED_LABELS)
 
 # Container name prefix for Bay-managed containers
 CONTAINER_NAME_PREFIX = "bay-session-"
 
+# Upper bound on in-flight destroy calls against the container runtime
+_DESTROY_CONCURRENCY = 16
+
+# Skip reasons that point at a misconfiguration rather than a foreign container
+_WARNING_SKIP_REASONS = frozenset({"instance_mismatch", "no_session_id"})
+
+
+def _skip_reason(instance: "RuntimeInstance", instance_id: str) -> str | None:
+    """Return why strict mode must skip `instance`, or None if it is a candidate.
+
+    Checks run cheapest first and stop at the first failure.
+    """
+    if not instance.name.startswith(CONTAINER_NAME_PREFIX):
+        return "name_prefix"
+    labels = instance.labels
+    if not _REQUIRED_LABEL_SET.issubset(labels.keys()):
+        return "missing_labels"
+    # managed / instance_id are already filtered by the driver; double-check
+    if labels["bay.managed"] != "true":
+        return "not_managed"
+    if labels["bay.instance_id"] != instance_id:
+        return "instance_mismatch"
+    if not labels["bay.session_id"]:
+        return "no_session_id"
+    return None
+
+
+def _skip_log_fields(reason: str, instance: "RuntimeInstance", instance_id: str) -> dict:
+    """Reason-specific fields of the gc.orphan_container.skip.* log events."""
+    if reason == "name_prefix":
+        return {"reason": f"name does not start with {CONTAINER_NAME_PREFIX}"}
+    if reason == "missing_labels":
+        return {
+            "missing_labels": [label for label in REQUIRED_LABELS if label not in instance.labels]
+        }
+    if reason == "instance_mismatch":
+        return {
+            "container_instance_id": instance.labels.get("bay.instance_id"),
+            "expected_instance_id": instance_id,
+        }
+    return {}
+
 
 class OrphanContainerGC(GCTask):
     """GC task for cleaning up orphan containers (Strict mode).
@@ -69,6 +113,8 @@ class OrphanContainerGC(GCTask):
         self._db = db_session
         self._gc_config = gc_config
         self._log = logger.bind(gc_task="orphan_container")
+        # Skips are the common case; don't build debug events nobody reads.
+        self._debug_on = self._log.is_enabled_for(logging.DEBUG)
         self._instance_id = gc_config.get_instance_id()
 
     @property
@@ -98,104 +144,71 @@ class OrphanContainerGC(GCTask):
             count=len(instances),
         )
 
+        # Phase 1: strict-mode label checks, no DB access.
+        candidates: list[tuple[RuntimeInstance, str]] = []
         for instance in instances:
-            try:
-                cleaned = await self._process_instance(instance, result)
-                if cleaned:
-                    result.cleaned_count += 1
-            except Exception as e:
-                self._log.exception(
-                    "gc.orphan_container.item_error",
-                    instance_id=instance.id,
-                    instance_name=instance.name,
-                    error=str(e),
-                )
-                result.add_error(f"container {instance.id}: {e}")
-
-        return result
-
-    async def _process_instance(self, instance, result: GCResult) -> bool:
-        """Process a single container instance.
-
-        Returns True if deleted, False if skipped.
-        """
-        # Validation step 1: Check name prefix
-        if not instance.name.startswith(CONTAINER_NAME_PREFIX):
-            self._log.debug(
-                "gc.orphan_container.skip.name_prefix",
-                instance_id=instance.id,
-                instance_name=instance.name,
-                reason="name does not start with bay-session-",
-            )
+            reason = _skip_reason(instance, self._instance_id)
+            if reason is None:
+                candidates.append((instance, instance.labels["bay.session_id"]))
+                continue
             result.skipped_count += 1
-            return False
-
-        # Validation step 2: Check all required labels exist
-        missing_labels = []
-        for label in REQUIRED_LABELS:
-            if label not in instance.labels:
-                missing_labels.append(label)
-
-        if missing_labels:
-            self._log.debug(
-                "gc.orphan_container.skip.missing_labels",
+            if reason in _WARNING_SKIP_REASONS:
+                log = self._log.warning
+            elif self._debug_on:
+                log = self._log.debug
+            else:
+                continue
+            log(
+                f"gc.orphan_container.skip.{reason}",
                 instance_id=instance.id,
                 instance_name=instance.name,
-                missing_labels=missing_labels,
+                **_skip_log_fields(reason, instance, self._instance_id),
             )
-            result.skipped_count += 1
-            return False
 
-        # Validation step 3: Check bay.managed = "true" (already filtered, but double-check)
-        if instance.labels.get("bay.managed") != "true":
-            self._log.debug(
-                "gc.orphan_container.skip.not_managed",
-                instance_id=instance.id,
-                instance_name=instance.name,
-            )
-            result.skipped_count += 1
-            return False
-
-        # Validation step 4: Check bay.instance_id matches (already filtered, but double-check)
-        container_instance_id = instance.labels.get("bay.instance_id")
-        if container_instance_id != self._instance_id:
-            self._log.warning(
-                "gc.orphan_container.skip.instance_mismatch",
-                instance_id=instance.id,
-                instance_name=instance.name,
-                container_instance_id=container_instance_id,
-                expected_instance_id=self._instance_id,
-            )
-            result.skipped_count += 1
-            return False
-
-        # Validation step 5: Check if session exists in DB
-        session_id = instance.labels.get("bay.session_id")
-        if not session_id:
-            self._log.warning(
-                "gc.orphan_container.skip.no_session_id",
-                instance_id=instance.id,
-                instance_name=instance.name,
-            )
-            result.skipped_count += 1
-            return False
+        if not candidates:
+            return result
 
-        # Query DB to check if session exists
-        db_result = await self._db.execute(select(Session.id).where(Session.id == session_id))
-        session_exists = db_result.scalars().first() is not None
+        # One round trip for every candidate instead of one per container.
+        db_result = await self._db.execute(
+            select(Session.id).where(Session.id.in_({sid for _, sid in candidates}))
+        )
+        existing_session_ids = set(db_result.scalars().all())
+
+        orphans: list[tuple[RuntimeInstance, str]] = []
+        for instance, session_id in candidates:
+            if session_id in existing_session_ids:
+                # Not an orphan - session record exists
+                if self._debug_on:
+                    self._log.debug(
+                        "gc.orphan_container.skip.session_exists",
+                        instance_id=instance.id,
+                        instance_name=instance.name,
+                        session_id=session_id,
+                    )
+                result.skipped_count += 1
+            else:
+                orphans.append((instance, session_id))
+
+        # Phase 2: destroy orphans concurrently; each call is a runtime RPC.
+        outcomes = await run_bounded(orphans, self._destroy_orphan, _DESTROY_CONCURRENCY)
+        for (instance, _), outcome in zip(orphans, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                self._log.error(
+                    "gc.orphan_container.item_error",
+                    instance_id=instance.id,
+                    instance_name=instance.name,
+                    error=str(outcome),
+                    exc_info=outcome,
+                )
+                result.add_error(f"container {instance.id}: {outcome}")
+            else:
+                result.cleaned_count += 1
 
-        if session_exists:
-            # Not an orphan - session record exists
-            self._log.debug(
-                "gc.orphan_container.skip.session_exists",
-                instance_id=instance.id,
-                instance_name=instance.name,
-                session_id=session_id,
-            )
-            result.skipped_count += 1
-            return False
+        return result
 
-        # All validations passed - this is a true orphan, delete it
+    async def _destroy_orphan(self, orphan: tuple[RuntimeInstance, str]) -> None:
+        """Destroy a container whose session no longer exists in the DB."""
+        instance, session_id = orphan
         self._log.info(
             "gc.orphan_container.deleting",
             instance_id=instance.id,
@@ -212,5 +225,3 @@ class OrphanContainerGC(GCTask):
             instance_name=instance.name,
             session_id=session_id,
         )
-
-        return True
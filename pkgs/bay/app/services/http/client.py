@@ -44,12 +44,13 @@ class HTTPClientManager:
         self,
         *,
         max_connections: int = 200,
-        max_keepalive_connections: int = 100,
+        max_keepalive_connections: int = 200,
         keepalive_expiry: float = 30.0,
         connect_timeout: float = 10.0,
         read_timeout: float = 60.0,
         write_timeout: float = 30.0,
         pool_timeout: float = 10.0,
+        http2: bool = False,
     ) -> None:
         """Initialize HTTP client manager.
 
@@ -57,13 +58,22 @@ class HTTPClientManager:
             max_connections: Maximum number of concurrent connections.
                              Default 200 to handle high concurrency stress tests.
             max_keepalive_connections: Maximum connections to keep alive.
-                                       Should be <= max_connections.
+                                       Should be <= max_connections. Defaults
+                                       to max_connections so a burst's
+                                       connections are all reused afterwards
+                                       instead of closed and re-opened.
             keepalive_expiry: Seconds before idle connections are closed.
+                              Keep it below Ship's and Gull's server
+                              keep-alive timeout (75s) so the client side
+                              closes idle connections first.
             connect_timeout: Connection timeout in seconds.
             read_timeout: Read timeout in seconds.
                           Default 60s for long-running operations.
             write_timeout: Write timeout in seconds.
             pool_timeout: Pool acquisition timeout in seconds.
+            http2: Offer HTTP/2 (requires ``httpx[http2]``). httpx only
+                   negotiates it via TLS ALPN, and Ship serves HTTP/1.1 over
+                   plain HTTP, so this is off by default.
         """
         self._max_connections = max_connections
         self._max_keepalive_connections = max_keepalive_connections
@@ -72,6 +82,7 @@ class HTTPClientManager:
         self._read_timeout = read_timeout
         self._write_timeout = write_timeout
         self._pool_timeout = pool_timeout
+        self._http2 = http2
 
         self._client: httpx.AsyncClient | None = None
         self._log = logger.bind(component="http_client")
@@ -98,6 +109,13 @@ class HTTPClientManager:
             self._log.warning("http_client.already_started")
             return
 
+        if self._max_keepalive_connections < self._max_connections // 2:
+            self._log.warning(
+                "http_client.low_keepalive_pool",
+                max_connections=self._max_connections,
+                max_keepalive=self._max_keepalive_connections,
+            )
+
         # Configure connection limits
         limits = httpx.Limits(
             max_connections=self._max_connections,
@@ -116,8 +134,7 @@ class HTTPClientManager:
         self._client = httpx.AsyncClient(
             limits=limits,
             timeout=timeout,
-            # Disable HTTP/2 for simpler connection management
-            http2=False,
+            http2=self._http2,
             # Do not inherit proxy settings from the environment. Bay talks to
             # Ship over Docker/private network IPs which should not be routed
             # through an HTTP proxy.
@@ -128,6 +145,7 @@ class HTTPClientManager:
             "http_client.started",
             max_connections=self._max_connections,
             max_keepalive=self._max_keepalive_connections,
+            http2=self._http2,
         )
 
     async def shutdown(self) -> None:
@@ -243,6 +243,7 @@ class IdempotencyService:
             status_code=status_code,
             created_at=now,
             expires_at=expires_at,
+            expires_at_epoch=IdempotencyKey.epoch_of(expires_at),
         )
 
         try:
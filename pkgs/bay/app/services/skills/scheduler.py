@@ -6,7 +6,7 @@ import asyncio
 import json
 import re
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 import structlog
@@ -14,6 +14,7 @@ import structlog
 from app.config import BrowserLearningConfig, get_settings
 from app.db.session import get_async_session
 from app.models.skill import (
+    ArtifactBlob,
     ExecutionHistory,
     LearnStatus,
     SkillReleaseMode,
@@ -71,10 +72,16 @@ class BrowserLearningProcessor:
 
     async def run_cycle(self) -> BrowserLearningCycleResult:
         result = BrowserLearningCycleResult()
+        # One timestamp for the whole cycle: audit times here are coarse.
+        now = utcnow()
 
         pending = await self._svc.list_pending_browser_learning_executions(
             limit=self._config.batch_size
         )
+        # One IN query for the whole batch instead of a blob lookup per entry.
+        trace_blobs = await self._svc.get_artifact_blobs_by_refs(
+            refs=[(entry.owner, entry.payload_ref) for entry in pending if entry.payload_ref]
+        )
 
         for entry in pending:
             await self._svc.set_execution_learning_status(
@@ -82,7 +89,12 @@ class BrowserLearningProcessor:
                 status=LearnStatus.PROCESSING,
             )
             try:
-                processed = await self._process_execution(entry=entry, result=result)
+                processed = await self._process_execution(
+                    entry=entry,
+                    result=result,
+                    trace_blob=trace_blobs.get((entry.owner, entry.payload_ref)),
+                    now=now,
+                )
                 if processed:
                     result.processed_executions += 1
                 else:
@@ -93,7 +105,7 @@ class BrowserLearningProcessor:
                     execution_id=entry.id,
                     status=LearnStatus.ERROR,
                     error=str(exc),
-                    processed_at=utcnow(),
+                    processed_at=now,
                 )
                 self._log.exception(
                     "skills.browser.learning.execution_failed",
@@ -101,7 +113,7 @@ class BrowserLearningProcessor:
                     error=str(exc),
                 )
 
-        await self._process_auto_canary_lifecycle(result=result)
+        await self._process_auto_canary_lifecycle(result=result, now=now)
         return result
 
     async def _process_execution(
@@ -109,14 +121,17 @@ class BrowserLearningProcessor:
         *,
         entry: ExecutionHistory,
         result: BrowserLearningCycleResult,
+        trace_blob: ArtifactBlob | None = None,
+        now: datetime | None = None,
     ) -> bool:
-        segments = await self._extract_segments(entry=entry)
+        now = now or utcnow()
+        segments = await self._extract_segments(entry=entry, trace_blob=trace_blob)
         if not segments:
             await self._svc.set_execution_learning_status(
                 execution_id=entry.id,
                 status=LearnStatus.SKIPPED,
                 error="no_actionable_segments",
-                processed_at=utcnow(),
+                processed_at=now,
             )
             return False
 
@@ -204,7 +219,7 @@ class BrowserLearningProcessor:
                 promoted_by="system:auto",
                 release_mode=SkillReleaseMode.AUTO,
                 auto_promoted_from=active.id if active else None,
-                health_window_end_at=utcnow() + timedelta(hours=self._config.canary_window_hours),
+                health_window_end_at=now + timedelta(hours=self._config.canary_window_hours),
             )
             result.promoted_canary += 1
             await self._svc.update_candidate_auto_release(
@@ -227,15 +242,23 @@ class BrowserLearningProcessor:
             execution_id=entry.id,
             status=LearnStatus.PROCESSED,
             error=None,
-            processed_at=utcnow(),
+            processed_at=now,
         )
         return True
 
-    async def _extract_segments(self, *, entry: ExecutionHistory) -> list[list[dict[str, Any]]]:
-        trace_payload = await self._svc.get_payload_by_ref(
-            owner=entry.owner,
-            payload_ref=entry.payload_ref,
-        )
+    async def _extract_segments(
+        self,
+        *,
+        entry: ExecutionHistory,
+        trace_blob: ArtifactBlob | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        if trace_blob is not None:
+            trace_payload = self._svc.decode_blob_payload(trace_blob)
+        else:
+            trace_payload = await self._svc.get_payload_by_ref(
+                owner=entry.owner,
+                payload_ref=entry.payload_ref,
+            )
 
         steps = self._normalize_steps(entry=entry, trace_payload=trace_payload)
         if not steps:
@@ -309,8 +332,8 @@ class BrowserLearningProcessor:
 
     @staticmethod
     def _is_read_only_command(cmd: str) -> bool:
-        normalized = cmd.strip().lower()
-        return any(normalized.startswith(prefix) for prefix in READ_ONLY_PREFIXES)
+        # str.startswith takes the whole tuple: one C-level call, no generator
+        return cmd.strip().lower().startswith(READ_ONLY_PREFIXES)
 
     @staticmethod
     def _score_segment(*, segment: list[dict[str, Any]]) -> dict[str, Any]:
@@ -349,6 +372,7 @@ class BrowserLearningProcessor:
         self,
         *,
         result: BrowserLearningCycleResult,
+        now: datetime | None = None,
     ) -> None:
         releases = await self._svc.list_active_auto_canary_releases(limit=200)
         for release in releases:
@@ -357,6 +381,7 @@ class BrowserLearningProcessor:
                 release_id=release.id,
                 success_drop_threshold=self._config.success_drop_threshold,
                 error_rate_multiplier_threshold=self._config.error_rate_multiplier_threshold,
+                now=now,
             )
 
             if health["should_rollback"]:
@@ -110,9 +110,9 @@ class SkillLifecycleService:
             payload_json=json.dumps(payload, ensure_ascii=False),
             created_at=utcnow(),
         )
+        # All columns are client-side values (expire_on_commit=False): no refresh.
         self._db.add(blob)
         await self._db.commit()
-        await self._db.refresh(blob)
         return blob
 
     async def get_artifact_blob(self, *, owner: str, blob_id: str) -> ArtifactBlob:
@@ -136,20 +136,52 @@ class SkillLifecycleService:
         blob_id = self._parse_blob_ref(payload_ref)
         return await self.get_artifact_blob(owner=owner, blob_id=blob_id)
 
-    async def get_payload_with_blob_by_ref(
+    async def get_artifact_blobs_by_refs(
         self,
         *,
-        owner: str,
-        payload_ref: str,
-    ) -> tuple[ArtifactBlob, dict[str, Any] | list[Any]]:
-        blob = await self.get_artifact_blob_by_ref(owner=owner, payload_ref=payload_ref)
+        refs: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], ArtifactBlob]:
+        """Load the blobs behind many (owner, payload_ref) pairs in one query.
+
+        Malformed refs and missing/foreign-owner blobs are simply absent from
+        the result; resolve those through get_payload_by_ref for its errors.
+        """
+        wanted: dict[str, list[tuple[str, str]]] = {}
+        for owner, payload_ref in refs:
+            try:
+                blob_id = self._parse_blob_ref(payload_ref)
+            except ValidationError:
+                continue
+            wanted.setdefault(blob_id, []).append((owner, payload_ref))
+        if not wanted:
+            return {}
+
+        result = await self._db.execute(select(ArtifactBlob).where(ArtifactBlob.id.in_(wanted)))
+        blobs: dict[tuple[str, str], ArtifactBlob] = {}
+        for blob in result.scalars().all():
+            for owner, payload_ref in wanted[blob.id]:
+                if blob.owner == owner:
+                    blobs[(owner, payload_ref)] = blob
+        return blobs
+
+    @staticmethod
+    def decode_blob_payload(blob: ArtifactBlob) -> dict[str, Any] | list[Any]:
         try:
             payload = json.loads(blob.payload_json)
         except json.JSONDecodeError as exc:
             raise ValidationError(f"Invalid payload JSON in blob: {blob.id}") from exc
         if not isinstance(payload, (dict, list)):
             raise ValidationError(f"Unsupported payload type in blob: {blob.id}")
-        return blob, payload
+        return payload
+
+    async def get_payload_with_blob_by_ref(
+        self,
+        *,
+        owner: str,
+        payload_ref: str,
+    ) -> tuple[ArtifactBlob, dict[str, Any] | list[Any]]:
+        blob = await self.get_artifact_blob_by_ref(owner=owner, payload_ref=payload_ref)
+        return blob, self.decode_blob_payload(blob)
 
     async def get_payload_by_ref(
         self,
@@ -213,9 +245,10 @@ class SkillLifecycleService:
             learn_processed_at=learn_processed_at,
             created_at=utcnow(),
         )
+        # Written on every exec call; all columns are client-side values and
+        # sessions use expire_on_commit=False, so skip the refresh SELECT.
         self._db.add(entry)
         await self._db.commit()
-        await self._db.refresh(entry)
         return entry
 
     async def get_execution(
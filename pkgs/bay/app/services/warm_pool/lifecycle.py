@@ -156,7 +156,7 @@ async def _cleanup_warm_pool_sandboxes_on_shutdown() -> None:
                     Sandbox.is_warm_pool.is_(True),
                 )
             )
-            warm_sandbox_refs = [(row[0], row[1]) for row in result.all()]
+            warm_sandbox_refs = result.tuples().all()
 
             if not warm_sandbox_refs:
                 return
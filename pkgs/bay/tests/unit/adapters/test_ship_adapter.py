@@ -10,6 +10,9 @@ import json
 from typing import Any
 
 import httpx
+import pytest
+
+from app.errors import CargoFileNotFoundError
 
 
 def mock_response(data: dict[str, Any], status_code: int = 200) -> httpx.Response:
@@ -677,3 +680,67 @@ class TestShipAdapterMeta:
         assert result_data["version"] == "1.0.0"
         assert "python" in result_data["capabilities"]
         assert "shell" in result_data["capabilities"]
+
+
+class TestShipAdapterTransfer:
+    """ShipAdapter upload/download streaming through the shared client."""
+
+    @staticmethod
+    def _adapter_with(handler, monkeypatch):
+        from app.adapters import ship as ship_module
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ship_module, "_get_shared_client", lambda: client)
+        return ship_module.ShipAdapter("http://fake-ship:8123"), client
+
+    async def test_download_file_stream_yields_chunks(self, monkeypatch):
+        """download_file_stream should yield the body in chunk_size pieces."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/fs/download"
+            assert request.url.params["file_path"] == "out/data.bin"
+            return httpx.Response(200, content=b"x" * 10)
+
+        adapter, client = self._adapter_with(handler, monkeypatch)
+        async with client:
+            chunks = [
+                chunk async for chunk in adapter.download_file_stream("out/data.bin", chunk_size=4)
+            ]
+            content = await adapter.download_file("out/data.bin")
+
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+        assert content == b"x" * 10
+
+    async def test_download_file_stream_maps_404(self, monkeypatch):
+        """A missing file should raise before any chunk is yielded."""
+        adapter, client = self._adapter_with(
+            lambda request: httpx.Response(404, content=b"missing"), monkeypatch
+        )
+        async with client:
+            with pytest.raises(CargoFileNotFoundError):
+                await anext(adapter.download_file_stream("missing.bin"))
+
+    async def test_upload_file_streams_chunks_as_multipart(self, monkeypatch):
+        """upload_file should frame an async chunk stream as Ship's multipart form."""
+        captured: dict[str, Any] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            body = await request.aread()
+            captured["body"] = body
+            captured["content_type"] = request.headers["content-type"]
+            return mock_response({"success": True})
+
+        async def chunks():
+            yield b"payload-"
+            yield b"bytes"
+
+        adapter, client = self._adapter_with(handler, monkeypatch)
+        async with client:
+            await adapter.upload_file("in/data.bin", chunks())
+
+        # Split on the boundary to check the hand-built framing.
+        boundary = captured["content_type"].split("boundary=", 1)[1]
+        parts = captured["body"].split(f"--{boundary}".encode())
+        assert parts[-1] == b"--\r\n"
+        assert b'name="file_path"\r\n\r\nin/data.bin\r\n' in parts[1]
+        assert parts[2].endswith(b"\r\n\r\npayload-bytes\r\n")
@@ -13,10 +13,30 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
 
+from app.models.api_key import ApiKey
 from app.services.api_key import ApiKeyService
 
 
+@pytest.fixture
+async def db_session():
+    """Create in-memory SQLite database and session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
 class TestGenerateKey:
     """Test API key generation."""
 
@@ -57,6 +77,17 @@ class TestHashAndVerify:
         h2 = ApiKeyService.hash_key("test-key")
         assert h1 == h2
 
+    def test_hash_accepts_bytes(self):
+        """Bytes input hashes the same as the equivalent str."""
+        assert ApiKeyService.hash_key(b"sk-bay-test123") == ApiKeyService.hash_key("sk-bay-test123")
+        assert ApiKeyService.verify_key(b"sk-bay-test123", ApiKeyService.hash_key("sk-bay-test123"))
+
+    def test_digest_matches_stored_hex(self):
+        """digest_key is the raw form of hash_key's hex digest."""
+        assert ApiKeyService.digest_key("sk-bay-test123") == bytes.fromhex(
+            ApiKeyService.hash_key("sk-bay-test123")
+        )
+
     def test_hash_different_inputs(self):
         """Different inputs produce different hashes."""
         h1 = ApiKeyService.hash_key("key-a")
@@ -98,6 +129,37 @@ class TestWriteCredentialsFile:
         mode = oct(cred_path.stat().st_mode)[-3:]
         assert mode == "600"
 
+    def test_overwrite_tightens_existing_permissions(self, tmp_path: Path):
+        """A pre-existing world-readable file is rewritten as 0600."""
+        cred_path = tmp_path / "credentials.json"
+        cred_path.write_text("stale")
+        os.chmod(cred_path, 0o644)
+
+        ApiKeyService.write_credentials_file(tmp_path, "sk-bay-test", "http://localhost:8114")
+
+        assert oct(cred_path.stat().st_mode)[-3:] == "600"
+        assert json.loads(cred_path.read_text())["api_key"] == "sk-bay-test"
+
+    def test_write_leaves_no_temp_file(self, tmp_path: Path):
+        """The temp file is renamed over credentials.json, not left behind."""
+        ApiKeyService.write_credentials_file(tmp_path, "sk-bay-test", "http://localhost:8114")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["credentials.json"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path: Path):
+        """If the rename fails, the old credentials stay intact and the temp is removed."""
+        cred_path = tmp_path / "credentials.json"
+        cred_path.write_text("previous")
+
+        with patch("app.services.api_key.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                ApiKeyService.write_credentials_file(
+                    tmp_path, "sk-bay-test", "http://localhost:8114"
+                )
+
+        assert cred_path.read_text() == "previous"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["credentials.json"]
+
     def test_creates_parent_dirs(self, tmp_path: Path):
         """Creates parent directories if they don't exist."""
         nested = tmp_path / "sub" / "dir"
@@ -106,6 +168,42 @@ class TestWriteCredentialsFile:
         assert (nested / "credentials.json").exists()
 
 
+class TestLoadActiveKeyHashes:
+    """Test loading the in-memory key hash map."""
+
+    @pytest.mark.asyncio
+    async def test_returns_only_active_keys(self, db_session):
+        """Inactive keys are excluded; active keys map hash → owner."""
+        db_session.add_all(
+            [
+                ApiKey(id="a", key_hash="aa", key_prefix="sk-bay-a", owner="alice"),
+                ApiKey(id="b", key_hash="bb", key_prefix="sk-bay-b", owner="bob"),
+                ApiKey(
+                    id="c", key_hash="cc", key_prefix="sk-bay-c", owner="carol", is_active=False
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        assert await ApiKeyService.load_active_key_hashes(db_session) == {
+            bytes.fromhex("aa"): "alice",
+            bytes.fromhex("bb"): "bob",
+        }
+
+    @pytest.mark.asyncio
+    async def test_prefixes_cover_only_active_keys(self, db_session):
+        """The auth prefilter set holds the key_prefix of each active key."""
+        db_session.add_all(
+            [
+                ApiKey(id="a", key_hash="aa", key_prefix="sk-bay-aaaaa"),
+                ApiKey(id="b", key_hash="bb", key_prefix="sk-bay-bbbbb", is_active=False),
+            ]
+        )
+        await db_session.flush()
+
+        assert await ApiKeyService.load_active_key_prefixes(db_session) == {"sk-bay-aaaaa"}
+
+
 class TestAutoProvision:
     """Test API key auto-provisioning."""
 
@@ -123,10 +221,10 @@ class TestAutoProvision:
     def mock_db(self):
         """Create mock async database session."""
         db = MagicMock()
-        # Default: no existing keys
+        # Default: no existing keys (existence checks go through db.scalar)
+        db.scalar = AsyncMock(return_value=False)
         result = MagicMock()
-        result.scalars.return_value.all.return_value = []
-        result.scalars.return_value.first.return_value = None
+        result.all.return_value = []
         db.execute = AsyncMock(return_value=result)
         db.flush = AsyncMock()
         db.add = MagicMock()
@@ -171,24 +269,9 @@ class TestAutoProvision:
             is_active=True,
         )
 
-        # First call: check env var (no BAY_API_KEY)
-        # Second call: check existing keys — returns existing
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                # First query: check existing active keys
-                result.scalars.return_value.first.return_value = existing
-                result.scalars.return_value.all.return_value = [existing]
-            else:
-                # Second query: load_active_key_hashes
-                result.scalars.return_value.all.return_value = [existing]
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Existence check: active keys exist; then load_active_key_hashes
+        mock_db.scalar.return_value = True
+        mock_db.execute.return_value.all.return_value = [(existing.key_hash, existing.owner)]
 
         with patch.dict(os.environ, {}, clear=False):
             env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
@@ -196,34 +279,15 @@ class TestAutoProvision:
                 result = await ApiKeyService.auto_provision(mock_db, mock_settings)
 
         mock_db.add.assert_not_called()
-        assert result == {"abc123": "default"}
+        assert result == {bytes.fromhex("abc123"): "default"}
 
     @pytest.mark.asyncio
     async def test_env_var_seeds_key(self, mock_db, mock_settings):
         """BAY_API_KEY env var seeds key to DB."""
-        # First execute: check if already seeded → no
-        # Second execute: load_active_key_hashes
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalars.return_value.first.return_value = None
-            else:
-                from app.models.api_key import ApiKey
-
-                seeded = ApiKey(
-                    id="seeded",
-                    key_hash=ApiKeyService.hash_key("sk-bay-from-env"),
-                    key_prefix="sk-bay-from",
-                    owner="default",
-                )
-                result.scalars.return_value.all.return_value = [seeded]
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Not seeded yet (db.scalar → False); then load_active_key_hashes
+        mock_db.execute.return_value.all.return_value = [
+            (ApiKeyService.hash_key("sk-bay-from-env"), "default")
+        ]
 
         with patch.dict(os.environ, {"BAY_API_KEY": "sk-bay-from-env"}, clear=False):
             await ApiKeyService.auto_provision(mock_db, mock_settings)
@@ -241,29 +305,10 @@ class TestAutoProvision:
         settings.security = SecurityConfig(api_key="sk-bay-from-config", allow_anonymous=False)
         settings.server = ServerConfig(host="0.0.0.0", port=8114)
 
-        # First execute: check if already seeded → no
-        # Second execute: load_active_key_hashes
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalars.return_value.first.return_value = None
-            else:
-                from app.models.api_key import ApiKey
-
-                seeded = ApiKey(
-                    id="seeded",
-                    key_hash=ApiKeyService.hash_key("sk-bay-from-config"),
-                    key_prefix="sk-bay-from",
-                    owner="default",
-                )
-                result.scalars.return_value.all.return_value = [seeded]
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Not seeded yet (db.scalar → False); then load_active_key_hashes
+        mock_db.execute.return_value.all.return_value = [
+            (ApiKeyService.hash_key("sk-bay-from-config"), "default")
+        ]
 
         # No BAY_API_KEY in environment
         env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
@@ -284,27 +329,10 @@ class TestAutoProvision:
         settings.security = SecurityConfig(api_key="sk-bay-from-config", allow_anonymous=False)
         settings.server = ServerConfig(host="0.0.0.0", port=8114)
 
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                result.scalars.return_value.first.return_value = None
-            else:
-                from app.models.api_key import ApiKey
-
-                seeded = ApiKey(
-                    id="seeded",
-                    key_hash=ApiKeyService.hash_key("sk-bay-env-wins"),
-                    key_prefix="sk-bay-env-",
-                    owner="default",
-                )
-                result.scalars.return_value.all.return_value = [seeded]
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Not seeded yet (db.scalar → False); then load_active_key_hashes
+        mock_db.execute.return_value.all.return_value = [
+            (ApiKeyService.hash_key("sk-bay-env-wins"), "default")
+        ]
 
         with patch.dict(os.environ, {"BAY_API_KEY": "sk-bay-env-wins"}, clear=False):
             await ApiKeyService.auto_provision(mock_db, settings)
@@ -333,20 +361,9 @@ class TestAutoProvision:
             is_active=True,
         )
 
-        call_count = 0
-
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            if call_count == 1:
-                # Already seeded — return existing
-                result.scalars.return_value.first.return_value = existing
-            else:
-                result.scalars.return_value.all.return_value = [existing]
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Already seeded; then load_active_key_hashes
+        mock_db.scalar.return_value = True
+        mock_db.execute.return_value.all.return_value = [(existing.key_hash, existing.owner)]
 
         env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
         with patch.dict(os.environ, env, clear=True):
@@ -354,7 +371,71 @@ class TestAutoProvision:
 
         # Should NOT add a duplicate
         mock_db.add.assert_not_called()
-        assert existing.key_hash in result
+        assert bytes.fromhex(existing.key_hash) in result
+
+
+class TestAutoProvisionSqlite:
+    """Test configured-key seeding against a real SQLite database."""
+
+    @pytest.fixture
+    def settings(self):
+        from app.config import SecurityConfig, ServerConfig
+
+        settings = MagicMock()
+        settings.security = SecurityConfig(api_key="sk-bay-sqlite-seed", allow_anonymous=False)
+        settings.server = ServerConfig(host="0.0.0.0", port=8114)
+        return settings
+
+    @pytest.mark.asyncio
+    async def test_repeated_seed_inserts_once(self, db_session, settings):
+        """Seeding the same configured key twice leaves a single row."""
+        from sqlalchemy import func
+        from sqlmodel import select
+
+        env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
+        with patch.dict(os.environ, env, clear=True):
+            first = await ApiKeyService.auto_provision(db_session, settings)
+            second = await ApiKeyService.auto_provision(db_session, settings)
+
+        key_hash = ApiKeyService.hash_key("sk-bay-sqlite-seed")
+        assert first == second == {bytes.fromhex(key_hash): "default"}
+
+        count = await db_session.execute(select(func.count()).select_from(ApiKey))
+        assert count.scalar_one() == 1
+
+    @pytest.mark.asyncio
+    async def test_seed_without_unique_index_falls_back_to_lookup(self, db_session, settings):
+        """Seeding still works where auto-migrate skipped uq_api_keys_key_hash."""
+        from sqlalchemy import func, text
+        from sqlmodel import select
+
+        await db_session.execute(text("DROP INDEX uq_api_keys_key_hash"))
+
+        env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
+        with patch.dict(os.environ, env, clear=True):
+            first = await ApiKeyService.auto_provision(db_session, settings)
+            second = await ApiKeyService.auto_provision(db_session, settings)
+
+        assert first == second
+        count = await db_session.execute(select(func.count()).select_from(ApiKey))
+        assert count.scalar_one() == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_active_key_skips_generation(self, db_session, settings, tmp_path):
+        """With no configured key, an active key in the DB prevents first-boot generation."""
+        from app.config import SecurityConfig
+
+        settings.security = SecurityConfig(api_key=None, allow_anonymous=False)
+        db_session.add(ApiKey(id="a", key_hash="aa", key_prefix="sk-bay-aaaaa", owner="alice"))
+        await db_session.flush()
+
+        env = {k: v for k, v in os.environ.items() if k != "BAY_API_KEY"}
+        env["BAY_DATA_DIR"] = str(tmp_path)
+        with patch.dict(os.environ, env, clear=True):
+            result = await ApiKeyService.auto_provision(db_session, settings)
+
+        assert result == {bytes.fromhex("aa"): "alice"}
+        assert not (tmp_path / "credentials.json").exists()
 
 
 class TestAuthenticateWithDbKey:
@@ -363,7 +444,8 @@ class TestAuthenticateWithDbKey:
     def _create_mock_request(
         self,
         headers: dict[str, str] | None = None,
-        api_key_hashes: dict[str, str] | None = None,
+        api_key_hashes: dict[bytes, str] | None = None,
+        api_key_prefixes: frozenset[str] | None = None,
     ):
         """Create mock request with optional app.state.api_key_hashes."""
         from fastapi import Request
@@ -371,6 +453,7 @@ class TestAuthenticateWithDbKey:
         request = MagicMock(spec=Request)
         request.headers = headers or {}
         request.app.state.api_key_hashes = api_key_hashes or {}
+        request.app.state.api_key_prefixes = api_key_prefixes
         return request
 
     def _create_mock_settings(
@@ -388,8 +471,7 @@ class TestAuthenticateWithDbKey:
         from app.api.dependencies import authenticate
 
         plaintext = "sk-bay-testkey123"
-        key_hash = ApiKeyService.hash_key(plaintext)
-        hashes = {key_hash: "team-alpha"}
+        hashes = {ApiKeyService.digest_key(plaintext): "team-alpha"}
 
         request = self._create_mock_request(
             headers={"Authorization": f"Bearer {plaintext}"},
@@ -402,12 +484,27 @@ class TestAuthenticateWithDbKey:
 
         assert result == "team-alpha"
 
+    def test_db_key_lookup_picks_owner_among_many_keys(self):
+        """Each key resolves to its own owner when many keys are loaded."""
+        from app.api.dependencies import authenticate
+
+        hashes = {ApiKeyService.digest_key(f"sk-bay-key{i}"): f"owner-{i}" for i in range(50)}
+        settings = self._create_mock_settings(allow_anonymous=False)
+
+        with patch("app.api.dependencies.get_settings", return_value=settings):
+            for i in (0, 17, 49):
+                request = self._create_mock_request(
+                    headers={"Authorization": f"Bearer sk-bay-key{i}"},
+                    api_key_hashes=hashes,
+                )
+                assert authenticate(request) == f"owner-{i}"
+
     def test_db_key_no_match_raises_401(self):
         """Invalid key against DB hashes raises UnauthorizedError."""
         from app.api.dependencies import authenticate
         from app.errors import UnauthorizedError
 
-        hashes = {ApiKeyService.hash_key("correct-key"): "default"}
+        hashes = {ApiKeyService.digest_key("correct-key"): "default"}
 
         request = self._create_mock_request(
             headers={"Authorization": "Bearer wrong-key"},
@@ -419,6 +516,40 @@ class TestAuthenticateWithDbKey:
             with pytest.raises(UnauthorizedError):
                 authenticate(request)
 
+    def test_unknown_prefix_rejected_without_hashing(self):
+        """A token matching no active key prefix is rejected before SHA-256."""
+        from app.api.dependencies import authenticate
+        from app.errors import UnauthorizedError
+
+        plaintext, key_hash, key_prefix = ApiKeyService.generate_key()
+        request = self._create_mock_request(
+            headers={"Authorization": "Bearer garbage-token"},
+            api_key_hashes={bytes.fromhex(key_hash): "default"},
+            api_key_prefixes=frozenset({key_prefix}),
+        )
+        settings = self._create_mock_settings(allow_anonymous=False)
+
+        with patch("app.api.dependencies.get_settings", return_value=settings):
+            with patch.object(ApiKeyService, "digest_key") as digest_key:
+                with pytest.raises(UnauthorizedError):
+                    authenticate(request)
+        digest_key.assert_not_called()
+
+    def test_known_prefix_is_verified_by_hash(self):
+        """A token with a known prefix still has to match the stored hash."""
+        from app.api.dependencies import authenticate
+
+        plaintext, key_hash, key_prefix = ApiKeyService.generate_key()
+        request = self._create_mock_request(
+            headers={"Authorization": f"Bearer {plaintext}"},
+            api_key_hashes={bytes.fromhex(key_hash): "team-beta"},
+            api_key_prefixes=frozenset({key_prefix}),
+        )
+        settings = self._create_mock_settings(allow_anonymous=False)
+
+        with patch("app.api.dependencies.get_settings", return_value=settings):
+            assert authenticate(request) == "team-beta"
+
     def test_empty_hashes_fallback_anonymous(self):
         """No DB keys + anonymous mode → allow."""
         from app.api.dependencies import authenticate
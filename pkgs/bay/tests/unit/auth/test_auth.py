@@ -19,12 +19,14 @@ from app.services.api_key import ApiKeyService
 
 def create_mock_request(
     headers: dict[str, str] | None = None,
-    api_key_hashes: dict[str, str] | None = None,
+    api_key_hashes: dict[bytes, str] | None = None,
+    api_key_prefixes: frozenset[str] | None = None,
 ) -> Request:
     """Create a mock FastAPI Request with given headers."""
     mock_request = MagicMock(spec=Request)
     mock_request.headers = headers or {}
     mock_request.app.state.api_key_hashes = api_key_hashes or {}
+    mock_request.app.state.api_key_prefixes = api_key_prefixes
     return mock_request
 
 
@@ -39,9 +41,9 @@ def create_mock_settings(
     return settings
 
 
-def _hash_for(key: str, owner: str = "default") -> dict[str, str]:
-    """Helper: create a DB-style hash dict for testing."""
-    return {ApiKeyService.hash_key(key): owner}
+def _hash_for(key: str, owner: str = "default") -> dict[bytes, str]:
+    """Helper: create an in-memory digest → owner map for testing."""
+    return {ApiKeyService.digest_key(key): owner}
 
 
 class TestAuthenticateAnonymousMode:
@@ -13,6 +13,7 @@ import pytest
 from app.adapters.base import BaseAdapter, RuntimeMeta
 from app.errors import CapabilityNotSupportedError
 from app.router.capability import CapabilityRouter
+from app.router.capability.adapter_pool import AdapterPool
 
 
 class FakeAdapter(BaseAdapter):
@@ -162,6 +163,150 @@ class TestRequireCapability:
         assert "Connection refused" in str(exc_info.value)
 
 
+class TestCapabilityRouterResolve:
+    """Test CapabilityRouter._resolve() preamble."""
+
+    @pytest.fixture
+    def adapter_pool(self):
+        from app.router.capability.adapter_pool import AdapterPool
+
+        return AdapterPool(max_size=16, ttl_seconds=60.0)
+
+    async def test_resolve_returns_session_and_validated_adapter(self, adapter_pool):
+        """_resolve ensures the session, routes, and validates the capability."""
+        from app.models.session import Session
+
+        session = MagicMock(spec=Session)
+        session.endpoint = "http://localhost:8123"
+        session.runtime_type = "ship"
+        session.is_multi_container = False
+        sandbox_mgr = AsyncMock()
+        sandbox_mgr.ensure_running.return_value = session
+        adapter = FakeAdapter(capabilities={"python": {"operations": ["exec"]}})
+        adapter_pool.get_or_create("http://localhost:8123::ship", lambda: adapter)
+        router = CapabilityRouter(sandbox_mgr, adapter_pool=adapter_pool)
+        sandbox = MagicMock()
+
+        resolved_session, resolved_adapter = await router._resolve(sandbox, "python")
+
+        sandbox_mgr.ensure_running.assert_awaited_once_with(sandbox)
+        assert resolved_session is session
+        assert resolved_adapter is adapter
+
+        with pytest.raises(CapabilityNotSupportedError):
+            await router._resolve(sandbox, "shell")
+
+
+class TestCapabilityRouterLogging:
+    """The router's log events follow the level configured at startup."""
+
+    async def test_info_events_dropped_at_warning_level(self):
+        """Routers built after configure_logging("WARNING") drop INFO events."""
+        import logging
+
+        import structlog
+        from structlog.testing import capture_logs
+
+        from app.main import configure_logging
+        from app.models.session import Session
+
+        class ExecAdapter(FakeAdapter):
+            async def exec_python(self, code: str, *, timeout: int = 30):
+                return MagicMock()
+
+        session = MagicMock(spec=Session)
+        session.endpoint = "http://localhost:8124"
+        session.runtime_type = "ship"
+        session.is_multi_container = False
+        sandbox_mgr = AsyncMock()
+        sandbox_mgr.ensure_running.return_value = session
+        adapter_pool = AdapterPool(max_size=16, ttl_seconds=60.0)
+        adapter_pool.get_or_create(
+            "http://localhost:8124::ship",
+            lambda: ExecAdapter(capabilities={"python": {"operations": ["exec"]}}),
+        )
+
+        previous = structlog.get_config()
+        configure_logging("WARNING")
+        try:
+            router = CapabilityRouter(sandbox_mgr, adapter_pool=adapter_pool)
+            with capture_logs() as events:
+                await router.exec_python(MagicMock(), "print(1)")
+        finally:
+            structlog.configure(**previous)
+
+        assert not router._log.is_enabled_for(logging.INFO)
+        assert [e for e in events if e["event"] == "capability.python.exec"] == []
+
+
+class TestCapabilityRouterEnsureSession:
+    """Test the running-session fast path of CapabilityRouter.ensure_session()."""
+
+    @staticmethod
+    def _session(observed_state):
+        from app.models.session import Session
+
+        return Session(
+            id="sess-1",
+            sandbox_id="sandbox-1",
+            runtime_type="ship",
+            profile_id="python-default",
+            endpoint="http://localhost:8123",
+            observed_state=observed_state,
+        )
+
+    async def test_running_session_skips_manager_until_ttl_expires(self):
+        from app.managers.session.running_cache import RunningSessionCache
+        from app.models.session import SessionStatus
+
+        clock = [0.0]
+        cache = RunningSessionCache(ttl_seconds=2.0, now=lambda: clock[0])
+        sandbox_mgr = AsyncMock()
+        sandbox_mgr.ensure_running.return_value = self._session(SessionStatus.RUNNING)
+        sandbox = MagicMock()
+        sandbox.id = "sandbox-1"
+
+        first = await CapabilityRouter(sandbox_mgr, session_cache=cache).ensure_session(sandbox)
+        second = await CapabilityRouter(sandbox_mgr, session_cache=cache).ensure_session(sandbox)
+        assert second.id == first.id
+        assert second.endpoint == "http://localhost:8123"
+        assert sandbox_mgr.ensure_running.await_count == 1
+
+        clock[0] = 2.5
+        await CapabilityRouter(sandbox_mgr, session_cache=cache).ensure_session(sandbox)
+        assert sandbox_mgr.ensure_running.await_count == 2
+
+    async def test_non_running_session_is_not_cached(self):
+        from app.managers.session.running_cache import RunningSessionCache
+        from app.models.session import SessionStatus
+
+        cache = RunningSessionCache()
+        sandbox_mgr = AsyncMock()
+        sandbox_mgr.ensure_running.return_value = self._session(SessionStatus.STARTING)
+        router = CapabilityRouter(sandbox_mgr, session_cache=cache)
+        sandbox = MagicMock()
+        sandbox.id = "sandbox-1"
+
+        await router.ensure_session(sandbox)
+        await router.ensure_session(sandbox)
+
+        assert sandbox_mgr.ensure_running.await_count == 2
+        assert len(cache) == 0
+
+    def test_cache_discard_and_size_cap(self):
+        from app.managers.session.running_cache import RunningSessionCache
+        from app.models.session import SessionStatus
+
+        cache = RunningSessionCache(max_size=2)
+        for sandbox_id in ("a", "b", "c"):
+            cache.put(sandbox_id, self._session(SessionStatus.RUNNING))
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        cache.discard("c")
+        assert cache.get("c") is None
+
+
 class TestCapabilityRouterGetAdapter:
     """Test CapabilityRouter._get_adapter() method."""
 
@@ -278,3 +423,16 @@ class TestCapabilityRouterGetAdapter:
         adapter2 = router._get_adapter(session)
 
         assert adapter2 is not adapter1
+
+    def test_pool_get_or_create_cls_constructs_only_on_miss(self):
+        """get_or_create_cls should call the class only when the key is absent."""
+        from app.router.capability.adapter_pool import AdapterPool
+
+        pool = AdapterPool(max_size=8, ttl_seconds=60.0)
+        ctor = MagicMock(side_effect=lambda endpoint: object())
+
+        first = pool.get_or_create_cls("http://localhost:8123::ship", ctor, "http://localhost:8123")
+        second = pool.get_or_create_cls("http://localhost:8123::ship", ctor, "http://localhost:8123")
+
+        assert first is second
+        ctor.assert_called_once_with("http://localhost:8123")
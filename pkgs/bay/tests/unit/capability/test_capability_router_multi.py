@@ -7,13 +7,16 @@ Covers Phase 2 behavior:
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.config import ContainerSpec, ProfileConfig, Settings
 from app.errors import CapabilityNotSupportedError
+from app.managers.session.running_cache import RunningSessionCache
 from app.models.session import Session
 from app.router.capability import CapabilityRouter
+from app.router.capability.capability import _resolve_target_name
 
 
 @pytest.fixture
@@ -125,3 +128,149 @@ def test_get_adapter_missing_capability_raises_with_available(mock_sandbox_mgr):
     assert err.details.get("capability") == "gpu"
     # merged and sorted
     assert err.details.get("available") == ["browser", "filesystem", "python"]
+
+
+def test_get_adapter_prefers_profile_primary_for(mock_sandbox_mgr):
+    """Profile primary_for wins over container order, and the lookup is cached."""
+    settings = Settings(
+        profiles=[
+            ProfileConfig(
+                id="browser-python",
+                containers=[
+                    ContainerSpec(name="ship", image="ship", capabilities=["python", "shell"]),
+                    ContainerSpec(
+                        name="gull",
+                        image="gull",
+                        runtime_type="gull",
+                        capabilities=["browser", "shell"],
+                        primary_for=["shell"],
+                    ),
+                ],
+            )
+        ]
+    )
+    session = Session(
+        id="sess-1",
+        sandbox_id="sbx-1",
+        profile_id="browser-python",
+        endpoint="http://ship:8123",
+        containers=[
+            {
+                "name": "ship",
+                "endpoint": "http://ship:8123",
+                "runtime_type": "ship",
+                "capabilities": ["python", "shell"],
+            },
+            {
+                "name": "gull",
+                "endpoint": "http://gull:8115",
+                "runtime_type": "gull",
+                "capabilities": ["browser", "shell"],
+            },
+        ],
+    )
+    router = CapabilityRouter(mock_sandbox_mgr)
+
+    with (
+        patch("app.router.capability.capability.get_settings", return_value=settings),
+        patch.object(
+            Settings, "get_profile", autospec=True, side_effect=Settings.get_profile
+        ) as get_profile,
+    ):
+        first = router._get_adapter(session, capability="shell")
+        second = router._get_adapter(session, capability="shell")
+        assert _resolve_target_name("browser-python", "shell") == "gull"
+
+    assert first.__class__.__name__ == "GullAdapter"
+    assert second is first
+    assert get_profile.call_count == 1
+
+
+def test_target_name_memo_follows_settings_object():
+    """Swapping the Settings object drops memoized routing answers."""
+
+    def settings_with_shell_on(container: str) -> Settings:
+        return Settings(
+            profiles=[
+                ProfileConfig(
+                    id="multi",
+                    containers=[
+                        ContainerSpec(name="ship", image="ship", capabilities=["shell"]),
+                        ContainerSpec(
+                            name="gull",
+                            image="gull",
+                            runtime_type="gull",
+                            capabilities=["shell"],
+                            primary_for=["shell"] if container == "gull" else [],
+                        ),
+                    ],
+                )
+            ]
+        )
+
+    target = "app.router.capability.capability.get_settings"
+    with patch(target, return_value=settings_with_shell_on("gull")):
+        assert _resolve_target_name("multi", "shell") == "gull"
+    with patch(target, return_value=settings_with_shell_on("ship")):
+        assert _resolve_target_name("multi", "shell") == "ship"
+    with patch(target, side_effect=RuntimeError("settings unavailable")):
+        with pytest.raises(RuntimeError):
+            _resolve_target_name("multi", "shell")
+
+
+async def test_resolve_skips_meta_check_for_capability_routed_container():
+    """A container that declares the capability needs no runtime /meta probe."""
+    session = Session(
+        id="sess-1",
+        sandbox_id="sbx-1",
+        runtime_type="ship",
+        profile_id="missing-profile",
+        endpoint="http://primary-ship:8123",
+        containers=[
+            {
+                "name": "ship",
+                "endpoint": "http://ship:8123",
+                "runtime_type": "ship",
+                "capabilities": ["python"],
+            },
+            {
+                "name": "gull",
+                "endpoint": "http://gull:8115",
+                "runtime_type": "gull",
+                "capabilities": ["browser"],
+            },
+        ],
+    )
+    sandbox_mgr = AsyncMock()
+    sandbox_mgr.ensure_running.return_value = session
+    router = CapabilityRouter(sandbox_mgr, session_cache=RunningSessionCache())
+
+    with patch.object(router, "_require_capability", new=AsyncMock()) as require:
+        _, adapter = await router._resolve(AsyncMock(id="sbx-1"), "browser")
+
+    assert adapter.__class__.__name__ == "GullAdapter"
+    require.assert_not_awaited()
+
+
+def test_routes_are_memoized_per_session_containers(mock_sandbox_mgr):
+    """Routing runs once per capability until containers is reassigned."""
+    containers = [
+        {"name": "ship", "endpoint": "http://ship:8123", "capabilities": ["python"]},
+        {
+            "name": "gull",
+            "endpoint": "http://gull:8115",
+            "runtime_type": "gull",
+            "capabilities": ["browser"],
+        },
+    ]
+    session = Session(id="sess-1", sandbox_id="sbx-1", profile_id="missing", containers=containers)
+    router = CapabilityRouter(mock_sandbox_mgr)
+
+    with patch.object(router, "_route_multi", wraps=router._route_multi) as route_multi:
+        router._get_adapter(session, capability="browser")
+        router._get_adapter(session, capability="browser")
+        assert route_multi.call_count == 1
+
+        session.containers = [dict(c) for c in containers]
+        router._get_adapter(session, capability="browser")
+        assert route_multi.call_count == 2
@@ -0,0 +1,22 @@
+"""Unit tests for GC configuration defaults."""
+
+from __future__ import annotations
+
+from app.config import DatabaseConfig, GCConfig
+
+SQLITE = DatabaseConfig(url="sqlite+aiosqlite:///./bay.db")
+POSTGRES = DatabaseConfig(url="postgresql+asyncpg://bay@db/bay")
+
+
+class TestMaxConcurrentSandboxes:
+    def test_default_is_serial_on_sqlite(self):
+        assert GCConfig().get_max_concurrent_sandboxes(SQLITE) == 1
+
+    def test_default_overlaps_on_server_databases(self):
+        assert GCConfig().get_max_concurrent_sandboxes(POSTGRES) == 8
+
+    def test_explicit_value_wins(self):
+        config = GCConfig(max_concurrent_sandboxes=4)
+
+        assert config.get_max_concurrent_sandboxes(SQLITE) == 4
+        assert config.get_max_concurrent_sandboxes(POSTGRES) == 4
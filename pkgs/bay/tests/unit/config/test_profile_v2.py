@@ -500,6 +500,30 @@ class TestSessionModelMultiContainer:
         assert session.get_container_endpoint("browser") == "http://browser:8115"
         assert session.get_container_endpoint("unknown") is None
 
+    def test_container_lookups_follow_reassignment(self):
+        """Container lookups reflect a reassigned containers list."""
+        from app.models.session import Session
+
+        session = Session(
+            id="sess-test",
+            sandbox_id="sbx-test",
+            containers=[
+                {"name": "ship", "endpoint": "http://ship:8123", "capabilities": ["python"]},
+            ],
+        )
+        assert session.get_all_capabilities() == ["python"]
+
+        session.containers = [
+            {"name": "browser", "endpoint": "http://browser:8115", "capabilities": ["browser"]},
+        ]
+        assert session.get_container_for_capability("python") is None
+        assert session.get_container_endpoint("browser") == "http://browser:8115"
+        assert session.get_all_capabilities() == ["browser"]
+
+        session.containers = None
+        assert session.get_container_by_name("browser") is None
+        assert session.get_all_capabilities() == []
+
     def test_degraded_status_exists(self):
         """DEGRADED status should exist for multi-container partial failures."""
         from app.models.session import SessionStatus
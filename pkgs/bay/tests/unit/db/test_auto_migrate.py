@@ -0,0 +1,185 @@
+"""Unit tests for the create_all companion auto-migration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import inspect, or_, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from app.db.session import _auto_migrate_sync
+from app.models.skill import ExecutionHistory, ExecutionType, LearnStatus
+
+
+async def test_auto_migrate_adds_missing_model_indexes():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            # Simulate a database created before the composite index existed.
+            await conn.execute(text("DROP INDEX ix_cargos_owner_created_at_id"))
+
+            await conn.run_sync(_auto_migrate_sync)
+
+            index_names = await conn.run_sync(
+                lambda sync_conn: {idx["name"] for idx in inspect(sync_conn).get_indexes("cargos")}
+            )
+    finally:
+        await engine.dispose()
+
+    assert "ix_cargos_owner_created_at_id" in index_names
+
+
+async def test_active_sandbox_cargo_index_is_partial():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            result = await conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = 'ix_sandboxes_active_cargo_id'")
+            )
+            index_sql = result.scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert "WHERE deleted_at IS NULL" in index_sql
+
+
+async def test_gc_deadline_indexes_cover_live_rows_only():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            result = await conn.execute(
+                text(
+                    "SELECT name, sql FROM sqlite_master WHERE name IN "
+                    "('ix_sandboxes_live_expires_at', 'ix_sandboxes_live_idle_expires_at')"
+                )
+            )
+            index_sql = dict(result.all())
+    finally:
+        await engine.dispose()
+
+    assert "WHERE deleted_at IS NULL AND expires_at IS NOT NULL" in (
+        index_sql["ix_sandboxes_live_expires_at"]
+    )
+    assert "WHERE deleted_at IS NULL AND idle_expires_at IS NOT NULL" in (
+        index_sql["ix_sandboxes_live_idle_expires_at"]
+    )
+
+
+async def test_learning_queue_query_is_served_in_index_order():
+    query = (
+        select(ExecutionHistory.id)
+        .where(
+            ExecutionHistory.learn_enabled.is_(True),
+            ExecutionHistory.exec_type.in_([ExecutionType.BROWSER, ExecutionType.BROWSER_BATCH]),
+            or_(
+                ExecutionHistory.learn_status.is_(None),
+                ExecutionHistory.learn_status == LearnStatus.PENDING,
+            ),
+        )
+        .order_by(ExecutionHistory.created_at.asc())
+        .limit(50)
+    )
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            sql = str(query.compile(engine.sync_engine, compile_kwargs={"literal_binds": True}))
+            result = await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            plan = " | ".join(row[3] for row in result.all())
+    finally:
+        await engine.dispose()
+
+    assert "ix_execution_history_learn_queue" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+async def test_release_window_query_uses_owner_created_at_range():
+    query = select(ExecutionHistory.id).where(
+        ExecutionHistory.owner == "default",
+        ExecutionHistory.created_at >= datetime(2026, 1, 1),
+        ExecutionHistory.created_at <= datetime(2026, 1, 2),
+        ExecutionHistory.tags.ilike("%release:rel-1%"),
+    )
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            sql = str(query.compile(engine.sync_engine, compile_kwargs={"literal_binds": True}))
+            result = await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            plan = " | ".join(row[3] for row in result.all())
+    finally:
+        await engine.dispose()
+
+    assert "ix_execution_history_owner_created_at (owner=? AND created_at>? AND created_at<?)" in plan
+
+
+async def test_auto_migrate_skips_unique_index_over_duplicate_rows():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            # Simulate a database that picked up duplicate key hashes before
+            # the unique index existed.
+            await conn.execute(text("DROP INDEX uq_api_keys_key_hash"))
+            for key_id in ("ak-1", "ak-2"):
+                await conn.execute(
+                    text(
+                        "INSERT INTO api_keys (id, key_hash, key_prefix, owner, is_active, "
+                        "created_at) VALUES (:id, 'dup', 'sk-bay-dup', 'default', 1, "
+                        "'2026-01-01 00:00:00')"
+                    ),
+                    {"id": key_id},
+                )
+
+            await conn.run_sync(_auto_migrate_sync)
+
+            index_names = await conn.run_sync(
+                lambda sync_conn: {
+                    idx["name"] for idx in inspect(sync_conn).get_indexes("api_keys")
+                }
+            )
+            row_count = (await conn.execute(text("SELECT COUNT(*) FROM api_keys"))).scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert "uq_api_keys_key_hash" not in index_names
+    assert row_count == 2
+
+
+async def test_auto_migrate_survives_failed_index_creation(monkeypatch):
+    # Bypass the duplicate check so CREATE UNIQUE INDEX itself fails.
+    monkeypatch.setattr("app.db.session._has_duplicate_keys", lambda conn, index: False)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.execute(text("DROP INDEX uq_api_keys_key_hash"))
+            for key_id in ("ak-1", "ak-2"):
+                await conn.execute(
+                    text(
+                        "INSERT INTO api_keys (id, key_hash, key_prefix, owner, is_active, "
+                        "created_at) VALUES (:id, 'dup', 'sk-bay-dup', 'default', 1, "
+                        "'2026-01-01 00:00:00')"
+                    ),
+                    {"id": key_id},
+                )
+
+            await conn.run_sync(_auto_migrate_sync)
+            # The surrounding transaction is still usable.
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+            index_names = await conn.run_sync(
+                lambda sync_conn: {
+                    idx["name"] for idx in inspect(sync_conn).get_indexes("api_keys")
+                }
+            )
+            row_count = (await conn.execute(text("SELECT COUNT(*) FROM api_keys"))).scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert "uq_api_keys_key_hash" not in index_names
+    assert row_count == 2
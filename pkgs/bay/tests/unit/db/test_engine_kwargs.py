@@ -0,0 +1,67 @@
+"""Unit tests for async engine configuration."""
+
+from __future__ import annotations
+
+from app.config import DatabaseConfig
+from app.db.session import _engine_kwargs
+
+
+def test_sqlite_keeps_dialect_pool_defaults():
+    kwargs = _engine_kwargs(DatabaseConfig(url="sqlite+aiosqlite:///./bay.db"))
+
+    assert "pool_size" not in kwargs
+    assert "max_overflow" not in kwargs
+
+
+async def test_json_codec_round_trips_session_containers():
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlmodel import SQLModel, select
+
+    from app.models.session import Session
+
+    containers = [{"name": "ship", "endpoint": "http://ship:8123", "capabilities": ["python"]}]
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        **_engine_kwargs(DatabaseConfig(url="sqlite+aiosqlite:///:memory:")),
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with factory() as db:
+            db.add(Session(id="sess-1", sandbox_id="sbx-1", containers=containers))
+            await db.commit()
+        async with factory() as db:
+            loaded = (await db.execute(select(Session))).scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert loaded.containers == containers
+
+
+def test_postgres_applies_pool_tuning():
+    kwargs = _engine_kwargs(
+        DatabaseConfig(url="postgresql+asyncpg://bay:secret@db/bay", pool_size=30)
+    )
+
+    assert kwargs["pool_size"] == 30
+    assert kwargs["max_overflow"] == 10
+    assert kwargs["pool_recycle"] == 300
+    assert kwargs["pool_pre_ping"] is False
+    assert kwargs["query_cache_size"] == 1200
+    assert kwargs["connect_args"] == {"prepared_statement_cache_size": 1024}
+
+
+def test_postgres_can_disable_jit():
+    kwargs = _engine_kwargs(
+        DatabaseConfig(url="postgresql+asyncpg://bay:secret@db/bay", postgres_disable_jit=True)
+    )
+
+    assert kwargs["connect_args"]["server_settings"] == {"jit": "off"}
+
+
+def test_psycopg_gets_no_asyncpg_connect_args():
+    kwargs = _engine_kwargs(DatabaseConfig(url="postgresql+psycopg://bay:secret@db/bay"))
+
+    assert "connect_args" not in kwargs
@@ -361,3 +361,44 @@ class TestDockerDriverConnectModes:
                 endpoint = driver._endpoint_from_hostport(hp[0], hp[1])
 
         assert endpoint == "http://127.0.0.1:44444"
+
+
+class TestDockerDriverListRuntimeInstances:
+    """list_runtime_instances builds instances from the list summary alone."""
+
+    @pytest.mark.asyncio
+    async def test_uses_list_summary_without_inspect(self):
+        from unittest.mock import AsyncMock, MagicMock
+
+        import structlog
+        from aiodocker.containers import DockerContainer
+
+        summary = {
+            "Id": "abc123",
+            "Names": ["/bay-session-sess-1"],
+            "Labels": {"bay.managed": "true", "bay.session_id": "sess-1"},
+            "State": "exited",
+            "Created": 1767225600,
+        }
+        container = DockerContainer(MagicMock(), **summary)
+        container.show = AsyncMock(side_effect=AssertionError("no inspect expected"))
+
+        client = MagicMock()
+        client.containers.list = AsyncMock(return_value=[container])
+
+        driver = DockerDriver.__new__(DockerDriver)
+        driver._log = structlog.get_logger()
+        driver._get_client = AsyncMock(return_value=client)
+
+        instances = await driver.list_runtime_instances(labels={"bay.managed": "true"})
+
+        client.containers.list.assert_awaited_once_with(
+            all=True, filters={"label": ["bay.managed=true"]}
+        )
+        assert len(instances) == 1
+        instance = instances[0]
+        assert instance.id == "abc123"
+        assert instance.name == "bay-session-sess-1"
+        assert instance.labels == summary["Labels"]
+        assert instance.state == "exited"
+        assert instance.created_at == "2026-01-01T00:00:00+00:00"
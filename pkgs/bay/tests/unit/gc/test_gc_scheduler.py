@@ -92,6 +92,87 @@ class TestGCScheduler:
         assert task1.run_count == 1
         assert task2.run_count == 1
 
+    @pytest.mark.asyncio
+    async def test_run_once_is_serial_by_default(self, gc_config):
+        """Without concurrent=True each task finishes before the next starts."""
+        order: list[str] = []
+
+        class RecordingGCTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                order.append(f"{self.name}:start")
+                await asyncio.sleep(0)
+                order.append(f"{self.name}:end")
+                return await super().run()
+
+        scheduler = GCScheduler(
+            tasks=[RecordingGCTask("task1"), RecordingGCTask("task2")], config=gc_config
+        )
+        await scheduler.run_once()
+
+        assert order == ["task1:start", "task1:end", "task2:start", "task2:end"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrent", [False, True])
+    async def test_orphan_cargo_does_not_race_expired_sandbox_cascade(
+        self, gc_config, concurrent
+    ):
+        """Both tasks targeting one cargo in a cycle delete its volume once."""
+        state = {"sandbox_deleted": False, "cargo_exists": True}
+        volume_deletes: list[str] = []
+
+        class ExpiredSandboxTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                # Soft delete committed first, then the managed-cargo cascade
+                state["sandbox_deleted"] = True
+                await asyncio.sleep(0)  # session teardown
+                volume_deletes.append(self.name)
+                state["cargo_exists"] = False
+                return await super().run()
+
+        class OrphanCargoTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                if state["sandbox_deleted"] and state["cargo_exists"]:
+                    volume_deletes.append(self.name)
+                    state["cargo_exists"] = False
+                return await super().run()
+
+        scheduler = GCScheduler(
+            tasks=[
+                ExpiredSandboxTask("expired_sandbox"),
+                OrphanCargoTask("orphan_cargo"),
+                FakeGCTask("orphan_container"),
+            ],
+            config=gc_config,
+            concurrent=concurrent,
+        )
+        results = await scheduler.run_once()
+
+        assert [r.task_name for r in results] == [
+            "expired_sandbox",
+            "orphan_cargo",
+            "orphan_container",
+        ]
+        assert volume_deletes == ["expired_sandbox"]
+
+    @pytest.mark.asyncio
+    async def test_run_once_overlaps_tasks_when_concurrent(self, gc_config):
+        """Concurrent tasks in one cycle overlap, results in task order."""
+        both_started = asyncio.Barrier(2)
+
+        class BarrierGCTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return await super().run()
+
+        task1 = BarrierGCTask("task1", cleaned=1)
+        task2 = BarrierGCTask("task2", cleaned=2)
+
+        scheduler = GCScheduler(tasks=[task1, task2], config=gc_config, concurrent=True)
+        results = await scheduler.run_once()
+
+        assert [r.task_name for r in results] == ["task1", "task2"]
+        assert [r.errors for r in results] == [[], []]
+
     @pytest.mark.asyncio
     async def test_run_once_continues_after_task_failure(self, gc_config):
         """run_once should continue executing remaining tasks after one fails."""
@@ -115,6 +196,26 @@ class TestGCScheduler:
         assert task2.run_count == 1
         assert task3.run_count == 1
 
+    @pytest.mark.asyncio
+    async def test_run_once_records_task_duration(self, gc_config):
+        """Each result should carry the task's wall time, including failures."""
+
+        class SlowGCTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                await asyncio.sleep(0.02)
+                return await super().run()
+
+        scheduler = GCScheduler(
+            tasks=[SlowGCTask("slow"), RaisingGCTask("boom", RuntimeError("x"))],
+            config=gc_config,
+        )
+
+        slow, boom = await scheduler.run_once()
+
+        assert slow.duration_ms >= 15
+        assert boom.duration_ms >= 0
+        assert not boom.success
+
     @pytest.mark.asyncio
     async def test_run_once_collects_errors(self, gc_config):
         """run_once should collect errors from tasks."""
@@ -238,6 +339,39 @@ class TestGCScheduler:
         await scheduler.stop()
         assert not scheduler.is_running
 
+    @pytest.mark.asyncio
+    async def test_stop_lets_in_flight_cycle_finish(self, gc_config):
+        """stop() should wake the loop and wait for the current cycle, not cancel it."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        finished: list[bool] = []
+
+        class BlockingGCTask(FakeGCTask):
+            async def run(self) -> GCResult:
+                started.set()
+                await release.wait()
+                finished.append(True)
+                return await super().run()
+
+        task = BlockingGCTask("task1")
+        gc_config.run_on_startup = False
+        gc_config.interval_seconds = 3600
+
+        scheduler = GCScheduler(tasks=[task], config=gc_config)
+        await scheduler.start()
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        stopping = asyncio.create_task(scheduler.stop())
+        await asyncio.sleep(0.01)
+        assert not stopping.done()
+
+        release.set()
+        await asyncio.wait_for(stopping, timeout=1)
+
+        assert finished == [True]
+        assert task.run_count == 1
+        assert not scheduler.is_running
+
 
 class TestNoopCoordinator:
     """Tests for NoopCoordinator."""
@@ -7,10 +7,12 @@ Includes edge cases: _process_sandbox returns False, delete errors, etc.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from structlog.testing import capture_logs
 
 from app.config import GCConfig, GCTaskConfig
 from app.drivers.base import RuntimeInstance
@@ -29,15 +31,9 @@ class TestIdleSessionGCQueryConditions:
         driver = FakeDriver()
         db_session = AsyncMock()
 
-        # Mock sandbox that is idle-expired
-        expired_sandbox = MagicMock()
-        expired_sandbox.id = "sandbox-1"
-        expired_sandbox.deleted_at = None
-        expired_sandbox.idle_expires_at = utcnow() - timedelta(minutes=5)
-
-        # Mock the DB query result
+        # Mock the DB query result: the scan projects sandbox ids only
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [expired_sandbox]
+        result_mock.scalars.return_value.all.return_value = ["sandbox-1"]
         db_session.execute.return_value = result_mock
 
         task = IdleSessionGC(driver, db_session)
@@ -79,11 +75,8 @@ class TestIdleSessionGCQueryConditions:
         driver = FakeDriver()
         db_session = AsyncMock()
 
-        sandbox1 = MagicMock(id="sandbox-1", deleted_at=None)
-        sandbox2 = MagicMock(id="sandbox-2", deleted_at=None)
-
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [sandbox1, sandbox2]
+        result_mock.scalars.return_value.all.return_value = ["sandbox-1", "sandbox-2"]
         db_session.execute.return_value = result_mock
 
         task = IdleSessionGC(driver, db_session)
@@ -104,11 +97,8 @@ class TestIdleSessionGCQueryConditions:
         driver = FakeDriver()
         db_session = AsyncMock()
 
-        sandbox1 = MagicMock(id="sandbox-1", deleted_at=None)
-        sandbox2 = MagicMock(id="sandbox-2", deleted_at=None)
-
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [sandbox1, sandbox2]
+        result_mock.scalars.return_value.all.return_value = ["sandbox-1", "sandbox-2"]
         db_session.execute.return_value = result_mock
 
         task = IdleSessionGC(driver, db_session)
@@ -133,15 +123,9 @@ class TestExpiredSandboxGCQueryConditions:
         driver = FakeDriver()
         db_session = AsyncMock()
 
-        expired_sandbox = MagicMock()
-        expired_sandbox.id = "sandbox-1"
-        expired_sandbox.owner = "default"
-        expired_sandbox.cargo_id = "ws-1"
-        expired_sandbox.deleted_at = None
-        expired_sandbox.expires_at = utcnow() - timedelta(hours=1)
-
+        # The scan projects (id, owner, cargo_id) rows
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [expired_sandbox]
+        result_mock.all.return_value = [("sandbox-1", "default", "ws-1")]
         db_session.execute.return_value = result_mock
 
         task = ExpiredSandboxGC(driver, db_session)
@@ -161,7 +145,7 @@ class TestExpiredSandboxGCQueryConditions:
         db_session = AsyncMock()
 
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = []
+        result_mock.all.return_value = []
         db_session.execute.return_value = result_mock
 
         task = ExpiredSandboxGC(driver, db_session)
@@ -178,11 +162,8 @@ class TestExpiredSandboxGCQueryConditions:
         driver = FakeDriver()
         db_session = AsyncMock()
 
-        sandbox1 = MagicMock(id="sandbox-1", deleted_at=None)
-        sandbox2 = MagicMock(id="sandbox-2", deleted_at=None)
-
         result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [sandbox1, sandbox2]
+        result_mock.all.return_value = [("sandbox-1", "u", None), ("sandbox-2", "u", None)]
         db_session.execute.return_value = result_mock
 
         task = ExpiredSandboxGC(driver, db_session)
@@ -195,6 +176,153 @@ class TestExpiredSandboxGCQueryConditions:
         assert len(result.errors) == 1
         assert "sandbox-1" in result.errors[0]
 
+    @staticmethod
+    async def _run_process_sandbox(sandbox_expires_at, *, now, calls=None):
+        """Run _process_sandbox for "sbx-1" against an in-memory SQLite DB.
+
+        If `calls` is given, commits and session destroys are appended to it.
+
+        Returns (cleaned, reloaded sandbox, destroyed session ids, statements).
+        """
+        calls = [] if calls is None else calls
+        from sqlalchemy import event
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlmodel import SQLModel
+
+        from app.models.sandbox import Sandbox
+        from app.models.session import Session
+        from app.services.gc.tasks.expired_sandbox import ExpiredSandboxGC
+        from tests.fakes import FakeDriver
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.create_all)
+
+            factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            async with factory() as db:
+                db.add_all(
+                    [
+                        Sandbox(id="sbx-1", owner="u", expires_at=sandbox_expires_at),
+                        Session(id="sess-a", sandbox_id="sbx-1"),
+                        Session(id="sess-b", sandbox_id="sbx-1"),
+                        Session(id="sess-other", sandbox_id="sbx-2"),
+                    ]
+                )
+                await db.commit()
+
+                task = ExpiredSandboxGC(FakeDriver(), db)
+                task._session_mgr = MagicMock()
+                task._session_mgr.destroy_many = AsyncMock(
+                    side_effect=lambda sessions: calls.append("destroy") or {}
+                )
+                commit = db.commit
+
+                async def tracked_commit():
+                    calls.append("commit")
+                    await commit()
+
+                db.commit = tracked_commit
+
+                statements: list[str] = []
+                event.listen(
+                    engine.sync_engine,
+                    "before_cursor_execute",
+                    lambda conn, cursor, statement, *args: statements.append(statement),
+                )
+
+                cleaned = await task._process_sandbox("sbx-1", "u", "ws-gone", now=now)
+
+                db.expunge_all()
+                sandbox = await db.get(Sandbox, "sbx-1")
+        finally:
+            await engine.dispose()
+
+        destroy_calls = task._session_mgr.destroy_many.await_args_list
+        destroyed = sorted(s.id for c in destroy_calls for s in c.args[0])
+        return cleaned, sandbox, destroyed, statements
+
+    @pytest.mark.asyncio
+    async def test_process_sandbox_soft_deletes_in_one_conditional_update(self):
+        """The TTL check and soft delete are one UPDATE; all sessions are destroyed."""
+        now = utcnow()
+        cleaned, sandbox, destroyed, statements = await self._run_process_sandbox(
+            now - timedelta(hours=1), now=now
+        )
+
+        assert cleaned is True
+        assert sandbox.deleted_at is not None
+        assert sandbox.current_session_id is None
+        assert destroyed == ["sess-a", "sess-b"]
+        assert statements[0].startswith("UPDATE sandboxes SET")
+        assert "sandboxes.expires_at < ?" in statements[0]
+        assert not any("FOR UPDATE" in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_process_sandbox_rechecks_against_scan_time(self):
+        """A TTL pushed past the scan's reference time is skipped."""
+        now = utcnow()
+        cleaned, sandbox, destroyed, _ = await self._run_process_sandbox(
+            now + timedelta(seconds=1), now=now
+        )
+
+        assert cleaned is False
+        assert sandbox.deleted_at is None
+        assert destroyed == []
+
+    @pytest.mark.asyncio
+    async def test_process_sandbox_commits_soft_delete_before_driver_calls(self):
+        """The soft delete is committed before sessions are destroyed."""
+        calls: list[str] = []
+        now = utcnow()
+        cleaned, _, _, _ = await self._run_process_sandbox(
+            now - timedelta(hours=1), now=now, calls=calls
+        )
+
+        assert cleaned is True
+        assert calls == ["commit", "destroy"]
+
+    @pytest.mark.asyncio
+    async def test_processes_sandboxes_concurrently_with_session_factory(self):
+        """With a session factory, sandboxes overlap up to max_concurrency."""
+        from contextlib import asynccontextmanager
+
+        from app.services.gc.tasks.expired_sandbox import ExpiredSandboxGC
+        from tests.fakes import FakeDriver
+
+        db_session = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.all.return_value = [(f"sandbox-{i}", "default", None) for i in range(5)]
+        db_session.execute.return_value = result_mock
+
+        @asynccontextmanager
+        async def session_factory():
+            yield AsyncMock()
+
+        task = ExpiredSandboxGC(
+            FakeDriver(), db_session, session_factory=session_factory, max_concurrency=2
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def process(sandbox_id, owner, cargo_id, *, now):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return sandbox_id != "sandbox-3"
+
+        task._process_sandbox = process
+
+        result = await task.run()
+
+        assert peak == 2
+        assert result.cleaned_count == 4
+        assert result.skipped_count == 1
+
 
 class TestOrphanContainerGCStrictMode:
     """Tests for OrphanContainerGC strict mode safety checks."""
@@ -298,10 +426,15 @@ class TestOrphanContainerGCStrictMode:
         driver.list_runtime_instances = AsyncMock(return_value=[instance])
 
         task = OrphanContainerGC(driver, db_session, config)
-        result = await task.run()
+        with capture_logs() as logs:
+            result = await task.run()
 
         assert result.cleaned_count == 0
         assert result.skipped_count == 1
+        (skip,) = [e for e in logs if e["event"] == "gc.orphan_container.skip.instance_mismatch"]
+        assert skip["container_instance_id"] == "bay-2"
+        assert skip["expected_instance_id"] == "bay-1"
+        assert "labels" not in skip
 
     @pytest.mark.asyncio
     async def test_skips_containers_not_managed(self):
@@ -361,7 +494,7 @@ class TestOrphanContainerGCStrictMode:
 
         # Session exists in DB
         db_result = MagicMock()
-        db_result.scalars.return_value.first.return_value = "sess-1"
+        db_result.scalars.return_value.all.return_value = ["sess-1"]
         db_session.execute.return_value = db_result
 
         task = OrphanContainerGC(driver, db_session, config)
@@ -398,7 +531,7 @@ class TestOrphanContainerGCStrictMode:
 
         # Session does NOT exist in DB
         db_result = MagicMock()
-        db_result.scalars.return_value.first.return_value = None
+        db_result.scalars.return_value.all.return_value = []
         db_session.execute.return_value = db_result
 
         task = OrphanContainerGC(driver, db_session, config)
@@ -407,6 +540,75 @@ class TestOrphanContainerGCStrictMode:
         assert result.cleaned_count == 1
         driver.destroy_runtime_instance.assert_called_once_with("container-1")
 
+    @pytest.mark.asyncio
+    async def test_checks_sessions_in_one_query_and_destroys_concurrently(self):
+        """Should look up candidate sessions in one query and destroy orphans in parallel."""
+        from app.services.gc.tasks.orphan_container import OrphanContainerGC
+        from tests.fakes import FakeDriver
+
+        driver = FakeDriver()
+        db_session = AsyncMock()
+        config = self._create_gc_config()
+
+        def make_instance(session_id: str) -> RuntimeInstance:
+            return RuntimeInstance(
+                id=f"container-{session_id}",
+                name=f"bay-session-{session_id}",
+                labels={
+                    "bay.session_id": session_id,
+                    "bay.sandbox_id": "sandbox-1",
+                    "bay.cargo_id": "ws-1",
+                    "bay.instance_id": "bay",
+                    "bay.managed": "true",
+                },
+                state="running",
+            )
+
+        driver.list_runtime_instances = AsyncMock(
+            return_value=[make_instance(sid) for sid in ("sess-live", "sess-gone-1", "sess-gone-2")]
+        )
+        both_started = asyncio.Barrier(2)
+
+        async def destroy(container_id: str) -> None:
+            # Both orphans must be in flight at once for the barrier to open.
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            if container_id == "container-sess-gone-2":
+                raise RuntimeError("busy")
+
+        driver.destroy_runtime_instance = AsyncMock(side_effect=destroy)
+
+        db_result = MagicMock()
+        db_result.scalars.return_value.all.return_value = ["sess-live"]
+        db_session.execute.return_value = db_result
+
+        task = OrphanContainerGC(driver, db_session, config)
+        result = await task.run()
+
+        db_session.execute.assert_awaited_once()
+        assert sorted(c.args[0] for c in driver.destroy_runtime_instance.await_args_list) == [
+            "container-sess-gone-1",
+            "container-sess-gone-2",
+        ]
+        assert result.cleaned_count == 1
+        assert result.skipped_count == 1
+        assert result.errors == ["container container-sess-gone-2: busy"]
+
+    @pytest.mark.asyncio
+    async def test_skips_db_query_without_candidates(self):
+        """Should not query the DB when no container passes the label checks."""
+        from app.services.gc.tasks.orphan_container import OrphanContainerGC
+        from tests.fakes import FakeDriver
+
+        driver = FakeDriver()
+        db_session = AsyncMock()
+        driver.list_runtime_instances = AsyncMock(return_value=[])
+
+        task = OrphanContainerGC(driver, db_session, self._create_gc_config())
+        result = await task.run()
+
+        db_session.execute.assert_not_awaited()
+        assert result.cleaned_count == 0
+
 
 class TestOrphanCargoGC:
     """Tests for OrphanCargoGC."""
@@ -425,13 +627,17 @@ class TestOrphanCargoGC:
         task = OrphanCargoGC(driver, db_session)
         task._find_orphans = AsyncMock(return_value=["ws-orphan-1", "ws-orphan-2"])
         task._cargo_mgr = MagicMock()
-        task._cargo_mgr.delete_internal_by_id = AsyncMock()
+        task._cargo_mgr.delete_internal_bulk = AsyncMock(
+            return_value={"ws-orphan-1": None, "ws-orphan-2": None}
+        )
 
         result = await task.run()
 
         assert result.cleaned_count == 2
         assert result.skipped_count == 0
-        assert task._cargo_mgr.delete_internal_by_id.call_count == 2
+        task._cargo_mgr.delete_internal_bulk.assert_awaited_once_with(
+            ["ws-orphan-1", "ws-orphan-2"]
+        )
 
     @pytest.mark.asyncio
     async def test_orphan_cargo_skips_when_runtime_still_references_volume(self):
@@ -458,13 +664,13 @@ class TestOrphanCargoGC:
         task = OrphanCargoGC(driver, db_session)
         task._find_orphans = AsyncMock(return_value=["ws-orphan-1"])
         task._cargo_mgr = MagicMock()
-        task._cargo_mgr.delete_internal_by_id = AsyncMock()
+        task._cargo_mgr.delete_internal_bulk = AsyncMock()
 
         result = await task.run()
 
         assert result.cleaned_count == 0
         assert result.skipped_count == 1
-        task._cargo_mgr.delete_internal_by_id.assert_not_called()
+        task._cargo_mgr.delete_internal_bulk.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_orphan_cargo_no_orphans(self):
@@ -480,12 +686,79 @@ class TestOrphanCargoGC:
         task = OrphanCargoGC(driver, db_session)
         task._find_orphans = AsyncMock(return_value=[])
         task._cargo_mgr = MagicMock()
-        task._cargo_mgr.delete_internal_by_id = AsyncMock()
+        task._cargo_mgr.delete_internal_bulk = AsyncMock()
 
         result = await task.run()
 
         assert result.cleaned_count == 0
-        assert task._cargo_mgr.delete_internal_by_id.call_count == 0
+        task._cargo_mgr.delete_internal_bulk.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_orphan_cargo_reports_volume_failures(self):
+        """A failed volume delete is reported as an item error, not a cleaned cargo."""
+        from app.services.gc.tasks.orphan_cargo import OrphanCargoGC
+        from tests.fakes import FakeDriver
+
+        driver = FakeDriver()
+        driver.list_runtime_instances = AsyncMock(return_value=[])
+
+        task = OrphanCargoGC(driver, AsyncMock())
+        task._find_orphans = AsyncMock(return_value=["ws-ok", "ws-busy"])
+        task._cargo_mgr = MagicMock()
+        task._cargo_mgr.delete_internal_bulk = AsyncMock(
+            return_value={"ws-ok": None, "ws-busy": RuntimeError("volume busy")}
+        )
+
+        result = await task.run()
+
+        assert result.cleaned_count == 1
+        assert result.errors == ["cargo ws-busy: volume busy"]
+
+    @pytest.mark.asyncio
+    async def test_find_orphans_covers_both_cases_in_one_query(self):
+        """Unowned managed cargos and cargos of deleted sandboxes are found once each."""
+        from sqlalchemy import event
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlmodel import SQLModel
+
+        from app.models.cargo import Cargo
+        from app.models.sandbox import Sandbox
+        from app.services.gc.tasks.orphan_cargo import OrphanCargoGC
+        from tests.fakes import FakeDriver
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.create_all)
+
+            factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            async with factory() as db:
+                db.add_all(
+                    [
+                        Cargo(id="ws-unowned", owner="u"),
+                        Cargo(id="ws-dead", owner="u", managed_by_sandbox_id="sbx-dead"),
+                        Cargo(id="ws-live", owner="u", managed_by_sandbox_id="sbx-live"),
+                        Cargo(id="ws-external", owner="u", managed=False),
+                        Sandbox(id="sbx-dead", owner="u", deleted_at=utcnow()),
+                        Sandbox(id="sbx-live", owner="u"),
+                    ]
+                )
+                await db.commit()
+
+                statements: list[str] = []
+                event.listen(
+                    engine.sync_engine,
+                    "before_cursor_execute",
+                    lambda conn, cursor, statement, *args: statements.append(statement),
+                )
+
+                orphans = await OrphanCargoGC(FakeDriver(), db)._find_orphans()
+        finally:
+            await engine.dispose()
+
+        assert sorted(orphans) == ["ws-dead", "ws-unowned"]
+        assert len(statements) == 1
 
 
 class TestGCConfigInstanceId:
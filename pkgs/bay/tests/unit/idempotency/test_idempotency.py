@@ -9,7 +9,7 @@ Tests cover:
 - Field persistence verification
 """
 
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -276,6 +276,41 @@ class TestIdempotencyServiceCheck:
         assert result is None
 
 
+class TestIdempotencyKeyExpiry:
+    """Tests for IdempotencyKey.is_expired()."""
+
+    def test_epoch_matches_expires_at(self):
+        """epoch_of converts naive-UTC datetimes to Unix seconds."""
+        expires_at = utcnow().replace(microsecond=0)
+        epoch = IdempotencyKey.epoch_of(expires_at)
+        assert datetime.fromtimestamp(epoch, UTC).replace(tzinfo=None) == expires_at
+
+    @pytest.mark.parametrize(
+        ("offset", "expired"),
+        [(timedelta(hours=-1), True), (timedelta(hours=1), False)],
+    )
+    def test_is_expired_uses_epoch(self, offset: timedelta, expired: bool):
+        """The epoch column decides expiry when set."""
+        expires_at = utcnow() + offset
+        record = IdempotencyKey(
+            owner="user1",
+            key="k",
+            # Contradicts the epoch on purpose: only the epoch should be consulted
+            expires_at=utcnow() - offset,
+            expires_at_epoch=IdempotencyKey.epoch_of(expires_at),
+        )
+        assert record.is_expired() is expired
+
+    def test_is_expired_falls_back_to_datetime_for_legacy_rows(self):
+        """Rows without an epoch still expire by expires_at."""
+        record = IdempotencyKey(
+            owner="user1",
+            key="k",
+            expires_at=utcnow() - timedelta(hours=1),
+        )
+        assert record.is_expired() is True
+
+
 class TestIdempotencyServiceSave:
     """Tests for IdempotencyService.save() method."""
 
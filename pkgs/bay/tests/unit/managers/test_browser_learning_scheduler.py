@@ -413,6 +413,32 @@ async def test_processor_marks_execution_error_when_trace_ref_is_invalid(
     assert "Artifact blob not found" in refreshed.learn_error
 
 
+@pytest.mark.asyncio
+async def test_get_artifact_blobs_by_refs_filters_owner_and_bad_refs(
+    skill_service: SkillLifecycleService,
+):
+    mine = await skill_service.create_artifact_blob(
+        owner="default", kind="browser_trace", payload={"steps": []}
+    )
+    theirs = await skill_service.create_artifact_blob(
+        owner="other", kind="browser_trace", payload={"steps": []}
+    )
+    mine_ref = skill_service.make_blob_ref(mine.id)
+    theirs_ref = skill_service.make_blob_ref(theirs.id)
+
+    blobs = await skill_service.get_artifact_blobs_by_refs(
+        refs=[
+            ("default", mine_ref),
+            ("default", theirs_ref),
+            ("default", "not-a-blob-ref"),
+            ("default", "blob:does-not-exist"),
+        ]
+    )
+
+    assert list(blobs) == [("default", mine_ref)]
+    assert blobs[("default", mine_ref)].id == mine.id
+
+
 @pytest.mark.asyncio
 async def test_auto_stable_promotion_blocked_when_auto_release_disabled(
     skill_service: SkillLifecycleService,
@@ -6,6 +6,7 @@ Includes new tests for managed filter and delete protection.
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
@@ -14,8 +15,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, select
 
 from app.config import ProfileConfig, ResourceSpec, Settings
-from app.errors import ConflictError, NotFoundError
-from app.managers.cargo import CargoManager
+from app.errors import ConflictError, NotFoundError, ValidationError
+from app.managers.cargo import CargoManager, CargoRow
 from app.models.cargo import Cargo
 from app.models.sandbox import Sandbox
 from app.utils.datetime import utcnow
@@ -109,6 +110,7 @@ class TestCargoManagerCreate:
 
         # Assert volume was created
         assert len(fake_driver.create_volume_calls) == 1
+        assert fake_driver.create_volume_calls[0]["labels"]["bay.managed"] == "false"
 
     async def test_create_managed_cargo(
         self,
@@ -127,6 +129,7 @@ class TestCargoManagerCreate:
         # Assert
         assert cargo.managed is True
         assert cargo.managed_by_sandbox_id == "sandbox-123"
+        assert fake_driver.create_volume_calls[0]["labels"]["bay.managed"] == "true"
 
     async def test_create_cargo_with_size_limit(
         self,
@@ -218,6 +221,50 @@ class TestCargoManagerList:
         assert len(cargos) == 2
         assert cursor is not None
 
+    async def test_list_pagination_walks_newest_first_without_overlap(
+        self,
+        cargo_manager: CargoManager,
+        db_session: AsyncSession,
+    ):
+        """Keyset cursor walks all cargos newest first, each exactly once."""
+        # Arrange - two cargos share a created_at to exercise the id tie-breaker
+        created = [await cargo_manager.create(owner="test-user", managed=False) for _ in range(5)]
+        created[1].created_at = created[2].created_at
+        await db_session.commit()
+
+        # Act
+        seen: list[CargoRow] = []
+        cursor = None
+        while True:
+            page, cursor = await cargo_manager.list(owner="test-user", limit=2, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        # Assert
+        expected = sorted(created, key=lambda c: (c.created_at, c.id), reverse=True)
+        assert [c.id for c in seen] == [c.id for c in expected]
+
+    async def test_list_accepts_legacy_id_cursor(
+        self,
+        cargo_manager: CargoManager,
+    ):
+        """A bare cargo id cursor from before keyset pagination resumes after that cargo."""
+        created = [await cargo_manager.create(owner="test-user", managed=False) for _ in range(3)]
+        newest_first = sorted(created, key=lambda c: (c.created_at, c.id), reverse=True)
+
+        page, _ = await cargo_manager.list(owner="test-user", cursor=newest_first[0].id)
+
+        assert [c.id for c in page] == [c.id for c in newest_first[1:]]
+
+    async def test_list_invalid_cursor_raises_validation_error(
+        self,
+        cargo_manager: CargoManager,
+    ):
+        """Malformed cursor is rejected instead of silently returning page one."""
+        with pytest.raises(ValidationError):
+            await cargo_manager.list(owner="test-user", cursor="not-a-cursor")
+
     async def test_list_respects_owner(
         self,
         cargo_manager: CargoManager,
@@ -235,6 +282,29 @@ class TestCargoManagerList:
         assert len(cargos) == 1
         assert cargos[0].owner == "user-a"
 
+    async def test_list_returns_plain_rows(
+        self,
+        cargo_manager: CargoManager,
+    ):
+        """List returns lightweight rows rather than ORM instances."""
+        created = await cargo_manager.create(owner="test-user", managed=False)
+
+        cargos, _ = await cargo_manager.list(owner="test-user")
+
+        assert cargos == [
+            CargoRow(
+                id=created.id,
+                owner=created.owner,
+                backend=created.backend,
+                driver_ref=created.driver_ref,
+                managed=created.managed,
+                managed_by_sandbox_id=created.managed_by_sandbox_id,
+                size_limit_mb=created.size_limit_mb,
+                created_at=created.created_at,
+                last_accessed_at=created.last_accessed_at,
+            )
+        ]
+
 
 class TestCargoManagerGet:
     """Unit tests for CargoManager.get."""
@@ -275,6 +345,38 @@ class TestCargoManagerGet:
             await cargo_manager.get(created.id, owner="user-b")
 
 
+class TestCargoManagerTouch:
+    """Unit tests for CargoManager.touch."""
+
+    async def test_touch_updates_last_accessed_at(
+        self,
+        cargo_manager: CargoManager,
+        db_session: AsyncSession,
+    ):
+        """Touch bumps last_accessed_at in the database."""
+        # Arrange
+        cargo = await cargo_manager.create(owner="test-user", managed=False)
+        stale = utcnow() - timedelta(hours=1)
+        cargo.last_accessed_at = stale
+        await db_session.commit()
+
+        # Act
+        await cargo_manager.touch(cargo.id)
+
+        # Assert
+        result = await db_session.execute(
+            select(Cargo.last_accessed_at).where(Cargo.id == cargo.id)
+        )
+        assert result.scalar_one() > stale
+
+    async def test_touch_missing_cargo_is_noop(
+        self,
+        cargo_manager: CargoManager,
+    ):
+        """Touch on a missing cargo does not raise."""
+        await cargo_manager.touch("ws-nonexistent")
+
+
 class TestCargoManagerDelete:
     """Unit tests for CargoManager.delete with protection logic."""
 
@@ -327,6 +429,64 @@ class TestCargoManagerDelete:
         assert "active_sandbox_ids" in exc_info.value.details
         assert "sandbox-test-123" in exc_info.value.details["active_sandbox_ids"]
 
+    async def test_delete_external_cargo_reports_only_active_sandboxes(
+        self,
+        cargo_manager: CargoManager,
+        db_session: AsyncSession,
+    ):
+        """ConflictError lists every active referencing sandbox and no deleted ones."""
+        # Arrange
+        cargo = await cargo_manager.create(owner="test-user", managed=False)
+        for sandbox_id, deleted_at in [
+            ("sandbox-active-1", None),
+            ("sandbox-active-2", None),
+            ("sandbox-gone-1", utcnow()),
+        ]:
+            db_session.add(
+                Sandbox(
+                    id=sandbox_id,
+                    owner="test-user",
+                    profile_id="python-default",
+                    cargo_id=cargo.id,
+                    deleted_at=deleted_at,
+                )
+            )
+        await db_session.commit()
+
+        # Act & Assert
+        with pytest.raises(ConflictError) as exc_info:
+            await cargo_manager.delete(cargo.id, owner="test-user")
+
+        assert sorted(exc_info.value.details["active_sandbox_ids"]) == [
+            "sandbox-active-1",
+            "sandbox-active-2",
+        ]
+
+    async def test_delete_external_cargo_caps_reported_active_sandboxes(
+        self,
+        cargo_manager: CargoManager,
+        db_session: AsyncSession,
+    ):
+        """ConflictError payload is bounded for heavily referenced cargos."""
+        # Arrange
+        cargo = await cargo_manager.create(owner="test-user", managed=False)
+        for i in range(25):
+            db_session.add(
+                Sandbox(
+                    id=f"sandbox-{i:02d}",
+                    owner="test-user",
+                    profile_id="python-default",
+                    cargo_id=cargo.id,
+                )
+            )
+        await db_session.commit()
+
+        # Act & Assert
+        with pytest.raises(ConflictError) as exc_info:
+            await cargo_manager.delete(cargo.id, owner="test-user")
+
+        assert len(exc_info.value.details["active_sandbox_ids"]) == 20
+
     async def test_delete_external_cargo_after_sandbox_soft_deleted(
         self,
         cargo_manager: CargoManager,
@@ -465,6 +625,20 @@ class TestCargoManagerDelete:
         assert result.scalars().first() is None
 
 
+    async def test_force_delete_respects_owner(
+        self,
+        cargo_manager: CargoManager,
+        fake_driver: FakeDriver,
+    ):
+        """Force delete of another owner's cargo is a NotFoundError and touches nothing."""
+        cargo = await cargo_manager.create(owner="user-a", managed=True)
+
+        with pytest.raises(NotFoundError):
+            await cargo_manager.delete(cargo.id, owner="user-b", force=True)
+
+        assert fake_driver.delete_volume_calls == []
+
+
 class TestCargoManagerDeleteInternal:
     """Unit tests for CargoManager.delete_internal_by_id."""
 
@@ -495,3 +669,101 @@ class TestCargoManagerDeleteInternal:
         result = await db_session.execute(select(Cargo).where(Cargo.id == cargo_id))
         assert result.scalars().first() is None
         assert len(fake_driver.delete_volume_calls) == 1
+
+    @pytest.mark.parametrize("force_delete", [False, True])
+    async def test_volume_delete_runs_outside_write_transaction(
+        self,
+        cargo_manager: CargoManager,
+        fake_driver: FakeDriver,
+        db_session: AsyncSession,
+        force_delete: bool,
+    ):
+        """No DB write transaction is open while the driver deletes the volume."""
+        cargo = await cargo_manager.create(owner="test-user", managed=True)
+        observed: dict[str, bool] = {}
+        delete_volume = fake_driver.delete_volume
+
+        async def observing_delete_volume(name: str) -> None:
+            conn = await db_session.connection()
+            raw = await conn.get_raw_connection()
+            observed["in_transaction"] = raw.driver_connection.in_transaction
+            await delete_volume(name)
+
+        fake_driver.delete_volume = observing_delete_volume
+
+        if force_delete:
+            await cargo_manager.delete(cargo.id, owner="test-user", force=True)
+        else:
+            await cargo_manager.delete_internal_by_id(cargo.id)
+
+        assert observed == {"in_transaction": False}
+        result = await db_session.execute(select(Cargo.id).where(Cargo.id == cargo.id))
+        assert result.scalar_one_or_none() is None
+
+    async def test_delete_internal_preserves_row_when_volume_delete_fails(
+        self,
+        cargo_manager: CargoManager,
+        fake_driver: FakeDriver,
+        db_session: AsyncSession,
+    ):
+        """A failed volume delete preserves the cargo row so GC can retry."""
+        # Arrange
+        cargo = await cargo_manager.create(owner="test-user", managed=True)
+
+        async def failing_delete_volume(name: str) -> None:
+            raise RuntimeError("volume busy")
+
+        fake_driver.delete_volume = failing_delete_volume
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await cargo_manager.delete_internal_by_id(cargo.id)
+        await db_session.commit()
+
+        # Assert
+        result = await db_session.execute(select(Cargo.id).where(Cargo.id == cargo.id))
+        assert result.scalar_one_or_none() == cargo.id
+
+    async def test_delete_internal_bulk_deletes_rows_and_volumes(
+        self,
+        cargo_manager: CargoManager,
+        fake_driver: FakeDriver,
+        db_session: AsyncSession,
+    ):
+        """delete_internal_bulk removes all rows and their volumes, skipping missing IDs."""
+        cargos = [await cargo_manager.create(owner="test-user", managed=True) for _ in range(3)]
+        ids = [c.id for c in cargos]
+
+        outcomes = await cargo_manager.delete_internal_bulk([*ids, "ws-nonexistent"])
+
+        assert outcomes == dict.fromkeys(ids)
+        result = await db_session.execute(select(Cargo.id).where(Cargo.id.in_(ids)))
+        assert result.scalars().all() == []
+        assert len(fake_driver.delete_volume_calls) == 3
+
+    async def test_delete_internal_bulk_keeps_rows_whose_volume_delete_fails(
+        self,
+        cargo_manager: CargoManager,
+        fake_driver: FakeDriver,
+        db_session: AsyncSession,
+    ):
+        """Only the cargo whose volume delete failed keeps its row."""
+        ok = await cargo_manager.create(owner="test-user", managed=True)
+        busy = await cargo_manager.create(owner="test-user", managed=True)
+
+        delete_volume = fake_driver.delete_volume
+
+        async def flaky_delete_volume(name: str) -> None:
+            if name == busy.driver_ref:
+                raise RuntimeError("volume busy")
+            await delete_volume(name)
+
+        fake_driver.delete_volume = flaky_delete_volume
+
+        outcomes = await cargo_manager.delete_internal_bulk([ok.id, busy.id])
+
+        assert outcomes[ok.id] is None
+        assert isinstance(outcomes[busy.id], RuntimeError)
+        result = await db_session.execute(select(Cargo.id).where(Cargo.id.in_([ok.id, busy.id])))
+        assert result.scalars().all() == [busy.id]
+
@@ -15,7 +15,12 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, select
 
 from app.config import ProfileConfig, ResourceSpec, Settings
-from app.errors import SandboxExpiredError, SandboxTTLInfiniteError, ValidationError
+from app.errors import (
+    NotFoundError,
+    SandboxExpiredError,
+    SandboxTTLInfiniteError,
+    ValidationError,
+)
 from app.managers.sandbox import SandboxManager
 from app.models.cargo import Cargo
 from app.models.sandbox import Sandbox, SandboxStatus
@@ -476,6 +481,27 @@ class TestSandboxManagerDelete:
         assert deleted_sandbox.current_session_id is None
 
 
+    async def test_ensure_running_rejects_soft_deleted_sandbox(
+        self,
+        sandbox_manager: SandboxManager,
+        fake_driver: FakeDriver,
+        db_session: AsyncSession,
+    ):
+        """A sandbox soft-deleted under the caller gets no new session."""
+        # Arrange - soft delete committed (as expired-sandbox GC does) before teardown
+        sandbox = await sandbox_manager.create(owner="test-user")
+        sandbox.deleted_at = utcnow()
+        await db_session.commit()
+
+        # Act / Assert
+        with pytest.raises(NotFoundError):
+            await sandbox_manager.ensure_running(sandbox)
+
+        result = await db_session.execute(select(Session).where(Session.sandbox_id == sandbox.id))
+        assert result.scalars().all() == []
+        assert fake_driver.create_calls == []
+
+
 class TestSandboxManagerExtendTTL:
     """Unit-XX: SandboxManager.extend_ttl tests."""
 
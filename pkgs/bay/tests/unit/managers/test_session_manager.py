@@ -9,6 +9,7 @@ and recovery).
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -31,6 +32,12 @@ class StartFailDriver(FakeDriver):
         raise RuntimeError("boom")
 
 
+class HangingStatusDriver(FakeDriver):
+    async def status(self, container_id: str, *, runtime_port: int | None = None) -> ContainerInfo:
+        await asyncio.sleep(3600)
+        raise AssertionError("unreachable")
+
+
 @pytest.fixture
 def fake_settings() -> Settings:
     return Settings(
@@ -436,6 +443,46 @@ class TestSessionManagerHealthProbing:
         # Session should still appear ready (trusted DB state)
         assert result.observed_state == SessionStatus.RUNNING
 
+    async def test_ensure_running_degrades_when_status_probe_hangs(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        db_session: AsyncSession,
+        fake_settings: Settings,
+        profile: ProfileConfig,
+        cargo: Cargo,
+    ):
+        """Verify that a hung driver.status is capped and DB state is trusted."""
+        with patch("app.managers.session.session.get_settings", return_value=fake_settings):
+            driver = HangingStatusDriver()
+            manager = SessionManager(driver=driver, db_session=db_session)
+
+        monkeypatch.setattr("app.managers.session.session.PROBE_STATUS_TIMEOUT_SECONDS", 0.01)
+
+        sandbox = Sandbox(id="sandbox-probe-6", owner="test-user", profile_id=profile.id)
+        db_session.add(sandbox)
+        await db_session.commit()
+
+        session = Session(
+            id="sess-probe-6",
+            sandbox_id=sandbox.id,
+            runtime_type="ship",
+            profile_id=profile.id,
+            desired_state=SessionStatus.RUNNING,
+            observed_state=SessionStatus.RUNNING,
+            container_id="hung-container-1",
+            endpoint="http://fake-host:8123",
+        )
+        db_session.add(session)
+        await db_session.commit()
+
+        result = await manager.ensure_running(session=session, cargo=cargo, profile=profile)
+
+        # Should NOT have destroyed or recreated anything (degrade to trusting DB)
+        assert driver.destroy_calls == []
+        assert len(driver.create_calls) == 0
+        assert result.observed_state == SessionStatus.RUNNING
+        assert result.container_id == "hung-container-1"
+
     async def test_no_probe_when_session_pending(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -477,3 +524,95 @@ class TestSessionManagerHealthProbing:
 
         # Should NOT have called status() because session is PENDING
         assert len(driver.status_calls) == 0
+
+
+class TestSessionManagerRefreshStatus:
+    @pytest.mark.parametrize(
+        ("container_status", "expected_state", "expect_container_id"),
+        [
+            (ContainerStatus.RUNNING, SessionStatus.RUNNING, True),
+            (ContainerStatus.CREATED, SessionStatus.PENDING, True),
+            (ContainerStatus.EXITED, SessionStatus.STOPPED, True),
+            (ContainerStatus.NOT_FOUND, SessionStatus.STOPPED, False),
+            (ContainerStatus.REMOVING, SessionStatus.STARTING, True),
+        ],
+    )
+    async def test_refresh_status_maps_container_status(
+        self,
+        db_session: AsyncSession,
+        fake_settings: Settings,
+        profile: ProfileConfig,
+        container_status: ContainerStatus,
+        expected_state: SessionStatus,
+        expect_container_id: bool,
+    ):
+        with patch("app.managers.session.session.get_settings", return_value=fake_settings):
+            driver = FakeDriver()
+            manager = SessionManager(driver=driver, db_session=db_session)
+
+        sandbox = Sandbox(id="sandbox-refresh-1", owner="test-user", profile_id=profile.id)
+        db_session.add(sandbox)
+        session = Session(
+            id="sess-refresh-1",
+            sandbox_id=sandbox.id,
+            runtime_type="ship",
+            profile_id=profile.id,
+            observed_state=SessionStatus.STARTING,
+            container_id="refresh-container-1",
+        )
+        db_session.add(session)
+        await db_session.commit()
+
+        driver.set_status_override(
+            "refresh-container-1",
+            ContainerInfo(
+                container_id="refresh-container-1",
+                status=container_status,
+                endpoint="http://fake-host:8123",
+            ),
+        )
+
+        result = await manager.refresh_status(session)
+
+        assert result.observed_state == expected_state
+        assert (result.container_id is not None) is expect_container_id
+        assert result.last_observed_at is not None
+        if container_status == ContainerStatus.RUNNING:
+            assert result.endpoint == "http://fake-host:8123"
+        else:
+            assert result.endpoint is None
+
+
+class FailingDestroyDriver(FakeDriver):
+    async def destroy(self, container_id: str) -> None:
+        if container_id == "c-stuck":
+            raise RuntimeError("stuck")
+        await super().destroy(container_id)
+
+
+class TestSessionManagerDestroyMany:
+    async def test_destroy_many_keeps_rows_whose_teardown_failed(
+        self,
+        db_session: AsyncSession,
+        fake_settings: Settings,
+    ) -> None:
+        driver = FailingDestroyDriver()
+        with patch("app.managers.session.session.get_settings", return_value=fake_settings):
+            manager = SessionManager(driver=driver, db_session=db_session)
+
+        sessions = [
+            Session(id="sess-ok", sandbox_id="sbx-1", container_id="c-ok"),
+            Session(id="sess-stuck", sandbox_id="sbx-1", container_id="c-stuck"),
+            Session(id="sess-none", sandbox_id="sbx-1"),
+        ]
+        db_session.add_all(sessions)
+        await db_session.commit()
+
+        errors = await manager.destroy_many(sessions)
+
+        assert errors["sess-ok"] is None
+        assert errors["sess-none"] is None
+        assert str(errors["sess-stuck"]) == "stuck"
+        assert sorted(driver.destroy_calls) == ["c-ok"]
+        remaining = (await db_session.execute(select(Session.id))).scalars().all()
+        assert remaining == ["sess-stuck"]
@@ -8,13 +8,14 @@ in unit tests because FakeDriver does not run a real HTTP server.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import ContainerSpec, ProfileConfig
-from app.managers.session.session import SessionManager
+from app.managers.session.session import SessionManager, _pending_rollbacks
 from app.models.cargo import Cargo
 from app.models.session import Session, SessionStatus
 from tests.fakes import FakeDriver
@@ -65,6 +66,12 @@ def _cargo() -> Cargo:
     )
 
 
+class SlowNetworkRemovalDriver(FakeDriver):
+    async def remove_session_network(self, session_id: str) -> None:
+        await asyncio.sleep(0.05)
+        await super().remove_session_network(session_id)
+
+
 @pytest.fixture
 def driver() -> FakeDriver:
     return FakeDriver()
@@ -216,8 +223,39 @@ class TestMultiContainerEnsureRunning:
         assert session.endpoint is None
         assert session.containers is None
 
-        # Network should have been removed
+        # Rollback runs in the background; network should be removed once it finishes
+        await asyncio.gather(*_pending_rollbacks.values())
+        assert len(driver.remove_network_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_multi_container_retry_waits_for_background_rollback(
+        self, db_session: AsyncSession, cargo: Cargo
+    ):
+        """A retry must not race the previous attempt's network teardown."""
+        from app.managers.session import SessionManager
+
+        driver = SlowNetworkRemovalDriver()
+        mgr = SessionManager(driver, db_session)
+        profile = _multi_profile()
+
+        db_session.add(cargo)
+        await db_session.commit()
+
+        driver.set_create_multi_fail_on("gull")
+        session = await mgr.create("sandbox-1", cargo, profile)
+
+        with pytest.raises(RuntimeError, match="Fake: create_multi failed"):
+            await mgr.ensure_running(session, cargo, profile)
+
+        # Retry immediately, before the background rollback had a chance to run.
+        driver.set_create_multi_fail_on(None)
+        session = await mgr.ensure_running(session, cargo, profile)
+
+        assert session.observed_state == SessionStatus.RUNNING
+        assert len(driver.create_network_calls) == 2
         assert len(driver.remove_network_calls) == 1
+        # The new network must survive the old rollback.
+        assert session.id in driver._networks
 
     @pytest.mark.asyncio
     async def test_multi_container_recovers_when_runtime_group_was_deleted(
@@ -0,0 +1,37 @@
+"""Unit tests for sandbox-level in-memory locks."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.concurrency.locks import (
+    cleanup_deleted_sandbox_locks,
+    cleanup_sandbox_lock,
+    get_lock_count,
+    get_sandbox_lock,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_lock():
+    locks = await asyncio.gather(*(get_sandbox_lock("sbx-shared") for _ in range(20)))
+
+    assert all(lock is locks[0] for lock in locks)
+    await cleanup_sandbox_lock("sbx-shared")
+
+
+@pytest.mark.asyncio
+async def test_cleanup_drops_locks():
+    before = get_lock_count()
+    first = await get_sandbox_lock("sbx-a")
+    await get_sandbox_lock("sbx-b")
+    await get_sandbox_lock("sbx-c")
+
+    await cleanup_sandbox_lock("sbx-a")
+    await cleanup_deleted_sandbox_locks({"sbx-b", "sbx-c"})
+
+    assert get_lock_count() == before
+    assert await get_sandbox_lock("sbx-a") is not first
+    await cleanup_sandbox_lock("sbx-a")
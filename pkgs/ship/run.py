@@ -4,5 +4,12 @@ import uvicorn
 
 if __name__ == "__main__":
     uvicorn.run(
-        "app.main:app", host="0.0.0.0", port=8123, reload=False, log_level="info"
+        "app.main:app",
+        host="0.0.0.0",
+        port=8123,
+        reload=False,
+        log_level="info",
+        # Outlive Bay's pooled-connection keepalive_expiry (30s) so Bay, not
+        # Ship, closes idle connections; uvicorn's default is 5s.
+        timeout_keep_alive=75,
     )